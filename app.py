@@ -15,13 +15,23 @@ from functions.Import import Import
 from functions.initial import initial
 from utils.encryption import get_cipher_suite
 from data.config import SALT_PATH, CIPHER_SUITE, BALANCE
-from data.models import ProgramActions, Settings, Networks, Wei
+from data.models import ProgramActions, Settings, Networks, Wei, Tokens
 
 from utils.user_menu import get_action
-from utils.db_api.database import get_wallets, db
+from utils.db_api.database import get_wallets, get_tokens, save_token, db
 from utils.db_api.models import Wallet
 from utils.adjust_policy import set_windows_event_loop_policy
 from libs.py_eth_async.client import Client
+from libs.py_eth_async.sessions import Sessions
+from libs.py_eth_async.nonce_manager import NonceManager
+from libs.py_eth_async.abi_cache import AbiCache
+from libs.py_eth_async.signatures import SignatureDB
+from libs.py_eth_async.token_metadata import TokenMetadata, TokenMetadataCache
+from libs.py_eth_async.fee_bumper import FeeBumper
+from libs.py_eth_async.providers import PooledHTTPProvider
+from libs.pretty_utils.miscellaneous.rate_limiter import RateLimiter
+from utils.miscellaneous.pipeline import Pipeline
+from utils.miscellaneous.limiters import Limits
 
 
 def check_encrypt_param(settings):
@@ -66,9 +76,58 @@ async def start_script():
         logger.error('Вы не добавили кошельки в бд!')
         return
 
-    await asyncio.wait([
-        asyncio.create_task(initial())
-    ])
+    settings = Settings()
+    Sessions.configure(
+        limit=settings.rpc_connections.limit,
+        limit_per_host=settings.rpc_connections.limit_per_host,
+        keepalive_timeout=settings.rpc_connections.keepalive_timeout
+    )
+    NonceManager.configure(state_file=config.NONCES_FILE)
+    AbiCache.configure(directory=config.ABI_CACHE_DIR)
+    SignatureDB.configure(path=config.SIGNATURES_DB)
+    TokenMetadataCache.configure(
+        tokens=[
+            TokenMetadata(chain_id=None, address=token.address, decimals=token.decimals, symbol=token.title)
+            for token in Tokens.get_token_list()
+        ] + get_tokens(),
+        on_save=save_token
+    )
+    PooledHTTPProvider.broadcast = settings.broadcast_transactions
+    FeeBumper.configure(
+        enabled=settings.fee_bumping.enabled,
+        interval=settings.fee_bumping.interval,
+        multiplier=settings.fee_bumping.multiplier,
+        max_bumps=settings.fee_bumping.max_bumps,
+        max_fee_multiplier=settings.fee_bumping.max_fee_multiplier
+    )
+    RateLimiter.configure(
+        default_rate=settings.rate_limits.default_rate,
+        default_capacity=settings.rate_limits.default_capacity,
+        hosts=settings.rate_limits.hosts
+    )
+    Pipeline.configure(limits=settings.stage_limits)
+    Limits.configure(
+        total=settings.concurrency_limits.total,
+        per_proxy=settings.concurrency_limits.per_proxy,
+        per_chain=settings.concurrency_limits.per_chain,
+        chains=settings.concurrency_limits.chains,
+        per_rpc_host=settings.concurrency_limits.per_rpc_host,
+        rpc_hosts=settings.concurrency_limits.rpc_hosts
+    )
+    try:
+        await asyncio.wait([
+            asyncio.create_task(initial())
+        ])
+
+    finally:
+        for host, stats in RateLimiter.stats().items():
+            logger.info(
+                f'{host}: {stats["requests"]} requests, waited in queue {stats["avg_wait"]} sec on average, '
+                f'{stats["max_wait"]} sec at most'
+            )
+
+        NonceManager.flush()
+        await Sessions.close_all()
 
 
 async def get_balance(client):
@@ -82,7 +141,7 @@ async def get_balance(client):
 async def check_wallet_balance(wallet, networks, balances_dict):
     wallet_balances = {}
     for network in networks:
-        client = Client(private_key=wallet.private_key, network=network, proxy=wallet.proxy)
+        client = Client.for_wallet(wallet=wallet, network=network)
         balance = await get_balance(client)
         wallet_balances[network.name] = float(balance.Ether)
     balances_dict[wallet.address] = wallet_balances
@@ -43,6 +43,9 @@ IMPORT_FILE = os.path.join(FILES_DIR, 'import.xlsx')
 PROXIES_FILE = os.path.join(FILES_DIR, 'proxies.txt')
 SETTINGS_FILE = os.path.join(FILES_DIR, 'settings.json')
 BALANCE = os.path.join(FILES_DIR, 'eth_balance_result.json')
+NONCES_FILE = os.path.join(FILES_DIR, 'nonces.json')
+ABI_CACHE_DIR = os.path.join(FILES_DIR, 'abi_cache')
+SIGNATURES_DB = os.path.join(FILES_DIR, 'signatures.db')
 
 
 CIPHER_SUITE = []
@@ -50,5 +53,4 @@ CIPHER_SUITE = []
 # logger.remove()
 logger.add(f'{FILES_DIR}/debug.log', format='{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}', level='DEBUG')
 
-semaphore = asyncio.Semaphore(100)
 lock = asyncio.Lock()
\ No newline at end of file
@@ -2,7 +2,7 @@ import random
 import inspect
 
 from dataclasses import dataclass
-from typing import Union, Optional
+from typing import Union, Optional, Dict
 from decimal import Decimal
 from eth_utils import to_wei, from_wei
 
@@ -68,6 +68,35 @@ class BinaceModel:
     credentials: BinanceCredentials
 
 
+class RPCConnectionsModel:
+    limit: int
+    limit_per_host: int
+    keepalive_timeout: float
+
+
+class RateLimitsModel:
+    default_rate: float
+    default_capacity: float
+    hosts: dict
+
+
+class ConcurrencyLimitsModel:
+    total: int
+    per_proxy: int
+    per_chain: int
+    chains: dict
+    per_rpc_host: int
+    rpc_hosts: dict
+
+
+class FeeBumpingModel:
+    enabled: bool
+    interval: float
+    multiplier: float
+    max_bumps: int
+    max_fee_multiplier: float
+
+
 class WorkStatuses:
     NotStarted = 'not started'
     Withdrawn = 'withdrawn'
@@ -114,6 +143,9 @@ class Settings(Singleton, AutoRepr):
         json = read_json(path=SETTINGS_FILE)
         self.use_private_key_encryption = json['use_private_key_encryption']
         self.maximum_gas_price: GWei = GWei(json['maximum_gas_price'])
+        self.maximum_gas_prices: Dict[str, GWei] = {
+            chain: GWei(gas_price) for chain, gas_price in json['maximum_gas_prices'].items()
+        }
         self.oklink_api_key = json['oklink_api_key']
         self.okx = OkxModel()
         self.okx.withdraw_amount = FromTo(
@@ -144,11 +176,41 @@ class Settings(Singleton, AutoRepr):
         self.chains_min_balances = json['chains_min_balances']
         self.withdrawal_networks = json['withdrawal_networks']
         self.withdrawal_amounts = json['withdrawal_amounts']
+        self.rpc_connections = RPCConnectionsModel()
+        self.rpc_connections.limit = json['rpc_connections']['limit']
+        self.rpc_connections.limit_per_host = json['rpc_connections']['limit_per_host']
+        self.rpc_connections.keepalive_timeout = json['rpc_connections']['keepalive_timeout']
+        self.broadcast_transactions: bool = json['broadcast_transactions']
+        self.fee_bumping = FeeBumpingModel()
+        self.fee_bumping.enabled = json['fee_bumping']['enabled']
+        self.fee_bumping.interval = json['fee_bumping']['interval']
+        self.fee_bumping.multiplier = json['fee_bumping']['multiplier']
+        self.fee_bumping.max_bumps = json['fee_bumping']['max_bumps']
+        self.fee_bumping.max_fee_multiplier = json['fee_bumping']['max_fee_multiplier']
+        self.rate_limits = RateLimitsModel()
+        self.rate_limits.default_rate = json['rate_limits']['default_rate']
+        self.rate_limits.default_capacity = json['rate_limits']['default_capacity']
+        self.rate_limits.hosts = {
+            host: (limits['rate'], limits['capacity']) for host, limits in json['rate_limits']['hosts'].items()
+        }
+        self.workers: int = json['workers']
+        self.stage_limits: dict = json['stage_limits']
+        self.concurrency_limits = ConcurrencyLimitsModel()
+        self.concurrency_limits.total = json['concurrency_limits']['total']
+        self.concurrency_limits.per_proxy = json['concurrency_limits']['per_proxy']
+        self.concurrency_limits.per_chain = json['concurrency_limits']['per_chain']
+        self.concurrency_limits.chains = json['concurrency_limits']['chains']
+        self.concurrency_limits.per_rpc_host = json['concurrency_limits']['per_rpc_host']
+        self.concurrency_limits.rpc_hosts = json['concurrency_limits']['rpc_hosts']
 
 
 
 settings = Settings()
 
+MERKLY_FT_ABI = read_json(path=(ABIS_DIR, 'merkly_ft.json'))
+MERKLY_NFT_ABI = read_json(path=(ABIS_DIR, 'merkly_nft.json'))
+
+
 class Routers(Singleton):
     """
     An instance with router contracts
@@ -159,70 +221,70 @@ class Routers(Singleton):
     # hFT
     MERKLY_POLYGON_hFT = BaseContract(
         title='MINT_CONTRACT', address='0x574E69C50e7D13B3d1B364BF0D48285A5aE2dF56',
-        abi=read_json(path=(ABIS_DIR, 'merkly_ft.json'))
+        abi=MERKLY_FT_ABI
     )
     MERKLY_BASE_hFT = BaseContract(
         title='MINT_CONTRACT', address='0x5454cF5584939f7f884e95DBA33FECd6D40B8fE2',
-        abi=read_json(path=(ABIS_DIR, 'merkly_ft.json'))
+        abi=MERKLY_FT_ABI
     )
     MERKLY_SCROLL_hFT = BaseContract(
         title='MINT_CONTRACT', address='0x904550e0D182cd4aEe0D305891c666a212EC8F01',
-        abi=read_json(path=(ABIS_DIR, 'merkly_ft.json'))
+        abi=MERKLY_FT_ABI
     )
     MERKLY_OPTIMISM_hFT = BaseContract(
         title='MINT_CONTRACT', address='0x32F05f390217990404392a4DdAF39D31Db4aFf77',
-        abi=read_json(path=(ABIS_DIR, 'merkly_ft.json'))
+        abi=MERKLY_FT_ABI
     )
     MERKLY_MOONBEAM_hFT = BaseContract(
         title='MINT_CONTRACT', address='0xf3D41b377c93fA5C3b0071966f1811c5063fAD40',
-        abi=read_json(path=(ABIS_DIR, 'merkly_ft.json'))
+        abi=MERKLY_FT_ABI
     )
     MERKLY_CELO_hFT = BaseContract(
         title='MINT_CONTRACT', address='0xad8676147360dBc010504aB69C7f1b1877109527',
-        abi=read_json(path=(ABIS_DIR, 'merkly_ft.json'))
+        abi=MERKLY_FT_ABI
     )
     MERKLY_ARBITRUM_hFT = BaseContract(
         title='MINT_CONTRACT', address='0xFD34afDFbaC1E47aFC539235420e4bE4A206f26D',
-        abi=read_json(path=(ABIS_DIR, 'merkly_ft.json'))
+        abi=MERKLY_FT_ABI
     )
     MERKLY_BSC_hFT = BaseContract(
         title='MINT_CONTRACT', address='0x7b4f475d32f9c65de1834A578859F9823bE3c5Cf',
-        abi=read_json(path=(ABIS_DIR, 'merkly_ft.json'))
+        abi=MERKLY_FT_ABI
     )
 
 
     # hNFT
     MERKLY_POLYGON_hNFT = BaseContract(
         title='MINT_CONTRACT', address='0x7daC480d20f322D2ef108A59A465CCb5749371c4',
-        abi=read_json(path=(ABIS_DIR, 'merkly_nft.json'))
+        abi=MERKLY_NFT_ABI
     )
     MERKLY_BASE_hNFT = BaseContract(
         title='MINT_CONTRACT', address='0x7dac480d20f322d2ef108a59a465ccb5749371c4',
-        abi=read_json(path=(ABIS_DIR, 'merkly_nft.json'))
+        abi=MERKLY_NFT_ABI
     )
     MERKLY_SCROLL_hNFT = BaseContract(
         title='MINT_CONTRACT', address='0x7daC480d20f322D2ef108A59A465CCb5749371c4',
-        abi=read_json(path=(ABIS_DIR, 'merkly_nft.json'))
+        abi=MERKLY_NFT_ABI
     )
     MERKLY_OPTIMISM_hNFT = BaseContract(
         title='MINT_CONTRACT', address='0x2a5c54c625220cb2166C94DD9329be1F8785977D',
-        abi=read_json(path=(ABIS_DIR, 'merkly_nft.json'))
+        abi=MERKLY_NFT_ABI
     )
     MERKLY_MOONBEAM_hNFT = BaseContract(
         title='MINT_CONTRACT', address='0x7daC480d20f322D2ef108A59A465CCb5749371c4',
-        abi=read_json(path=(ABIS_DIR, 'merkly_nft.json'))
+        abi=MERKLY_NFT_ABI
     )
     MERKLY_CELO_hNFT = BaseContract(
         title='MINT_CONTRACT', address='0x7f4CFDf669d7a5d4Adb05917081634875E21Df47',
-        abi=read_json(path=(ABIS_DIR, 'merkly_nft.json'))
+        abi=MERKLY_NFT_ABI
     )
     MERKLY_ARBITRUM_hNFT = BaseContract(
         title='MINT_CONTRACT', address='0x7daC480d20f322D2ef108A59A465CCb5749371c4',
-        abi=read_json(path=(ABIS_DIR, 'merkly_nft.json'))
+        abi=MERKLY_NFT_ABI
     )
     MERKLY_BSC_hNFT = BaseContract(
         title='MINT_CONTRACT', address='0xf3D41b377c93fA5C3b0071966f1811c5063fAD40',
-        abi=read_json(path=(ABIS_DIR, 'merkly_nft.json'))
+        abi=MERKLY_NFT_ABI
     )
 
 
@@ -3,9 +3,10 @@ import random
 import asyncio
 import traceback
 import ccxt
-from typing import List
+from typing import List, Dict, Tuple, Set, Callable, Optional
 
 from libs.py_eth_async.client import Client
+from libs.py_eth_async.fee_oracle import FeeOracle
 from libs.pretty_utils.miscellaneous.time_and_date import unix_to_strtime
 
 from data import config
@@ -14,11 +15,25 @@ from utils.db_api.database import db
 from utils.db_api.models import Wallet
 from tasks.controller import Controller
 from utils.encryption import get_private_key
-from utils.miscellaneous.postpone import postpone
+from utils.miscellaneous.scheduler import Scheduler
+from utils.miscellaneous.limiters import Limits
 from functions.select_random_action import select_random_action
 
-from libs.py_eth_async.data.models import Networks
-from data.config import logger, semaphore, lock
+from libs.py_eth_async.data.models import Networks, Network, GWei
+from data.config import logger, lock
+
+LOOKAHEAD = 60
+# Wallets due sooner aren't prepared in advance, the preparation wouldn't finish in time anyway
+PREPARE_MARGIN = 5
+PREPARED_TTL = 10 * 60
+prepared_actions: Dict[int, Tuple[Callable, float]] = {}
+preparing: Dict[int, asyncio.Task] = {}
+# Preparations that wait for a free preparation slot and haven't done any work yet
+waiting_preparations: Set[int] = set()
+queued: Set[int] = set()
+gas_message_times: Dict[str, float] = {}
+running: Set[asyncio.Task] = set()
+
 
 async def update_expired() -> None:
     now = int(time.time())
@@ -55,7 +70,7 @@ async def get_chain_with_balance(wallet: Wallet) -> List[Networks]:
     min_balances = settings.chains_min_balances
 
     for chain in chains:
-        client = Client(private_key=get_private_key(wallet.private_key), network=chain, proxy=wallet.proxy)
+        client = Client.for_wallet(wallet=wallet, network=chain)
         balance = await client.wallet.balance()
         if balance.Ether > min_balances[chain.name]:
             chains_with_suff_balance.append(chain)
@@ -149,131 +164,302 @@ async def withdraw(wallet: Wallet):
     db.commit()
 
 
-async def start_task(wallet):
-    async with semaphore:
-        now = int(time.time())
-        settings = Settings()
+def get_maximum_gas_price(chain: Network) -> GWei:
+    settings = Settings()
+    return settings.maximum_gas_prices.get(chain.name, settings.maximum_gas_price)
 
-        chain_with_balance = await get_chain_with_balance(wallet)
-        if not chain_with_balance:
-            await withdraw(wallet)
-            wallet.next_initial_action_time = now + random.randint(
-                int(settings.initial_actions_delay.from_ / 6), int(settings.initial_actions_delay.to_ / 3)
+
+async def filter_by_gas_price(chains: List[Network]) -> List[Network]:
+    # Fee snapshots are cached per chain, so checking it for every wallet doesn't send extra requests
+    snapshots = await asyncio.gather(
+        *(FeeOracle.for_network(network=chain).get() for chain in chains), return_exceptions=True
+    )
+    now = time.time()
+    acceptable_chains = []
+    for chain, snapshot in zip(chains, snapshots):
+        if isinstance(snapshot, BaseException):
+            logger.warning(f'Failed to get the gas price on {chain.name}: {snapshot}')
+            continue
+
+        maximum_gas_price = get_maximum_gas_price(chain)
+        if snapshot.gas_price.Wei <= maximum_gas_price.Wei:
+            acceptable_chains.append(chain)
+
+        elif gas_message_times.get(chain.name, 0) <= now:
+            gas_message_times[chain.name] = now + 30 * 60
+            logger.info(
+                f'Current gas price is too high on {chain.name}: {snapshot.gas_price.GWei} > '
+                f'{maximum_gas_price.GWei}!'
             )
-            # logger.warning('Insufficient balance! Not chain with native balance, will try again a bit later')  # Mb прикрутить тут мост
-            async with lock:
-                db.commit()
-            return
 
-        sender_chain = random.choice(chain_with_balance)
-        client = Client(
-            private_key=get_private_key(wallet.private_key),
-            network=sender_chain,
-            proxy=wallet.proxy
-        )
+    return acceptable_chains
 
-        controller = Controller(client=client)
-        action = await select_random_action(controller=controller, wallet=wallet, initial=True)
 
-        if action is None:
-            wallet.next_initial_action_time = now + random.randint(
-                int(settings.initial_actions_delay.from_),
-                int(settings.initial_actions_delay.to_)
-            )
-            async with lock:
-                db.commit()
+def discard_prepared_action(action: Callable) -> None:
+    task = action.func.__self__
+    if task.prepared_tx:
+        task.client.transactions.discard_prepared(prepared_tx=task.prepared_tx)
+        task.prepared_tx = None
+
+
+async def prepare_task(scheduler: Scheduler, wallet: Wallet, slots: asyncio.Semaphore) -> None:
+    action = None
+    try:
+        # Preparations are limited like the due actions, so a burst of upcoming wallets can't bypass the limits
+        async with slots:
+            waiting_preparations.discard(wallet.id)
+            async with Limits.acquire(proxy=wallet.proxy):
+                chain_with_balance = await filter_by_gas_price(await get_chain_with_balance(wallet))
+
+            if not chain_with_balance:
+                return
+
+            client = Client.for_wallet(wallet=wallet, network=random.choice(chain_with_balance))
+            async with Limits.acquire(proxy=wallet.proxy, network=client.network):
+                action = await select_random_action(controller=Controller(client=client), wallet=wallet, initial=True)
+                if not callable(action):
+                    return
+
+                await action.func.__self__.prepare()
+
+        taken = wallet.id not in scheduler.wallets and wallet.id not in queued
+        if taken and preparing.get(wallet.id) is asyncio.current_task():
+            # Neither the scheduler nor a worker will use the action ('start_task' waits for the preparation), so the
+            # reserved nonce is returned instead of being kept until the next action time
+            discard_prepared_action(action)
             return
 
-        if action == 'No chains with balance':  # TODO okx withdraw function on random chain
-            wallet.status = WorkStatuses.NotStarted
-            wallet.next_activity_action_time = now + random.randint(
-                settings.initial_actions_delay.from_, settings.initial_actions_delay.to_
-            )
+        prepared_actions[wallet.id] = (action, time.time())
+        logger.info(f'{wallet.address} | the next action was prepared on {client.network.name}')
+
+    except asyncio.CancelledError:
+        if callable(action):
+            discard_prepared_action(action)
+
+        raise
+
+    except Exception as e:
+        logger.warning(f'{wallet.address} | failed to prepare the next action: {e}')
+
+    finally:
+        waiting_preparations.discard(wallet.id)
+        if preparing.get(wallet.id) is asyncio.current_task():
+            preparing.pop(wallet.id)
+
+
+def prepare_upcoming(scheduler: Scheduler, slots: asyncio.Semaphore, now: int) -> None:
+    for wallet in scheduler.upcoming(until=now + LOOKAHEAD):
+        if (
+                wallet.id in prepared_actions or wallet.id in preparing
+                or wallet.next_initial_action_time <= now + PREPARE_MARGIN
+        ):
+            continue
+
+        waiting_preparations.add(wallet.id)
+        preparing[wallet.id] = asyncio.create_task(prepare_task(scheduler=scheduler, wallet=wallet, slots=slots))
+
+
+def pop_prepared_action(wallet: Wallet):
+    action, prepared_at = prepared_actions.pop(wallet.id, (None, 0))
+    if action and time.time() - prepared_at > PREPARED_TTL:
+        discard_prepared_action(action)
+        return None
+
+    return action
+
+
+async def start_task(wallet: Wallet) -> Optional[Callable]:
+    queued.discard(wallet.id)
+    preparation = preparing.pop(wallet.id, None)
+    if preparation:
+        if wallet.id in waiting_preparations:
+            # It hasn't started yet, so the action is prepared below instead of waiting for a preparation slot
+            waiting_preparations.discard(wallet.id)
+            preparation.cancel()
 
         else:
-            status = await action()
-            now = int(time.time())
-            if 'Failed' not in status:
+            # The wallet became due while its action was being prepared, wait for it instead of preparing another one
+            # with the next nonce. No slot is held meanwhile, the preparation may be waiting for the same limits
+            await asyncio.wait([preparation])
+
+    async with Limits.acquire(proxy=wallet.proxy):
+        now = int(time.time())
+        settings = Settings()
+
+        action = pop_prepared_action(wallet)
+        if action and not await filter_by_gas_price([action.func.__self__.client.network]):
+            discard_prepared_action(action)
+            action = None
+
+        if not action:
+            chain_with_balance = await get_chain_with_balance(wallet)
+            if not chain_with_balance:
+                await withdraw(wallet)
                 wallet.next_initial_action_time = now + random.randint(
-                    settings.initial_actions_delay.from_, settings.initial_actions_delay.to_
+                    int(settings.initial_actions_delay.from_ / 6), int(settings.initial_actions_delay.to_ / 3)
                 )
-                logger.success(status)
-                # print_color = color
-            else:
-                wallet.next_initial_action_time = now + random.randint(5 * 60, 10 * 60)
-                # print_color = config.RED
-                logger.error(status)
-            # await print_to_log(text=status, color=print_color, thread=thread, wallet=wallet)
+                # logger.warning('Insufficient balance! Not chain with native balance, will try again a bit later')  # Mb прикрутить тут мост
+                async with lock:
+                    db.commit()
+                return None
+
+            chain_with_balance = await filter_by_gas_price(chain_with_balance)
+            if not chain_with_balance:
+                # Only this wallet is deferred, others may have a balance in chains with an acceptable gas price
+                wallet.next_initial_action_time = now + random.randint(
+                    0, int(settings.initial_actions_delay.to_ / 2)
+                )
+                logger.info(
+                    f'{wallet.address} | gas price is too high in all chains with balance, the action is deferred to '
+                    f'{unix_to_strtime(wallet.next_initial_action_time)}'
+                )
+                async with lock:
+                    db.commit()
+                return None
+
+            sender_chain = random.choice(chain_with_balance)
+
+    if not action:
+        # The slots are released and taken again with the chain ones, so a wallet queued for a busy chain doesn't hold
+        # a global or proxy slot that wallets of other chains could use
+        client = Client.for_wallet(wallet=wallet, network=sender_chain)
+        async with Limits.acquire(proxy=wallet.proxy, network=client.network):
+            controller = Controller(client=client)
+            action = await select_random_action(controller=controller, wallet=wallet, initial=True)
+            if callable(action):
+                await action.func.__self__.prepare()
+
+    if action is None:
+        wallet.next_initial_action_time = now + random.randint(
+            int(settings.initial_actions_delay.from_),
+            int(settings.initial_actions_delay.to_)
+        )
+        async with lock:
+            db.commit()
+        return None
 
+    if action == 'No chains with balance':  # TODO okx withdraw function on random chain
+        wallet.status = WorkStatuses.NotStarted
+        wallet.next_activity_action_time = now + random.randint(
+            settings.initial_actions_delay.from_, settings.initial_actions_delay.to_
+        )
         async with lock:
             db.commit()
+        return None
 
+    return action
 
-async def initial() -> None:
-    delay = 10
-    await update_expired()
-    next_message_time = 0
+
+async def finish_task(wallet: Wallet, action: Callable) -> None:
+    settings = Settings()
+    status = await action()
+    now = int(time.time())
+    if 'Failed' not in status:
+        wallet.next_initial_action_time = now + random.randint(
+            settings.initial_actions_delay.from_, settings.initial_actions_delay.to_
+        )
+        logger.success(status)
+        # print_color = color
+    else:
+        wallet.next_initial_action_time = now + random.randint(5 * 60, 10 * 60)
+        # print_color = config.RED
+        logger.error(status)
+    # await print_to_log(text=status, color=print_color, thread=thread, wallet=wallet)
+
+    async with lock:
+        db.commit()
+
+
+async def reschedule(scheduler: Scheduler, wallet: Wallet) -> None:
+    leftover, _ = prepared_actions.pop(wallet.id, (None, 0))
+    if leftover:
+        # E.g. the action was deferred, its nonce mustn't stay reserved until the next action time
+        discard_prepared_action(leftover)
+
+    now = int(time.time())
+    if wallet.status == WorkStatuses.Initial and wallet.next_initial_action_time <= now:
+        # The action failed before it set the next time
+        wallet.next_initial_action_time = now + random.randint(5 * 60, 10 * 60)
+
+    # Changed times are committed by the main loop once per iteration
+    scheduler.reschedule(wallet)
+    log_next_action_time(scheduler)
+
+
+async def run_action(scheduler: Scheduler, wallet: Wallet, action: Callable) -> None:
     try:
-        next_action_time = min((wallet.next_initial_action_time for wallet in db.all(
-            Wallet, Wallet.status.is_(WorkStatuses.Initial)
-        )))
+        await finish_task(wallet=wallet, action=action)
+
+    except Exception as e:
+        logger.error(f'{wallet.address} | the action failed: {e}')
+
+    finally:
+        await reschedule(scheduler=scheduler, wallet=wallet)
+
+
+async def worker(scheduler: Scheduler, queue: asyncio.Queue) -> None:
+    while True:
+        wallet: Wallet = await queue.get()
+        action = None
+        try:
+            action = await start_task(wallet)
+            if action:
+                # The worker only selects and prepares the action, its stages take slots of their own limits and
+                # waiting for receipts and cooldowns between them takes no slot at all
+                task = asyncio.create_task(run_action(scheduler=scheduler, wallet=wallet, action=action))
+                running.add(task)
+                task.add_done_callback(running.discard)
+
+        except Exception as e:
+            logger.error(f'{wallet.address} | the action failed: {e}')
+
+        finally:
+            queue.task_done()
+            if not action:
+                await reschedule(scheduler=scheduler, wallet=wallet)
+
+
+def log_next_action_time(scheduler: Scheduler) -> None:
+    next_action_time = scheduler.next_due_time()
+    if next_action_time:
         logger.info(f'The next closest action will be performed at {unix_to_strtime(next_action_time)}.')
         # await print_to_log(
         #     text=f'The next closest action will be performed at {unix_to_strtime(next_action_time)}.',
         #     color=color, thread=thread
         # )
-    except:
-        pass
+
+
+async def initial() -> None:
+    delay = 10
+    await update_expired()
+    scheduler = Scheduler.load()
+    queue = asyncio.Queue()
+    workers = [
+        asyncio.create_task(worker(scheduler=scheduler, queue=queue)) for _ in range(max(Settings().workers, 1))
+    ]
+    preparation_slots = asyncio.Semaphore(max(Settings().workers, 1))
+    log_next_action_time(scheduler)
 
     while True:
         try:
+            # Wake up at least every half of the look-ahead window to prepare upcoming actions
+            wallets = await scheduler.wait_due(max_wait=LOOKAHEAD / 2)
+            async with lock:
+                scheduler.sync()
+
             now = int(time.time())
-            wallets: Wallet = db.all(
-                Wallet, Wallet.status.is_(WorkStatuses.Initial) & (Wallet.next_initial_action_time <= now)
-            )
+            prepare_upcoming(scheduler=scheduler, slots=preparation_slots, now=now)
 
-            if wallets:
-                settings = Settings()
-                client = Client(private_key='', network=Networks.Ethereum)
-                gas_price = await client.transactions.gas_price(w3=client.w3)
-                if float(gas_price.GWei) > settings.maximum_gas_price:
-                    await postpone(seconds=int(delay / 2))
-                    if next_message_time <= time.time():
-                        next_message_time = now + 30 * 60
-                        logger.info(
-                            f'Current gas price is too high: {gas_price.GWei} > {settings.maximum_gas_price.GWei}!')
-                        # await print_to_log(
-                        #     text=f'Current gas price is too high: {gas_price.GWei} > {settings.maximum_gas_price.GWei}!',
-                        #     color=color, thread=thread
-                        # )
-                    continue
-
-                task = []
-                for wallet in wallets:
-                    task.append(asyncio.create_task(start_task(wallet)))
-
-                await asyncio.gather(*task)
-
-                try:
-                    next_action_time = min((wallet.next_initial_action_time for wallet in db.all(
-                        Wallet, Wallet.status.is_(WorkStatuses.Initial)
-                    )))
-                    logger.info(f'The next closest action will be performed at {unix_to_strtime(next_action_time)}.')
-                    # await print_to_log(
-                    #     text=f'The next closest action will be performed at {unix_to_strtime(next_action_time)}.',
-                    #     color=color, thread=thread
-                    # )
-
-                except:
-                    pass
+            # The gas price is checked by workers on the source chain of each wallet
+            for wallet in wallets:
+                queued.add(wallet.id)
+                queue.put_nowait(wallet)
 
         except BaseException as e:
             logger.error('initial')
             print(traceback.print_exc())
             logger.error(f'Something went wrong: {e}')
             # await print_to_log(text=f'Something went wrong: {e}', color=config.RED, thread=thread)
-
-        finally:
             await asyncio.sleep(delay)
 
 
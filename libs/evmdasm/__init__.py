@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 # Author : <github.com/tintinweb>
 from .instructions import Instruction
-from .disassembler import EvmBytecode, EvmInstructions, EvmDisassembler, EvmProgram
+from .disassembler import EvmBytecode, EvmInstructions, EvmCompactInstructions, EvmDisassembler, EvmProgram
+from .scanner import find_selectors
 
 
-__ALL__ = ["Instruction", "EvbBytecode", "EvmInstructions", "EvmDisassembler", "EvmProgram"]
+__ALL__ = ["Instruction", "EvbBytecode", "EvmInstructions", "EvmCompactInstructions", "EvmDisassembler", "EvmProgram", "find_selectors"]
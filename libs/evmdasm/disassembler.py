@@ -2,10 +2,15 @@
 # -*- coding: utf-8 -*-
 # Author : <github.com/tintinweb>
 import logging
+import re
+from array import array
 from . import registry, utils
+from .scanner import INSTRUCTION_SIZES, as_bytes
 
 logger = logging.getLogger(__name__)
 
+OPERAND_LENGTHS = bytes(size - 1 for size in INSTRUCTION_SIZES)
+
 
 class EvmDisassembler(object):
 
@@ -19,17 +24,19 @@ class EvmDisassembler(object):
 
         pc = 0
         previous = None
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         if not isinstance(bytecode, EvmBytecode):
             # normalize input
-            evmbytecode = EvmBytecode(bytecode)
+            bytecode = EvmBytecode(bytecode)
 
-        iter_bytecode = iter(evmbytecode.as_bytes)
+        iter_bytecode = iter(bytecode.as_bytes)
 
         # disassemble
         seen_stop = False
         for opcode in iter_bytecode:
-            logger.debug(opcode)
+            if debug:
+                logger.debug(opcode)
             try:
                 instruction = self._registry.by_opcode[opcode].consume(iter_bytecode)
                 if not len(instruction.operand_bytes)==instruction.length_of_operand:
@@ -62,9 +69,40 @@ class EvmDisassembler(object):
             # current is previous
             previous = instruction
 
-            logger.debug("%s: %s %s" % (hex(instruction.address), instruction.name, instruction.operand))
+            if debug:
+                logger.debug("%s: %s %s" % (hex(instruction.address), instruction.name, instruction.operand))
             yield instruction
 
+    def disassemble_compact(self, bytecode):
+        """ Disassemble evm bytecode to parallel arrays, see EvmCompactInstructions """
+        code = bytes(bytecode.as_bytes if isinstance(bytecode, EvmBytecode) else as_bytes(bytecode))
+        n = len(code)
+        sizes = INSTRUCTION_SIZES
+        by_opcode = self._registry.by_opcode
+
+        opcodes, pcs = array('B'), array('I')
+        append_opcode, append_pc = opcodes.append, pcs.append
+        seen_stop = False
+        pc = 0
+        while pc < n:
+            opcode = code[pc]
+            append_opcode(opcode)
+            append_pc(pc)
+            if opcode not in by_opcode and not seen_stop:
+                # same message as the classic mode, including the KeyError of the registry lookup
+                msg = "error: byte at address %d (%s) is not a valid operator" % (pc, hex(opcode))
+                self.errors.append("%s; %r" % (msg, KeyError(opcode)))
+            elif opcode == 0x00:
+                seen_stop = True
+            pc += sizes[opcode]
+
+        # PUSHn carries n bytes, except for a truncated one at the end of the code
+        operand_lengths = array('B', opcodes.tobytes().translate(OPERAND_LENGTHS))
+        if opcodes and pcs[-1] + sizes[opcodes[-1]] > n:
+            operand_lengths[-1] = n - pcs[-1] - 1
+
+        return EvmCompactInstructions(code, opcodes, pcs, operand_lengths, _registry=self._registry)
+
     def assemble(self, instructions):
         """ Assemble a list of Instruction() objects to evm bytecode"""
         for instruction in instructions:
@@ -75,6 +113,8 @@ class EvmBytecode(object):
 
     def __init__(self, bytecode):
         self.bytecode = EvmBytecode.normalize_bytecode(bytecode)
+        # keep bytes input as is instead of converting it back from the hexstring
+        self._bytes = bytes(bytecode) if isinstance(bytecode, bytes) else None
         self.errors = []
 
     def __str__(self):
@@ -92,9 +132,12 @@ class EvmBytecode(object):
 
         raise Exception("invalid input format. hexstring (0x<hexstr>) or bytes accepted. %r"%bytecode)
 
-    def disassemble(self):
+    def disassemble(self, compact=False):
         disassembler = EvmDisassembler()
-        self.instructions = EvmInstructions(list(disassembler.disassemble(self.as_bytes)))
+        if compact:
+            self.instructions = disassembler.disassemble_compact(self)
+        else:
+            self.instructions = EvmInstructions(list(disassembler.disassemble(self)))
         self.errors = disassembler.errors
         return self.instructions
 
@@ -104,7 +147,9 @@ class EvmBytecode(object):
 
     @property
     def as_bytes(self):
-        return utils.str_to_bytes(self.bytecode)
+        if self._bytes is None:
+            self._bytes = utils.str_to_bytes(self.bytecode)
+        return self._bytes
 
 
 class EvmInstructions(list):
@@ -239,6 +284,84 @@ class EvmInstructions(list):
         return '\n'.join("%s %s" % (i.name, i.operand) for i in super().__iter__())
 
 
+class EvmCompactInstructions(object):
+    """
+    Compact disassembly: parallel arrays of opcodes, addresses (pc) and operand lengths over the shared bytecode.
+    The operand of an instruction starts at pc + 1. Instruction objects are only built on access and are not linked.
+
+    instructions = EvmBytecode(code).disassemble(compact=True)
+    instructions[0]                                # Instruction
+    instructions[10:20]                            # EvmCompactInstructions sharing the bytecode
+    instructions.find("PUSH4", "EQ", "PUSH2", "JUMPI")   # indices of matches
+    """
+
+    def __init__(self, bytecode, opcodes, pcs, operand_lengths, _registry=None):
+        self.bytecode = bytecode
+        self.opcodes = opcodes
+        self.pcs = pcs
+        self.operand_lengths = operand_lengths
+        self._registry = _registry if _registry is not None else registry.registry
+        self.errors = []
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def __iter__(self):
+        for index in range(len(self.opcodes)):
+            yield self._instruction(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EvmCompactInstructions(self.bytecode, self.opcodes[index], self.pcs[index],
+                                          self.operand_lengths[index], _registry=self._registry)
+        if not isinstance(index, int):
+            raise TypeError("index must be int or slice")
+        if index < 0:
+            index += len(self.opcodes)
+        if not 0 <= index < len(self.opcodes):
+            raise IndexError("instruction index out of range")
+
+        return self._instruction(index)
+
+    def operand_bytes(self, index):
+        pc = self.pcs[index]
+        return self.bytecode[pc + 1:pc + 1 + self.operand_lengths[index]]
+
+    def find(self, *pattern):
+        """
+        Find a sequence of instructions.
+
+        :param pattern: an item per instruction: a name, an opcode, a tuple of names/opcodes or None for any
+        :return: generator of indices where the sequence starts
+        """
+        expression = b''.join(self._pattern_item(item) for item in pattern)
+        for match in re.finditer(b'(?=%s)' % expression, self.opcodes.tobytes(), re.DOTALL):
+            yield match.start()
+
+    def _pattern_item(self, item):
+        if item is None:
+            return b'.'
+        items = item if isinstance(item, (tuple, list, set)) else (item,)
+        opcodes = [i if isinstance(i, int) else self._registry.by_name[i.upper()].opcode for i in items]
+        return b'[%s]' % b''.join(re.escape(bytes([opcode])) for opcode in opcodes)
+
+    def _instruction(self, index):
+        opcode = self.opcodes[index]
+        instruction = self._registry.create_instruction(opcode=opcode)
+        operand_bytes = self.operand_bytes(index)
+        instruction.operand_bytes = operand_bytes
+        if len(operand_bytes) != instruction.length_of_operand:
+            instruction._name = "INVALID_%s" % hex(opcode)
+            instruction._description = "Invalid operand"
+            instruction._category = "unknown"
+        instruction.address = self.pcs[index]
+        return instruction
+
+    @property
+    def as_string(self):
+        return '\n'.join("%s %s" % (i.name, i.operand) for i in self)
+
+
 class EvmProgram(object):
     """
 
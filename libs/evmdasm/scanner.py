@@ -0,0 +1,78 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Find function selectors of the dispatcher directly on the bytecode, without building Instruction objects.
+
+    >>> list(find_selectors('0x63a9059cbb1461001057'))
+    ['a9059cbb']
+"""
+from . import utils
+
+PUSH1, PUSH2, PUSH3, PUSH4, PUSH32 = 0x60, 0x61, 0x62, 0x63, 0x7f
+GT, EQ, DUP2, JUMPI = 0x11, 0x14, 0x81, 0x57
+
+# size of an instruction by its opcode, PUSHn carries n bytes of operand
+INSTRUCTION_SIZES = bytes(op - PUSH1 + 2 if PUSH1 <= op <= PUSH32 else 1 for op in range(256))
+
+
+def as_bytes(bytecode):
+    """
+    Convert bytecode to bytes without copying it if possible
+    :param bytecode: bytes, bytearray, memoryview or a (0x) hexstring
+    :return: bytes-like object
+    """
+    if isinstance(bytecode, (bytes, bytearray, memoryview)):
+        return bytecode
+    if isinstance(bytecode, str):
+        return utils.str_to_bytes(utils.strip_0x_prefix(bytecode.strip()))
+
+    raise Exception("invalid input format. hexstring (0x<hexstr>) or bytes accepted. %r" % bytecode)
+
+
+def _is_conditional_jump(code, j, n, jump_pushes):
+    """ PUSHn <dest> JUMPI at j """
+    if j >= n or code[j] not in jump_pushes:
+        return False
+    k = j + INSTRUCTION_SIZES[code[j]]
+    return k < n and code[k] == JUMPI
+
+
+def find_selectors(bytecode, extended=True):
+    """
+    Yield unique function selectors compared in the dispatcher, in the order of the bytecode.
+
+    Matches PUSH4 <selector> EQ PUSH2 <dest> JUMPI. If extended, also matches
+    PUSH4 <selector> DUP2 EQ ..., the PUSH4 <selector> GT ... split of large dispatchers and PUSH1/PUSH3 jump
+    destinations.
+
+    :param bytecode: bytes or a (0x) hexstring
+    :param extended: match the dispatcher variants of other compiler versions
+    :return: generator of selectors as hexstrings without prefix, e.g. 'a9059cbb'
+    """
+    code = memoryview(as_bytes(bytecode))
+    n = len(code)
+    jump_pushes = (PUSH1, PUSH2, PUSH3) if extended else (PUSH2,)
+    sizes = INSTRUCTION_SIZES
+    seen = set()
+
+    i = 0
+    while i < n:
+        op = code[i]
+        if op == PUSH4 and i + 5 < n:
+            j = i + 5
+            nxt = code[j]
+            if nxt == EQ:
+                matched = _is_conditional_jump(code, j + 1, n, jump_pushes)
+            elif extended and nxt == DUP2:
+                matched = j + 1 < n and code[j + 1] == EQ and _is_conditional_jump(code, j + 2, n, jump_pushes)
+            elif extended and nxt == GT:
+                matched = _is_conditional_jump(code, j + 1, n, jump_pushes)
+            else:
+                matched = False
+
+            if matched:
+                selector = code[i + 1:j].hex()
+                if selector not in seen:
+                    seen.add(selector)
+                    yield selector
+        i += sizes[op]
@@ -0,0 +1,130 @@
+import asyncio
+import time
+from typing import Optional, Dict, Tuple
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    A token bucket that lets through 'rate' requests per second on average and bursts of up to 'capacity' requests.
+    Waiting requests are let through in the order they came.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Initialize the class.
+
+        :param float rate: tokens added per second
+        :param float capacity: the maximum number of tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.requests = 0
+        self.waited = 0.
+        self.max_wait = 0.
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        Wait until a token is available and take it.
+
+        :return float: how long the request waited in seconds
+        """
+        if not self._lock:
+            self._lock = asyncio.Lock()
+
+        started = time.monotonic()
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+
+            self.tokens -= 1
+
+        waited = time.monotonic() - started
+        self.requests += 1
+        self.waited += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+
+class RateLimiter:
+    """
+    A process-wide registry of token buckets, one per host.
+    """
+    default_rate: float = 10
+    default_capacity: float = 20
+    hosts: Dict[str, Tuple[float, float]] = {}
+    _buckets: Dict[str, TokenBucket] = {}
+
+    @classmethod
+    def configure(
+            cls, default_rate: Optional[float] = None, default_capacity: Optional[float] = None,
+            hosts: Optional[Dict[str, Tuple[float, float]]] = None
+    ) -> None:
+        """
+        Change limits. Buckets of reconfigured hosts are recreated.
+
+        :param Optional[float] default_rate: requests per second to a host without its own limit (not changed)
+        :param Optional[float] default_capacity: the burst size of a host without its own limit (not changed)
+        :param Optional[Dict[str, Tuple[float, float]]] hosts: the rate and burst size by host (not changed)
+        """
+        if default_rate is not None:
+            cls.default_rate = default_rate
+
+        if default_capacity is not None:
+            cls.default_capacity = default_capacity
+
+        if hosts is not None:
+            cls.hosts = {host.lower(): tuple(limits) for host, limits in hosts.items()}
+
+        cls._buckets.clear()
+
+    @classmethod
+    def bucket(cls, url: str) -> TokenBucket:
+        """
+        Get a bucket of the URL host.
+
+        :param str url: a URL or a host
+        :return TokenBucket: the bucket
+        """
+        host = (urlparse(url).hostname or url).lower()
+        if host not in cls._buckets:
+            rate, capacity = cls.hosts.get(host, (cls.default_rate, cls.default_capacity))
+            cls._buckets[host] = TokenBucket(rate=rate, capacity=capacity)
+
+        return cls._buckets[host]
+
+    @classmethod
+    async def acquire(cls, url: str) -> float:
+        """
+        Wait until a request to the URL host is allowed.
+
+        :param str url: a URL
+        :return float: how long the request waited in seconds
+        """
+        return await cls.bucket(url).acquire()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, float]]:
+        """
+        Get queue statistics by host.
+
+        :return Dict[str, Dict[str, float]]: the number of requests, total, average and maximum wait in seconds
+        """
+        return {
+            host: {
+                'requests': bucket.requests,
+                'waited': round(bucket.waited, 3),
+                'avg_wait': round(bucket.waited / bucket.requests, 3) if bucket.requests else 0.,
+                'max_wait': round(bucket.max_wait, 3)
+            } for host, bucket in cls._buckets.items()
+        }
@@ -0,0 +1,218 @@
+import json
+import os
+import time
+from typing import Optional, Dict, Any, List, Union
+
+from web3 import Web3
+
+
+class AbiCache:
+    """
+    A process-wide on-disk cache of contract ABIs. ABI files are content-addressed, i.e. stored under the hash of their
+        content, and the index maps '{chain_id}:{address}' and contract code hashes to them, so contracts with the same
+        bytecode share the ABI. Entries expire after the TTL unless they're pinned.
+
+    Attributes:
+        directory (Optional[str]): the cache directory, if None, ABIs are only cached in memory.
+        ttl (float): how long an unpinned entry is valid.
+
+    """
+    directory: Optional[str] = None
+    ttl: float = 7 * 24 * 60 * 60
+    _index: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+    _abis: Dict[str, List[Dict[str, Any]]] = {}
+
+    @classmethod
+    def configure(cls, directory: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        """
+        Set the cache directory and the TTL of entries.
+
+        Args:
+            directory (Optional[str]): the cache directory. (only in memory)
+            ttl (Optional[float]): how long an unpinned entry is valid. (not changed)
+
+        """
+        cls.directory = directory
+        if ttl is not None:
+            cls.ttl = ttl
+
+        cls._index = None
+        cls._abis = {}
+
+    @staticmethod
+    def code_hash(bytecode: Union[str, bytes]) -> str:
+        """
+        Calculate the hash of a contract bytecode.
+
+        Args:
+            bytecode (Union[str, bytes]): the bytecode.
+
+        Returns:
+            str: the hash.
+
+        """
+        if isinstance(bytecode, str):
+            return Web3.keccak(hexstr=bytecode).hex()
+
+        return Web3.keccak(bytecode).hex()
+
+    @classmethod
+    def get(cls, chain_id: int, address: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the ABI of a contract without network requests.
+
+        Args:
+            chain_id (int): the chain ID.
+            address (str): the contract address.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: the ABI if it's cached and not expired.
+
+        """
+        return cls._get(section='addresses', key=cls._address_key(chain_id=chain_id, address=address))
+
+    @classmethod
+    def get_by_code(cls, code_hash: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the ABI of a contract by its code hash without network requests.
+
+        Args:
+            code_hash (str): the code hash.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: the ABI if it's cached and not expired.
+
+        """
+        return cls._get(section='codes', key=code_hash)
+
+    @classmethod
+    def put(
+            cls, chain_id: int, address: str, abi: List[Dict[str, Any]], code_hash: Optional[str] = None,
+            pinned: bool = False
+    ) -> None:
+        """
+        Save the ABI of a contract.
+
+        Args:
+            chain_id (int): the chain ID.
+            address (str): the contract address.
+            abi (List[Dict[str, Any]]): the ABI.
+            code_hash (Optional[str]): the contract code hash, makes the ABI available for the same bytecode. (None)
+            pinned (bool): if True, the entry never expires. (False)
+
+        """
+        abi_hash = cls._write_abi(abi=abi)
+        index = cls._read_index()
+        entry = {'abi': abi_hash, 'updated_at': time.time(), 'pinned': pinned}
+        index['addresses'][cls._address_key(chain_id=chain_id, address=address)] = entry
+        if code_hash:
+            index['codes'][code_hash] = entry.copy()
+
+        cls._write_index()
+
+    @classmethod
+    def pin(cls, chain_id: int, address: str, abi: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """
+        Make the entry of a contract never expire.
+
+        Args:
+            chain_id (int): the chain ID.
+            address (str): the contract address.
+            abi (Optional[List[Dict[str, Any]]]): the ABI, if specified, it replaces the cached one. (None)
+
+        Returns:
+            bool: True if the entry is pinned.
+
+        """
+        if abi:
+            cls.put(chain_id=chain_id, address=address, abi=abi, pinned=True)
+            return True
+
+        entry = cls._read_index()['addresses'].get(cls._address_key(chain_id=chain_id, address=address))
+        if not entry:
+            return False
+
+        entry['pinned'] = True
+        cls._write_index()
+        return True
+
+    @classmethod
+    def unpin(cls, chain_id: int, address: str) -> None:
+        """
+        Make the entry of a contract expire after the TTL.
+
+        Args:
+            chain_id (int): the chain ID.
+            address (str): the contract address.
+
+        """
+        entry = cls._read_index()['addresses'].get(cls._address_key(chain_id=chain_id, address=address))
+        if entry:
+            entry['pinned'] = False
+            entry['updated_at'] = time.time()
+            cls._write_index()
+
+    @staticmethod
+    def _address_key(chain_id: int, address: str) -> str:
+        return f'{chain_id}:{address.lower()}'
+
+    @classmethod
+    def _get(cls, section: str, key: str) -> Optional[List[Dict[str, Any]]]:
+        entry = cls._read_index()[section].get(key)
+        if not entry or (not entry['pinned'] and time.time() - entry['updated_at'] > cls.ttl):
+            return None
+
+        return cls._read_abi(abi_hash=entry['abi'])
+
+    @classmethod
+    def _read_index(cls) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if cls._index is None:
+            cls._index = {'addresses': {}, 'codes': {}}
+            if cls.directory:
+                try:
+                    with open(os.path.join(cls.directory, 'index.json')) as file:
+                        cls._index.update(json.load(file))
+
+                except (OSError, ValueError):
+                    pass
+
+        return cls._index
+
+    @classmethod
+    def _write_index(cls) -> None:
+        if not cls.directory:
+            return
+
+        os.makedirs(cls.directory, exist_ok=True)
+        path = os.path.join(cls.directory, 'index.json')
+        with open(f'{path}.tmp', 'w') as file:
+            json.dump(cls._index, file, indent=2)
+
+        os.replace(f'{path}.tmp', path)
+
+    @classmethod
+    def _read_abi(cls, abi_hash: str) -> Optional[List[Dict[str, Any]]]:
+        if abi_hash not in cls._abis and cls.directory:
+            try:
+                with open(os.path.join(cls.directory, f'{abi_hash}.json')) as file:
+                    cls._abis[abi_hash] = json.load(file)
+
+            except (OSError, ValueError):
+                return None
+
+        return cls._abis.get(abi_hash)
+
+    @classmethod
+    def _write_abi(cls, abi: List[Dict[str, Any]]) -> str:
+        content = json.dumps(abi, sort_keys=True, separators=(',', ':'))
+        abi_hash = Web3.keccak(text=content).hex()
+        if abi_hash not in cls._abis:
+            cls._abis[abi_hash] = abi
+            if cls.directory:
+                os.makedirs(cls.directory, exist_ok=True)
+                path = os.path.join(cls.directory, f'{abi_hash}.json')
+                if not os.path.isfile(path):
+                    with open(path, 'w') as file:
+                        file.write(content)
+
+        return abi_hash
@@ -0,0 +1,104 @@
+"""
+Rebuild the bundled signature database from the list of common signatures and contract ABIs.
+
+Run it from the project root after changing the list or the ABIs:
+    python -m libs.py_eth_async.build_signatures [ABI files...]
+
+"""
+import glob
+import json
+import os
+import sys
+from typing import List, Dict, Any, Iterable
+
+from libs.py_eth_async.signatures import BUNDLED_DB, SignatureDB
+
+COMMON_SIGNATURES = os.path.join(os.path.dirname(BUNDLED_DB), 'signatures.txt')
+DEFAULT_ABIS = os.path.join('data', 'abis', '*.json')
+
+
+def canonical_type(param: Dict[str, Any]) -> str:
+    """
+    Get the canonical type of a function parameter, tuples are expanded to their components.
+
+    Args:
+        param (Dict[str, Any]): the parameter dictionary of an ABI.
+
+    Returns:
+        str: the type, e.g. (address,uint256)[].
+
+    """
+    if param['type'].startswith('tuple'):
+        components = ','.join(canonical_type(component) for component in param['components'])
+        return f'({components}){param["type"][5:]}'
+
+    return param['type']
+
+
+def read_common_signatures(path: str = COMMON_SIGNATURES) -> List[str]:
+    """
+    Read text signatures of a list, empty lines and comments are skipped.
+
+    Args:
+        path (str): the list file. (the bundled one)
+
+    Returns:
+        List[str]: the text signatures.
+
+    """
+    with open(path) as file:
+        lines = [line.strip() for line in file]
+
+    return [line for line in lines if line and not line.startswith('#')]
+
+
+def read_abi_signatures(paths: Iterable[str]) -> List[str]:
+    """
+    Get text signatures of all functions of ABIs.
+
+    Args:
+        paths (Iterable[str]): ABI files.
+
+    Returns:
+        List[str]: the text signatures.
+
+    """
+    text_signatures = []
+    for path in paths:
+        with open(path) as file:
+            for item in json.load(file):
+                if item.get('type', 'function') == 'function':
+                    inputs = ','.join(canonical_type(param) for param in item.get('inputs', []))
+                    text_signatures.append(f'{item["name"]}({inputs})')
+
+    return text_signatures
+
+
+def build(abi_paths: Iterable[str]) -> int:
+    """
+    Create the bundled signature database from scratch.
+
+    Args:
+        abi_paths (Iterable[str]): ABI files whose functions are added.
+
+    Returns:
+        int: the number of signatures.
+
+    """
+    if os.path.isfile(BUNDLED_DB):
+        os.remove(BUNDLED_DB)
+
+    SignatureDB.configure(path=BUNDLED_DB)
+    text_signatures = sorted(set(read_common_signatures()) | set(read_abi_signatures(abi_paths)))
+    for text_signature in text_signatures:
+        # One by one, so every signature is the preferred one of its selector
+        SignatureDB.add(text_signatures=[text_signature])
+
+    # The connection is closed
+    SignatureDB.configure(path=BUNDLED_DB)
+    return len(text_signatures)
+
+
+if __name__ == '__main__':
+    abi_paths = sys.argv[1:] or sorted(glob.glob(DEFAULT_ABIS))
+    print(f'{build(abi_paths=abi_paths)} signatures were written to {BUNDLED_DB}')
@@ -1,9 +1,12 @@
 import random
-from typing import Optional
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional, Callable, Dict, Tuple, Any, AsyncIterator
 
 import aiohttp
 import requests
 from aiohttp_socks import ProxyConnector
+from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from fake_useragent import UserAgent
 from web3 import Web3
@@ -11,7 +14,10 @@ from web3 import Web3
 from libs.py_eth_async.contracts import Contracts
 from libs.py_eth_async.data.models import Network, Networks
 from libs.py_eth_async.exceptions import InvalidProxy
+from libs.py_eth_async.fee_oracle import FeeOracle
+from libs.py_eth_async.multicall import Multicall
 from libs.py_eth_async.nfts import NFTs
+from libs.py_eth_async.providers import PooledHTTPProvider
 from libs.py_eth_async.transactions import Transactions
 from libs.py_eth_async.wallet import Wallet
 
@@ -26,15 +32,19 @@ class Client:
         network (Network): a network instance.
         account (Optional[LocalAccount]): imported account.
         w3 (Web3): a Web3 instance.
+        fees (FeeOracle): the fee oracle of the network shared by all clients.
 
     """
     network: Network
     account: Optional[LocalAccount]
     w3: Web3
+    fees: FeeOracle
+    factory: 'ClientFactory'
 
     def __init__(
             self, private_key: Optional[str] = None, network: Network = Networks.Goerli, proxy: Optional[str] = None,
-            check_proxy: bool = True
+            check_proxy: bool = True, account: Optional[LocalAccount] = None, headers: Optional[Dict[str, str]] = None,
+            batch_window: float = 0
     ) -> None:
 
         """
@@ -53,27 +63,30 @@ class Client:
                 - http://proxy:port
 
             check_proxy (bool): check if the proxy is working. (True)
+            account (Optional[LocalAccount]): an already imported account, 'private_key' is ignored if specified.
+                (None)
+            headers (Optional[Dict[str, str]]): headers for RPC requests. (generated with a random user agent)
+            batch_window (float): how long RPC requests are collected before being sent as one JSON-RPC batch.
+                (0, requests are only batched inside the 'batch' block)
 
         """
         self.network = network
-        self.headers = {
-            'accept': '*/*',
-            'accept-language': 'en-US,en;q=0.9',
-            'content-type': 'application/json',
-            'user-agent': UserAgent().chrome
-        }
+        self.headers = headers or self.default_headers()
         self.proxy = proxy
         self.connector = None
 
         self.w3 = Web3(
-            provider=Web3.AsyncHTTPProvider(
-                endpoint_uri=self.network.rpc,
-                request_kwargs={'proxy': self.proxy, 'headers': self.headers}
+            provider=PooledHTTPProvider(
+                endpoint_uri=self.network.rpc, proxy=self.proxy, request_kwargs={'headers': self.headers},
+                batch_window=batch_window, endpoints=self.network.rpcs
             ),
             modules={'eth': (AsyncEth,)},
             middlewares=[]
         )
-        if private_key:
+        if account:
+            self.account = account
+
+        elif private_key:
             self.account = self.w3.eth.account.from_key(private_key=private_key)
 
         elif private_key is None:
@@ -82,11 +95,56 @@ class Client:
         else:
             self.account = None
 
+        self.fees = FeeOracle.for_network(network=self.network)
         self.contracts = Contracts(self)
+        self.multicall = Multicall(self)
         self.nfts = NFTs(self)
         self.transactions = Transactions(self)
         self.wallet = Wallet(self)
 
+    @staticmethod
+    def default_headers() -> Dict[str, str]:
+        """
+        Generate headers for RPC requests with a random user agent.
+
+        Returns:
+            Dict[str, str]: the headers.
+
+        """
+        return {
+            'accept': '*/*',
+            'accept-language': 'en-US,en;q=0.9',
+            'content-type': 'application/json',
+            'user-agent': UserAgent().chrome
+        }
+
+    @asynccontextmanager
+    async def batch(self, window: float = 0.01) -> AsyncIterator['Client']:
+        """
+        Send RPC requests made inside the block as JSON-RPC batches. Requests have to be awaited concurrently,
+            e.g. with 'asyncio.gather', to get into one batch.
+
+        Args:
+            window (float): how long requests are collected before being sent. (0.01 sec)
+
+        """
+        async with self.w3.provider.batch(window=window):
+            yield self
+
+    @classmethod
+    def for_wallet(cls, wallet: Any, network: Network) -> 'Client':
+        """
+        Get a cached client of the wallet in the network from the default factory.
+
+        Args:
+            wallet (Any): an object with 'private_key' and 'proxy' attributes, e.g. a wallet from the database.
+            network (Network): a network instance.
+
+        Returns:
+            Client: the client.
+
+        """
+        return cls.factory.for_wallet(wallet=wallet, network=network)
 
     async def setup_proxy(self) -> Web3:
         provider = Web3.AsyncHTTPProvider(
@@ -97,3 +155,115 @@ class Client:
         )
         self.w3 = Web3(provider=provider)
         return self.w3
+
+
+class ClientFactory:
+    """
+    Builds clients and caches derived accounts, headers and clients per wallet and network.
+
+    Attributes:
+        maxsize (int): the maximum number of cached accounts and clients, the least recently used ones are evicted.
+        key_loader (Callable[[str], str]): a function that converts a stored private key to a usable one,
+            e.g. decrypts it.
+
+    """
+    maxsize: int
+    key_loader: Callable[[str], str]
+
+    def __init__(self, maxsize: int = 1024, key_loader: Optional[Callable[[str], str]] = None) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            maxsize (int): the maximum number of cached accounts and clients. (1024)
+            key_loader (Optional[Callable[[str], str]]): a function that converts a stored private key to a usable
+                one. (the key is used as is)
+
+        """
+        self.maxsize = maxsize
+        self.key_loader = key_loader or (lambda private_key: private_key)
+        self._accounts: OrderedDict[Any, Tuple[LocalAccount, Dict[str, str]]] = OrderedDict()
+        self._clients: OrderedDict[Tuple[Any, str, Optional[str]], Client] = OrderedDict()
+
+    def for_wallet(self, wallet: Any, network: Network) -> Client:
+        """
+        Get a client of the wallet in the network, the private key is loaded only once per wallet.
+
+        Args:
+            wallet (Any): an object with 'private_key' and 'proxy' attributes, e.g. a wallet from the database.
+            network (Network): a network instance.
+
+        Returns:
+            Client: the client.
+
+        """
+        return self._get(
+            key=wallet.private_key, network=network, proxy=wallet.proxy,
+            load_account=lambda: Account.from_key(self.key_loader(wallet.private_key))
+        )
+
+    def for_account(self, account: LocalAccount, network: Network, proxy: Optional[str] = None) -> Client:
+        """
+        Get a client of an already imported account in the network.
+
+        Args:
+            account (LocalAccount): the account.
+            network (Network): a network instance.
+            proxy (Optional[str]): an HTTP or SOCKS5 IPv4 proxy. (None)
+
+        Returns:
+            Client: the client.
+
+        """
+        return self._get(key=account.address, network=network, proxy=proxy, load_account=lambda: account)
+
+    def invalidate(self, wallet: Optional[Any] = None) -> None:
+        """
+        Drop cached data of the wallet, e.g. after its private key or proxy was changed.
+
+        Args:
+            wallet (Optional[Any]): the wallet, an account or its address. (all wallets)
+
+        """
+        if wallet is None:
+            self._accounts.clear()
+            self._clients.clear()
+            return
+
+        keys = {getattr(wallet, 'private_key', None), getattr(wallet, 'address', wallet)}
+        for key in keys & set(self._accounts):
+            account, headers = self._accounts.pop(key)
+            keys.add(account.address)
+
+        for client_key in [client_key for client_key in self._clients if client_key[0] in keys]:
+            del self._clients[client_key]
+
+    def _get(
+            self, key: Any, network: Network, proxy: Optional[str], load_account: Callable[[], LocalAccount]
+    ) -> Client:
+        client_key = (key, network.name, proxy)
+        client = self._clients.get(client_key)
+        if client:
+            self._clients.move_to_end(client_key)
+            return client
+
+        if key in self._accounts:
+            self._accounts.move_to_end(key)
+            account, headers = self._accounts[key]
+
+        else:
+            account, headers = load_account(), Client.default_headers()
+            self._accounts[key] = (account, headers)
+            self._evict(self._accounts)
+
+        client = Client(network=network, proxy=proxy, account=account, headers=headers)
+        self._clients[client_key] = client
+        self._evict(self._clients)
+        return client
+
+    def _evict(self, cache: OrderedDict) -> None:
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+
+Client.factory = ClientFactory()
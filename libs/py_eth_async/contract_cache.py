@@ -0,0 +1,91 @@
+import hashlib
+import json
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+from web3 import Web3
+from web3.contract import AsyncContract
+
+
+class ContractCache:
+    """
+    A cache of contract instances of a client. ABIs are interned process-wide by the hash of their content, so equal
+        ABIs are shared, and contract instances are reused per Web3 instance, address and ABI.
+
+    Attributes:
+        client (Client): the Client instance.
+        max_abi_ids (int): how many ABI objects are remembered to skip hashing them again.
+
+    """
+    max_abi_ids: int = 4096
+    _abis: Dict[str, List[Dict[str, Any]]] = {}
+    _abi_ids: Dict[int, Tuple[List[Dict[str, Any]], str]] = {}
+
+    def __init__(self, client) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            client (Client): the Client instance.
+
+        """
+        self.client = client
+        self._w3: Optional[Web3] = None
+        self._contracts: Dict[Tuple[str, Optional[str]], AsyncContract] = {}
+
+    @classmethod
+    def intern(cls, abi: List[Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Get the canonical instance of an ABI.
+
+        Args:
+            abi (List[Dict[str, Any]]): the ABI.
+
+        Returns:
+            Tuple[str, List[Dict[str, Any]]]: the content hash and the canonical ABI.
+
+        """
+        known = cls._abi_ids.get(id(abi))
+        if known and known[0] is abi:
+            return known[1], cls._abis[known[1]]
+
+        abi_hash = hashlib.sha256(json.dumps(abi, sort_keys=True).encode()).hexdigest()
+        if len(cls._abi_ids) >= cls.max_abi_ids:
+            cls._abi_ids.clear()
+
+        # The ABI is kept in the value so that its ID isn't reused by another object
+        cls._abi_ids[id(abi)] = (abi, abi_hash)
+        return abi_hash, cls._abis.setdefault(abi_hash, abi)
+
+    def get(self, address: str, abi: Optional[Union[List[Dict[str, Any]], str]] = None) -> AsyncContract:
+        """
+        Get a contract instance, create it if it doesn't exist.
+
+        Args:
+            address (str): the contract address.
+            abi (Optional[Union[List[Dict[str, Any]], str]]): the contract ABI. (None)
+
+        Returns:
+            AsyncContract: the contract instance.
+
+        """
+        if self._w3 is not self.client.w3:
+            # Instances are bound to the Web3 instance, e.g. it's replaced by 'setup_proxy'
+            self._w3 = self.client.w3
+            self._contracts.clear()
+
+        abi_hash = None
+        if isinstance(abi, str):
+            abi = json.loads(abi)
+
+        if abi:
+            abi_hash, abi = self.intern(abi)
+
+        key = (address, abi_hash)
+        if key not in self._contracts:
+            if abi:
+                self._contracts[key] = self._w3.eth.contract(address=address, abi=abi)
+
+            else:
+                self._contracts[key] = self._w3.eth.contract(address=address)
+
+        return self._contracts[key]
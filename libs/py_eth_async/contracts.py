@@ -1,15 +1,18 @@
-import asyncio
 import json
 from typing import Union, Optional, List, Dict, Any, Tuple
 
 from eth_typing import ChecksumAddress
-from libs.evmdasm import EvmBytecode
+from libs.evmdasm import find_selectors
 from libs.pretty_utils.type_functions.strings import text_between
 from web3.contract import AsyncContract
 
 from libs.py_eth_async.data import types
+from libs.py_eth_async.abi_cache import AbiCache
+from libs.py_eth_async.contract_cache import ContractCache
+from libs.py_eth_async.signatures import SignatureDB
 from libs.py_eth_async.data.models import DefaultABIs, ABI, Function, RawContract
-from libs.py_eth_async.utils import checksum, async_get
+from libs.py_eth_async.utils import checksum
+from data.config import logger
 
 
 class Contracts:
@@ -18,6 +21,7 @@ class Contracts:
 
     Attributes:
         client (Client): the Client instance.
+        cache (ContractCache): the cache of contract instances.
 
     """
 
@@ -30,26 +34,22 @@ class Contracts:
 
         """
         self.client = client
+        self.cache = ContractCache(client)
 
     @staticmethod
     async def get_signature(hex_signature: str) -> Optional[list]:
         """
-        Find all matching signatures in the database of https://www.4byte.directory/.
+        Find all matching signatures in the local database, if the selector is unknown, in the database of
+            https://www.4byte.directory/.
 
         Args:
             hex_signature (str): a signature hash.
 
         Returns:
-            Optional[list]: matches found.
+            Optional[list]: matches found, None if the lookup failed.
 
         """
-        try:
-            response = await async_get(f'https://www.4byte.directory/api/v1/signatures/?hex_signature={hex_signature}')
-            results = response['results']
-            return [m['text_signature'] for m in sorted(results, key=lambda result: result['created_at'])]
-
-        except:
-            return
+        return (await SignatureDB.lookup(hex_signatures=[hex_signature]))[hex_signature]
 
     @staticmethod
     async def parse_function(text_signature: str) -> dict:
@@ -110,22 +110,30 @@ class Contracts:
         return checksum(contract), None
 
     async def get_abi(
-            self, contract_address: types.Contract, raw_json: bool = False
+            self, contract_address: types.Contract, raw_json: bool = False, use_cache: bool = True
     ) -> Union[str, List[Dict[str, Any]]]:
         """
-        Get a contract ABI from the Blockscan API, if unsuccessful, parses it based on the contract source code
-            (it may be incorrect or incomplete).
+        Get a contract ABI from the cache or the Blockscan API, if unsuccessful, parses it based on the contract source
+            code (it may be incorrect or incomplete).
 
         Args:
             contract_address (Contract): the contract address or instance.
             raw_json (bool): if True, it returns serialize string, otherwise it returns Python list. (False)
+            use_cache (bool): if False, the cached ABI is ignored and replaced with a fetched one. (True)
 
         Returns:
             Union[str, List[Dict[str, Any]]]: the ABI.
 
         """
         contract_address, abi = await self.get_contract_attributes(contract_address)
+        chain_id = self.client.network.chain_id
+        abi = AbiCache.get(chain_id=chain_id, address=contract_address) if use_cache else None
+        if abi:
+            return json.dumps(abi) if raw_json else abi
+
         abi = []
+        code_hash = None
+        failed = []
         if self.client.network.api and self.client.network.api.key:
             try:
                 abi = (await self.client.network.api.functions.contract.getabi(contract_address))['result']
@@ -136,27 +144,22 @@ class Contracts:
 
         if not abi:
             bytecode = await self.client.w3.eth.get_code(contract_address)
-            opcodes = EvmBytecode(bytecode).disassemble()
-            hex_signatures = set()
-            for i in range(len(opcodes) - 3):
-                if (
-                        opcodes[i].name == 'PUSH4'
-                        and opcodes[i + 1].name == 'EQ'
-                        and opcodes[i + 2].name == 'PUSH2'
-                        and opcodes[i + 3].name == 'JUMPI'
-                ):
-                    hex_signatures.add(opcodes[i].operand)
-            hex_signatures = list(hex_signatures)
-
-            text_signatures = []
-            for i, hex_signature in enumerate(hex_signatures):
-                signature_for_hash = await Contracts.get_signature(hex_signature=hex_signature)
-                while signature_for_hash is None:
-                    await asyncio.sleep(1)
-                    signature_for_hash = await Contracts.get_signature(hex_signature=hex_signature)
-
-                if signature_for_hash:
-                    text_signatures.append(signature_for_hash[0])
+            code_hash = AbiCache.code_hash(bytecode)
+            abi = (AbiCache.get_by_code(code_hash=code_hash) if use_cache else None) or []
+
+        if not abi and code_hash:
+            hex_signatures = list(find_selectors(bytecode))
+            signatures = await SignatureDB.lookup(hex_signatures=hex_signatures)
+            failed = [hex_signature for hex_signature in hex_signatures if signatures[hex_signature] is None]
+            if failed:
+                logger.warning(
+                    f'Failed to look up {len(failed)} of {len(hex_signatures)} selectors of {contract_address}, '
+                    f'the ABI is incomplete'
+                )
+
+            text_signatures = [
+                signatures[hex_signature][0] for hex_signature in hex_signatures if signatures[hex_signature]
+            ]
 
             for text_signature in text_signatures:
                 try:
@@ -165,6 +168,10 @@ class Contracts:
                 except:
                     pass
 
+        if abi and not failed:
+            # An ABI missing functions of failed lookups isn't cached, so it's rebuilt on the next call
+            AbiCache.put(chain_id=chain_id, address=contract_address, abi=abi, code_hash=code_hash)
+
         if raw_json:
             return json.dumps(abi)
 
@@ -182,7 +189,7 @@ class Contracts:
 
         """
         contract_address, abi = await self.get_contract_attributes(contract_address)
-        return self.client.w3.eth.contract(address=contract_address, abi=DefaultABIs.Token)
+        return self.cache.get(address=contract_address, abi=DefaultABIs.Token)
 
     async def default_nft(self, contract_address: types.Contract) -> AsyncContract:
         """
@@ -196,7 +203,7 @@ class Contracts:
 
         """
         contract_address, abi = await self.get_contract_attributes(contract_address)
-        return self.client.w3.eth.contract(address=contract_address, abi=DefaultABIs.NFT)
+        return self.cache.get(address=contract_address, abi=DefaultABIs.NFT)
 
     async def get(
             self, contract_address: types.Contract, abi: Optional[Union[list, str]] = None,
@@ -229,10 +236,7 @@ class Contracts:
         if not abi:
             abi = contract_abi
 
-        if abi:
-            return self.client.w3.eth.contract(address=contract_address, abi=abi)
-
-        return self.client.w3.eth.contract(address=contract_address)
+        return self.cache.get(address=contract_address, abi=abi)
 
     async def get_functions(self, contract: types.Contract) -> List[Function]:
         """
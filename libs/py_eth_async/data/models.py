@@ -60,7 +60,8 @@ class Network(AutoRepr):
 
     Attributes:
         name (str): a network name.
-        rpc (str): the RPC URL.
+        rpc (str): the primary RPC URL.
+        rpcs (List[str]): all RPC URLs, the primary one is the first.
         chain_id (Optional[int]): the chain ID.
         tx_type (int): the main type of transactions in the network. Either 0 (legacy) or 2 (EIP-1559).
         coin_symbol (Optional[str]): the coin symbol.
@@ -71,6 +72,7 @@ class Network(AutoRepr):
     """
     name: str
     rpc: str
+    rpcs: List[str]
     chain_id: Optional[int]
     tx_type: int
     coin_symbol: Optional[str]
@@ -79,7 +81,7 @@ class Network(AutoRepr):
     dex: Optional[DEX]
 
     def __init__(
-            self, name: str, rpc: str, chain_id: Optional[int] = None, tx_type: int = 0,
+            self, name: str, rpc: Union[str, List[str]], chain_id: Optional[int] = None, tx_type: int = 0,
             coin_symbol: Optional[str] = None, explorer: Optional[str] = None, api: Optional[API] = None,
             dex: Optional[DEX] = None, cex: Optional = None, cex_network: Optional = None,
     ) -> None:
@@ -88,7 +90,7 @@ class Network(AutoRepr):
 
         Args:
             name (str): a network name.
-            rpc (str): the RPC URL.
+            rpc (Union[str, List[str]]): the RPC URL or a list of them, the first one is the primary.
             chain_id (Optional[int]): the chain ID. (parsed automatically)
             tx_type (int): the main type of transactions in the network. Either 0 (legacy) or 2 (EIP-1559). (0)
             coin_symbol (Optional[str]): the coin symbol. (parsed from the network)
@@ -98,7 +100,8 @@ class Network(AutoRepr):
 
         """
         self.name = name.lower()
-        self.rpc = rpc
+        self.rpcs = [rpc] if isinstance(rpc, str) else list(rpc)
+        self.rpc = self.rpcs[0]
         self.chain_id = chain_id
         self.tx_type = tx_type
         self.coin_symbol = coin_symbol
@@ -157,7 +160,11 @@ class Networks:
     # Mainnets
     Ethereum = Network(
         name='ethereum',
-        rpc='https://ethereum-rpc.publicnode.com',
+        rpc=[
+            'https://ethereum-rpc.publicnode.com',
+            'https://rpc.ankr.com/eth/',
+            'https://eth.llamarpc.com',
+        ],
         chain_id=1,
         tx_type=2,
         coin_symbol='ETH',
@@ -195,7 +202,11 @@ class Networks:
     Optimism = Network(
         name='optimism',
         cex_network='ETH-Optimism',
-        rpc='https://rpc.ankr.com/optimism/',
+        rpc=[
+            'https://rpc.ankr.com/optimism/',
+            'https://mainnet.optimism.io',
+            'https://optimism-rpc.publicnode.com',
+        ],
         chain_id=10,
         tx_type=2,
         coin_symbol='ETH',
@@ -210,7 +221,11 @@ class Networks:
     BSC = Network(
         name='bsc',
         cex_network="bsc",
-        rpc='https://rpc.ankr.com/bsc/',
+        rpc=[
+            'https://rpc.ankr.com/bsc/',
+            'https://bsc-dataseed.bnbchain.org',
+            'https://bsc-rpc.publicnode.com',
+        ],
         chain_id=56,
         tx_type=0,
         coin_symbol='BNB',
@@ -225,7 +240,11 @@ class Networks:
     Polygon = Network(
         name='polygon',
         cex_network='MATIC-Polygon',
-        rpc='https://rpc.ankr.com/polygon/',
+        rpc=[
+            'https://rpc.ankr.com/polygon/',
+            'https://polygon-rpc.com',
+            'https://polygon-bor-rpc.publicnode.com',
+        ],
         chain_id=137,
         tx_type=2,
         coin_symbol='MATIC',
@@ -242,7 +261,11 @@ class Networks:
     Avalanche = Network(
         name='avalanche',
         cex_network='AVAXC',
-        rpc='https://rpc.ankr.com/avalanche/',
+        rpc=[
+            'https://rpc.ankr.com/avalanche/',
+            'https://api.avax.network/ext/bc/C/rpc',
+            'https://avalanche-c-chain-rpc.publicnode.com',
+        ],
         chain_id=43114,
         tx_type=2,
         coin_symbol='AVAX',
@@ -253,7 +276,11 @@ class Networks:
     Moonbeam = Network(
         name='moonbeam',
         cex_network='GLMR-Moonbeam',
-        rpc='https://rpc.api.moonbeam.network/',
+        rpc=[
+            'https://rpc.api.moonbeam.network/',
+            'https://moonbeam-rpc.publicnode.com',
+            'https://rpc.ankr.com/moonbeam/',
+        ],
         chain_id=1284,
         tx_type=2,
         coin_symbol='GLMR',
@@ -278,7 +305,10 @@ class Networks:
     Celo = Network(
         name='celo',
         cex_network='celo',
-        rpc='https://rpc.ankr.com/celo/',
+        rpc=[
+            'https://rpc.ankr.com/celo/',
+            'https://forno.celo.org',
+        ],
         chain_id=42220,
         tx_type=0,
         coin_symbol='CELO',
@@ -333,7 +363,11 @@ class Networks:
     Base = Network(
         name='base',
         cex_network='ETH-Base',
-        rpc='https://rpc.ankr.com/base',
+        rpc=[
+            'https://rpc.ankr.com/base',
+            'https://mainnet.base.org',
+            'https://base-rpc.publicnode.com',
+        ],
         chain_id=8453,
         tx_type=2,
         coin_symbol='ETH',
@@ -520,6 +554,42 @@ class DefaultABIs:
             'stateMutability': 'view',
             'type': 'function'
         }]
+    Multicall3 = [
+        {
+            'inputs': [
+                {
+                    'components': [
+                        {'internalType': 'address', 'name': 'target', 'type': 'address'},
+                        {'internalType': 'bool', 'name': 'allowFailure', 'type': 'bool'},
+                        {'internalType': 'bytes', 'name': 'callData', 'type': 'bytes'}
+                    ],
+                    'internalType': 'struct Multicall3.Call3[]',
+                    'name': 'calls',
+                    'type': 'tuple[]'
+                }
+            ],
+            'name': 'aggregate3',
+            'outputs': [
+                {
+                    'components': [
+                        {'internalType': 'bool', 'name': 'success', 'type': 'bool'},
+                        {'internalType': 'bytes', 'name': 'returnData', 'type': 'bytes'}
+                    ],
+                    'internalType': 'struct Multicall3.Result[]',
+                    'name': 'returnData',
+                    'type': 'tuple[]'
+                }
+            ],
+            'stateMutability': 'payable',
+            'type': 'function'
+        },
+        {
+            'inputs': [{'internalType': 'address', 'name': 'addr', 'type': 'address'}],
+            'name': 'getEthBalance',
+            'outputs': [{'internalType': 'uint256', 'name': 'balance', 'type': 'uint256'}],
+            'stateMutability': 'view',
+            'type': 'function'
+        }]
 
 
 @dataclass
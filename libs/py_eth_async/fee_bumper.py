@@ -0,0 +1,184 @@
+import asyncio
+import time
+from typing import Optional, Dict, Any, Union
+
+from web3.exceptions import TimeExhausted
+
+from libs.py_eth_async.receipt_tracker import ReceiptTracker
+from data.config import logger
+
+
+class FeeBumper:
+    """
+    Class that waits for a transaction and replaces it with the same nonce and a bumped fee while it's pending and its
+        fee is below the current base fee plus its own tip. Whichever of the replacements is mined is the result.
+
+    Attributes:
+        client (Client): the Client instance.
+        enabled (bool): whether to replace pending transactions, if False it only waits for a receipt.
+        interval (float): how often the fee of a pending transaction is checked against the current one.
+        multiplier (float): the minimal fee multiplier of a replacement, nodes require at least 1.1.
+        max_bumps (int): the maximum number of replacements of one transaction.
+        max_fee_multiplier (float): the cap of the fee relative to the original transaction.
+
+    """
+    enabled: bool = True
+    interval: float = 30
+    multiplier: float = 1.15
+    max_bumps: int = 5
+    max_fee_multiplier: float = 3
+
+    def __init__(self, client) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            client (Client): the Client instance.
+
+        """
+        self.client = client
+
+    @classmethod
+    def configure(
+            cls, enabled: Optional[bool] = None, interval: Optional[float] = None, multiplier: Optional[float] = None,
+            max_bumps: Optional[int] = None, max_fee_multiplier: Optional[float] = None
+    ) -> None:
+        """
+        Change the replacement schedule of all clients.
+
+        Args:
+            enabled (Optional[bool]): whether to replace pending transactions. (not changed)
+            interval (Optional[float]): how long a transaction is pending before it's replaced. (not changed)
+            multiplier (Optional[float]): the minimal fee multiplier of a replacement. (not changed)
+            max_bumps (Optional[int]): the maximum number of replacements of one transaction. (not changed)
+            max_fee_multiplier (Optional[float]): the cap of the fee relative to the original one. (not changed)
+
+        """
+        if enabled is not None:
+            cls.enabled = enabled
+
+        if interval is not None:
+            cls.interval = interval
+
+        if multiplier is not None:
+            cls.multiplier = multiplier
+
+        if max_bumps is not None:
+            cls.max_bumps = max_bumps
+
+        if max_fee_multiplier is not None:
+            cls.max_fee_multiplier = max_fee_multiplier
+
+    async def wait(self, tx, timeout: Union[int, float] = 300) -> Dict[str, Any]:
+        """
+        Wait for a transaction receipt replacing the transaction with a bumped fee while it's pending. The 'hash',
+            'params' and 'receipt' attributes of the transaction are updated with the mined one.
+
+        Args:
+            tx (Tx): the sent transaction, its 'params' are required for replacements.
+            timeout (Union[int, float]): the receipt waiting timeout. (300 sec)
+
+        Returns:
+            Dict[str, Any]: the transaction receipt.
+
+        """
+        tracker = ReceiptTracker.for_network(self.client.network)
+        deadline = time.monotonic() + timeout
+        original_params = tx.params
+        waiters = {
+            asyncio.ensure_future(tracker.wait(tx_hash=tx.hash, timeout=timeout)): (tx.hash, tx.params)
+        }
+        bumps = 0
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                interval = self.interval if self.enabled and bumps < self.max_bumps else remaining
+                done, _ = await asyncio.wait(
+                    waiters, timeout=max(min(interval, remaining), 0), return_when=asyncio.FIRST_COMPLETED
+                )
+                for waiter in done:
+                    tx_hash, params = waiters.pop(waiter)
+                    if waiter.exception():
+                        continue
+
+                    tx.hash, tx.params, tx.receipt = tx_hash, params, waiter.result()
+                    self.client.transactions.gas_cache.record(
+                        network_name=self.client.network.name, tx_params=params, receipt=tx.receipt
+                    )
+                    return tx.receipt
+
+                if time.monotonic() >= deadline or not waiters:
+                    raise TimeExhausted(f'Transaction {tx.hash.hex()} is not in the chain after {timeout} seconds')
+
+                if not self.enabled or bumps >= self.max_bumps or not original_params:
+                    continue
+
+                try:
+                    if not await self._underpriced(params=tx.params):
+                        # The fee still covers the current base fee, a replacement would only burn more
+                        continue
+
+                    params = await self._bump(params=tx.params, original_params=original_params)
+
+                except Exception as e:
+                    # The transaction may still be mined, so fee request errors don't stop waiting for it
+                    logger.warning(f'{self.client.account.address} | failed to check the fee of {tx.hash.hex()}: {e}')
+                    continue
+
+                if not params:
+                    bumps = self.max_bumps
+                    continue
+
+                bumps += 1
+                try:
+                    signed_tx = await self.client.transactions.sign_transaction(params)
+                    tx_hash = await self.client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
+
+                except Exception as e:
+                    # E.g. 'nonce too low' if one of the previous transactions was just mined
+                    logger.warning(f'{self.client.account.address} | failed to replace {tx.hash.hex()}: {e}')
+                    continue
+
+                logger.info(f'{self.client.account.address} | {tx.hash.hex()} was replaced by {tx_hash.hex()}')
+                tx.hash, tx.params = tx_hash, params
+                waiters[asyncio.ensure_future(
+                    tracker.wait(tx_hash=tx_hash, timeout=deadline - time.monotonic())
+                )] = (tx_hash, params)
+
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def _underpriced(self, params: Dict[str, Any]) -> bool:
+        if 'maxFeePerGas' in params:
+            # Only the base fee matters, the headroom of the urgency the transaction was signed with isn't required
+            estimate = await self.client.transactions.fee_estimator.estimate()
+            return int(params['maxFeePerGas']) < estimate.base_fee.Wei + int(params.get('maxPriorityFeePerGas', 0))
+
+        return int(params['gasPrice']) < (await self.client.fees.get()).gas_price.Wei
+
+    async def _bump(self, params: Dict[str, Any], original_params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        params = params.copy()
+        if 'maxFeePerGas' in params:
+            estimate = await self.client.transactions.fee_estimator.estimate(urgency='fast')
+            cap = int(original_params['maxFeePerGas'] * self.max_fee_multiplier)
+            max_fee = min(max(int(params['maxFeePerGas'] * self.multiplier), estimate.max_fee.Wei), cap)
+            max_priority_fee = max(
+                int(params['maxPriorityFeePerGas'] * self.multiplier), estimate.max_priority_fee.Wei
+            )
+            if max_fee < int(params['maxFeePerGas'] * self.multiplier):
+                return None
+
+            params['maxPriorityFeePerGas'] = min(max_priority_fee, max_fee)
+            params['maxFeePerGas'] = max_fee
+
+        else:
+            gas_price = (await self.client.fees.get()).gas_price.Wei
+            cap = int(original_params['gasPrice'] * self.max_fee_multiplier)
+            new_gas_price = min(max(int(params['gasPrice'] * self.multiplier), gas_price), cap)
+            if new_gas_price < int(params['gasPrice'] * self.multiplier):
+                return None
+
+            params['gasPrice'] = new_gas_price
+
+        return params
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from typing import Optional, Dict
+
+from libs.pretty_utils.type_functions.classes import AutoRepr
+from web3 import Web3
+from web3.eth import AsyncEth
+
+from libs.py_eth_async.data.models import Network, Wei
+from libs.py_eth_async.providers import PooledHTTPProvider
+
+
+class FeeSnapshot(AutoRepr):
+    """
+    An instance of the network state at the latest block.
+
+    Attributes:
+        block_number (int): the latest block number.
+        base_fee (Optional[Wei]): the base fee of the latest block, None for networks without EIP-1559.
+        max_priority_fee (Optional[Wei]): the suggested max priority fee, None for networks without EIP-1559.
+        gas_price (Wei): the current gas price.
+        updated_at (float): the monotonic time of the snapshot.
+
+    """
+    block_number: int
+    base_fee: Optional[Wei]
+    max_priority_fee: Optional[Wei]
+    gas_price: Wei
+    updated_at: float
+
+    def __init__(
+            self, block_number: int, gas_price: Wei, base_fee: Optional[Wei] = None,
+            max_priority_fee: Optional[Wei] = None
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            block_number (int): the latest block number.
+            gas_price (Wei): the current gas price.
+            base_fee (Optional[Wei]): the base fee of the latest block. (None)
+            max_priority_fee (Optional[Wei]): the suggested max priority fee. (None)
+
+        """
+        self.block_number = block_number
+        self.base_fee = base_fee
+        self.max_priority_fee = max_priority_fee
+        self.gas_price = gas_price
+        self.updated_at = time.monotonic()
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.updated_at
+
+
+class FeeOracle:
+    """
+    A process-wide oracle of a network that polls the latest block and fees in the background and publishes them
+        as a snapshot shared by all clients. Polling starts on the first request and stops when nobody asked for
+        the snapshot for 'idle_timeout' seconds.
+
+    Attributes:
+        network (Network): the network.
+        w3 (Web3): a Web3 instance without a proxy.
+        poll_interval (float): how often the latest block number is checked.
+        max_age (float): how old a snapshot can be before a request refreshes it itself.
+        idle_timeout (float): how long polling continues without requests.
+        snapshot (Optional[FeeSnapshot]): the latest snapshot.
+
+    """
+    network: Network
+    w3: Web3
+    poll_interval: float
+    max_age: float
+    idle_timeout: float
+    snapshot: Optional[FeeSnapshot]
+    _oracles: Dict[str, 'FeeOracle'] = {}
+
+    def __init__(
+            self, network: Network, poll_interval: float = 3, max_age: float = 15, idle_timeout: float = 120
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            network (Network): the network.
+            poll_interval (float): how often the latest block number is checked. (3 sec)
+            max_age (float): how old a snapshot can be before a request refreshes it itself. (15 sec)
+            idle_timeout (float): how long polling continues without requests. (120 sec)
+
+        """
+        self.network = network
+        self.w3 = Web3(
+            provider=PooledHTTPProvider(endpoint_uri=network.rpc, endpoints=network.rpcs),
+            modules={'eth': (AsyncEth,)},
+            middlewares=[]
+        )
+        self.poll_interval = poll_interval
+        self.max_age = max_age
+        self.idle_timeout = idle_timeout
+        self.snapshot = None
+        self._requested_at = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def for_network(cls, network: Network) -> 'FeeOracle':
+        """
+        Get the oracle of the network, create it if it doesn't exist.
+
+        Args:
+            network (Network): the network.
+
+        Returns:
+            FeeOracle: the oracle.
+
+        """
+        if network.name not in cls._oracles:
+            cls._oracles[network.name] = cls(network=network)
+
+        return cls._oracles[network.name]
+
+    async def get(self, max_age: Optional[float] = None) -> FeeSnapshot:
+        """
+        Get the latest snapshot, refresh it if it's too old.
+
+        Args:
+            max_age (Optional[float]): how old the snapshot can be. (the 'max_age' attribute)
+
+        Returns:
+            FeeSnapshot: the snapshot.
+
+        """
+        self._requested_at = time.monotonic()
+        if not self._task or self._task.done():
+            self._task = asyncio.ensure_future(self._poll())
+
+        max_age = self.max_age if max_age is None else max_age
+        if not self.snapshot or self.snapshot.age > max_age:
+            await self.refresh(max_age=max_age)
+
+        return self.snapshot
+
+    async def refresh(self, max_age: float = 0) -> FeeSnapshot:
+        """
+        Fetch a new snapshot. Concurrent calls share one request.
+
+        Args:
+            max_age (float): a snapshot fetched by a concurrent call is returned if it isn't older than this. (0)
+
+        Returns:
+            FeeSnapshot: the snapshot.
+
+        """
+        if not self._lock:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self.snapshot and self.snapshot.age <= max_age:
+                return self.snapshot
+
+            async with self.w3.provider.batch():
+                requests = [self.w3.eth.get_block('latest'), self.w3.eth.gas_price]
+                if self.network.tx_type == 2:
+                    requests.append(self.w3.eth.max_priority_fee)
+
+                results = await asyncio.gather(*requests, return_exceptions=True)
+
+            block, gas_price = results[:2]
+            if isinstance(block, BaseException):
+                raise block
+
+            if isinstance(gas_price, BaseException):
+                raise gas_price
+
+            max_priority_fee = results[2] if len(results) > 2 else None
+            base_fee = block.get('baseFeePerGas')
+            self.snapshot = FeeSnapshot(
+                block_number=block['number'],
+                gas_price=Wei(gas_price),
+                base_fee=Wei(base_fee) if base_fee is not None else None,
+                max_priority_fee=Wei(max_priority_fee) if isinstance(max_priority_fee, int) else None
+            )
+            return self.snapshot
+
+    async def _poll(self) -> None:
+        while time.monotonic() - self._requested_at < self.idle_timeout:
+            try:
+                block_number = await self.w3.eth.block_number
+                if not self.snapshot or block_number != self.snapshot.block_number:
+                    await self.refresh()
+
+                else:
+                    self.snapshot.updated_at = time.monotonic()
+
+            except Exception:
+                pass
+
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,170 @@
+import asyncio
+from typing import Optional, List, Any, Dict, Callable, Union, Iterable
+
+from eth_typing import ChecksumAddress
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.exceptions import ContractLogicError, BadFunctionCallOutput
+from web3.contract.async_contract import AsyncContractFunction
+
+from libs.py_eth_async import exceptions
+from libs.py_eth_async.data import types
+from libs.py_eth_async.data.models import DefaultABIs, Wei, TokenAmount
+from libs.py_eth_async.token_metadata import TokenMetadataCache
+from libs.py_eth_async.utils import checksum
+
+# Errors of the contract itself, e.g. a revert or no contract at the address, unlike connection errors and timeouts
+CONTRACT_ERRORS = (ContractLogicError, BadFunctionCallOutput)
+
+
+class Multicall:
+    """
+    Class with functions that aggregate contract reads into one call of the Multicall3 contract.
+
+    Attributes:
+        client (Client): the Client instance.
+        address (ChecksumAddress): the Multicall3 contract address.
+        chunk_size (int): the maximum number of calls aggregated into one 'eth_call'.
+
+    """
+    address: ChecksumAddress = checksum('0xcA11bde05977b3631167028862bE2a173976CA11')
+    chunk_size: int = 500
+
+    def __init__(self, client) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            client (Client): the Client instance.
+
+        """
+        self.client = client
+
+    async def aggregate(self, calls: List[AsyncContractFunction], allow_failure: bool = False) -> List[Any]:
+        """
+        Make several view calls with one request.
+
+        Args:
+            calls (List[AsyncContractFunction]): contract function calls, e.g. 'contract.functions.decimals()'.
+            allow_failure (bool): if True, None is returned for failed calls, otherwise the 'ContractException'
+                error will raise. (False)
+
+        Returns:
+            List[Any]: call results in the same order, decoded like 'AsyncContractFunction.call' does.
+
+        """
+        results = []
+        for i in range(0, len(calls), self.chunk_size):
+            results += await self._aggregate_chunk(calls=calls[i:i + self.chunk_size], allow_failure=allow_failure)
+
+        return results
+
+    async def for_addresses(
+            self, function: Callable[[ChecksumAddress], AsyncContractFunction], addresses: Iterable[types.Address],
+            allow_failure: bool = True
+    ) -> Dict[ChecksumAddress, Any]:
+        """
+        Make the same view call for many addresses with as few requests as possible.
+
+        Args:
+            function (Callable[[ChecksumAddress], AsyncContractFunction]): a function that builds a call for
+                an address, e.g. 'contract.functions.balanceOf'.
+            addresses (Iterable[Address]): the addresses.
+            allow_failure (bool): if True, None is returned for failed calls, otherwise the 'ContractException'
+                error will raise. (True)
+
+        Returns:
+            Dict[ChecksumAddress, Any]: call results by address.
+
+        """
+        addresses = [checksum(address) for address in addresses]
+        results = await self.aggregate(
+            calls=[function(address) for address in addresses], allow_failure=allow_failure
+        )
+        return dict(zip(addresses, results))
+
+    async def balances(
+            self, addresses: Iterable[types.Address], token: Optional[types.Contract] = None
+    ) -> Dict[ChecksumAddress, Optional[Union[Wei, TokenAmount]]]:
+        """
+        Get coin or token balances of many addresses.
+
+        Args:
+            addresses (Iterable[Address]): the addresses.
+            token (Optional[Contract]): the contact address or instance of token. (coin)
+
+        Returns:
+            Dict[ChecksumAddress, Optional[Union[Wei, TokenAmount]]]: balances by address, None if the call failed.
+
+        """
+        if not token:
+            multicall = self.client.contracts.cache.get(address=self.address, abi=DefaultABIs.Multicall3)
+            balances = await self.for_addresses(function=multicall.functions.getEthBalance, addresses=addresses)
+            return {
+                address: Wei(balance) if balance is not None else None for address, balance in balances.items()
+            }
+
+        contract_address, abi = await self.client.contracts.get_contract_attributes(token)
+        contract = await self.client.contracts.default_token(contract_address=contract_address)
+        addresses = [checksum(address) for address in addresses]
+        decimals = await TokenMetadataCache.decimals(client=self.client, token=contract_address)
+        results = await self.aggregate(
+            calls=[contract.functions.balanceOf(address) for address in addresses], allow_failure=True
+        )
+        return {
+            address: TokenAmount(amount=balance, decimals=decimals, wei=True) if balance is not None else None
+            for address, balance in zip(addresses, results)
+        }
+
+    async def _aggregate_chunk(self, calls: List[AsyncContractFunction], allow_failure: bool) -> List[Any]:
+        multicall = self.client.contracts.cache.get(address=self.address, abi=DefaultABIs.Multicall3)
+        try:
+            responses = await multicall.functions.aggregate3(
+                [(call.address, True, call._encode_transaction_data()) for call in calls]
+            ).call()
+
+        except CONTRACT_ERRORS:
+            # Multicall3 isn't deployed or reverted, make the calls one by one. Connection errors and timeouts are
+            # raised, otherwise the fallback would multiply the load of a struggling RPC by the chunk size
+            return await self._call_separately(calls=calls, allow_failure=allow_failure)
+
+        results = []
+        for call, (success, return_data) in zip(calls, responses):
+            if success and return_data:
+                try:
+                    results.append(self._decode(call=call, return_data=return_data))
+                    continue
+
+                except Exception:
+                    pass
+
+            if not allow_failure:
+                raise exceptions.ContractException(f"The '{call.fn_name}' call to {call.address} failed!")
+
+            results.append(None)
+
+        return results
+
+    async def _call_separately(self, calls: List[AsyncContractFunction], allow_failure: bool) -> List[Any]:
+        async with self.client.batch():
+            results = await asyncio.gather(*(call.call() for call in calls), return_exceptions=True)
+
+        for call, result in zip(calls, results):
+            if isinstance(result, BaseException) and not isinstance(result, CONTRACT_ERRORS):
+                raise result
+
+            if isinstance(result, CONTRACT_ERRORS) and not allow_failure:
+                raise exceptions.ContractException(
+                    f"The '{call.fn_name}' call to {call.address} failed!"
+                ) from result
+
+        return [None if isinstance(result, CONTRACT_ERRORS) else result for result in results]
+
+    def _decode(self, call: AsyncContractFunction, return_data: bytes) -> Any:
+        output_types = get_abi_output_types(call.abi)
+        decoded = self.client.w3.codec.decode(output_types, return_data)
+        normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+        if len(normalized) == 1:
+            return normalized[0]
+
+        return normalized
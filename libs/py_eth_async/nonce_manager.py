@@ -0,0 +1,218 @@
+import asyncio
+import heapq
+import json
+import os
+import time
+from typing import Optional, Dict, Tuple, List, Set
+
+from eth_typing import ChecksumAddress
+
+from data.config import logger
+
+
+class NonceManager:
+    """
+    A process-wide manager that hands out nonces of one address in one network locally, so that several transactions
+        can be sent without waiting for receipts. It reconciles with the 'pending' transaction count of the node,
+        fills gaps left by transactions that were never broadcast or were dropped and persists the high-water mark.
+        On start the node is trusted, the persisted mark only tells how many transactions may still be in flight.
+
+    Attributes:
+        client (Client): the Client instance used for requests.
+        address (ChecksumAddress): the address.
+        reconcile_interval (float): how often the local state is compared with the node.
+        gap_timeout (float): how long the node has to report the same missing nonce before it's reused.
+        flush_delay (float): how long changes of high-water marks are collected before they're written to the file.
+
+    """
+    reconcile_interval: float = 60
+    gap_timeout: float = 60
+    flush_delay: float = 1
+    state_file: Optional[str] = None
+    _managers: Dict[Tuple[str, str], 'NonceManager'] = {}
+    _state: Optional[Dict[str, int]] = None
+    _flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def __init__(self, client, address: ChecksumAddress) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            client (Client): the Client instance used for requests.
+            address (ChecksumAddress): the address.
+
+        """
+        self.client = client
+        self.address = address
+        self._key = f'{client.network.name}:{address}'
+        self._next: Optional[int] = None
+        self._in_use: Set[int] = set()
+        self._free: List[int] = []
+        self._reconciled_at = 0.
+        self._gap: Optional[Tuple[int, float]] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def configure(cls, state_file: Optional[str] = None) -> None:
+        """
+        Set the file where high-water marks are persisted.
+
+        Args:
+            state_file (Optional[str]): the JSON file path. (not persisted)
+
+        """
+        cls.flush()
+        cls.state_file = state_file
+        cls._state = None
+
+    @classmethod
+    def for_client(cls, client) -> 'NonceManager':
+        """
+        Get the manager of the client account in the client network, create it if it doesn't exist.
+
+        Args:
+            client (Client): the Client instance.
+
+        Returns:
+            NonceManager: the manager.
+
+        """
+        key = (client.network.name, client.account.address)
+        if key not in cls._managers:
+            cls._managers[key] = cls(client=client, address=client.account.address)
+
+        return cls._managers[key]
+
+    async def next(self) -> int:
+        """
+        Hand out a nonce for a new transaction. Pass it to 'release' if the transaction isn't broadcast.
+
+        Returns:
+            int: the nonce.
+
+        """
+        if not self._lock:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._next is None or time.monotonic() - self._reconciled_at > self.reconcile_interval:
+                await self._reconcile()
+
+            if self._free:
+                nonce = heapq.heappop(self._free)
+
+            else:
+                nonce = self._next
+                self._next += 1
+                self._save()
+
+            self._in_use.add(nonce)
+            return nonce
+
+    def sent(self, nonce: int) -> None:
+        """
+        Mark the nonce as used by a broadcast transaction.
+
+        Args:
+            nonce (int): the nonce.
+
+        """
+        self._in_use.discard(nonce)
+
+    def release(self, nonce: int) -> None:
+        """
+        Return the nonce of a transaction that wasn't broadcast, it will be handed out again.
+
+        Args:
+            nonce (int): the nonce.
+
+        """
+        if nonce in self._in_use:
+            self._in_use.discard(nonce)
+            heapq.heappush(self._free, nonce)
+
+    def reset(self) -> None:
+        """
+        Forget the local state, the next nonce will be requested from the node. Call it after a 'nonce too low' error.
+        """
+        self._next = None
+        self._free.clear()
+        self._gap = None
+
+    async def _reconcile(self) -> None:
+        async with self.client.batch():
+            latest, pending = await asyncio.gather(
+                self.client.w3.eth.get_transaction_count(self.address, 'latest'),
+                self.client.w3.eth.get_transaction_count(self.address, 'pending')
+            )
+
+        if self._next is None:
+            # Nonces above 'pending' that were released or never broadcast in the last run would all be gaps, so the
+            # node is trusted and a transaction that is still in flight shows up as 'nonce too low' and a reset
+            in_flight = self._load() - pending
+            if in_flight > 0:
+                logger.info(
+                    f'{self._key} | {in_flight} transactions of the last run may still be in flight, '
+                    f'continuing from the nonce {pending} reported by the node'
+                )
+
+            self._next = pending
+
+        elif pending > self._next:
+            # Transactions were sent bypassing the manager
+            self._next = pending
+
+        self._free = [nonce for nonce in self._free if latest <= nonce < self._next]
+        heapq.heapify(self._free)
+        if pending < self._next and pending not in self._in_use and pending not in self._free:
+            # The node is missing a nonce: reuse it if it stays missing, it may be in propagation
+            if self._gap and self._gap[0] == pending and time.monotonic() - self._gap[1] > self.gap_timeout:
+                heapq.heappush(self._free, pending)
+                self._gap = None
+
+            elif not self._gap or self._gap[0] != pending:
+                self._gap = (pending, time.monotonic())
+
+        else:
+            self._gap = None
+
+        self._reconciled_at = time.monotonic()
+
+    @classmethod
+    def _read_state(cls) -> Dict[str, int]:
+        if cls._state is None:
+            cls._state = {}
+            if cls.state_file and os.path.isfile(cls.state_file):
+                try:
+                    with open(cls.state_file) as file:
+                        cls._state = json.load(file)
+
+                except (OSError, ValueError):
+                    pass
+
+        return cls._state
+
+    def _load(self) -> int:
+        return self._read_state().get(self._key, 0)
+
+    def _save(self) -> None:
+        self._read_state()[self._key] = self._next
+        if self.state_file and not self._flush_handle:
+            # Writes are debounced, so handing out many nonces doesn't rewrite the file every time
+            NonceManager._flush_handle = asyncio.get_running_loop().call_later(self.flush_delay, NonceManager.flush)
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Write pending changes of high-water marks to the file, call it before the exit.
+        """
+        if cls._flush_handle:
+            cls._flush_handle.cancel()
+            cls._flush_handle = None
+
+        if cls.state_file and cls._state is not None:
+            temp_file = f'{cls.state_file}.tmp'
+            with open(temp_file, 'w') as file:
+                json.dump(cls._state, file, indent=2)
+
+            os.replace(temp_file, cls.state_file)
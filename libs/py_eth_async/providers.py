@@ -0,0 +1,341 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import time
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Iterable
+
+import aiohttp
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from libs.pretty_utils.miscellaneous.rate_limiter import RateLimiter
+from libs.py_eth_async.rpc_pool import Endpoint, RPCPool
+from libs.py_eth_async.sessions import Sessions
+from data.config import logger
+
+_batch_window: ContextVar[float] = ContextVar('batch_window', default=0)
+
+STICKY_METHODS = {'eth_sendRawTransaction', 'eth_sendTransaction', 'eth_getTransactionCount'}
+"""Methods that are always sent to the same endpoint so that a pending nonce and a broadcast transaction agree."""
+
+
+class PooledHTTPProvider(AsyncHTTPProvider):
+    """
+    An asynchronous HTTP provider that sends requests through the sessions shared by all clients and can combine
+        requests into JSON-RPC batches. If several endpoints are given, reads go to the best healthy one and are
+        hedged to the next one when the response is late, writes stay on a sticky endpoint.
+
+    Attributes:
+        pool (RPCPool): the endpoint pool.
+        proxy (Optional[str]): an HTTP or SOCKS5 IPv4 proxy.
+        timeout (float): the request timeout.
+        batch_window (float): how long requests are collected before being sent as one batch, 0 disables implicit
+            batching.
+        batch_size (int): the maximum number of requests in one batch.
+        hedge (bool): whether to duplicate late reads to another endpoint.
+        broadcast (bool): whether to send raw transactions to all endpoints at once.
+
+    """
+    pool: RPCPool
+    proxy: Optional[str]
+    timeout: float
+    batch_window: float
+    batch_size: int
+    hedge: bool
+    broadcast: bool = False
+
+    def __init__(
+            self, endpoint_uri: str, proxy: Optional[str] = None, request_kwargs: Optional[Dict[str, Any]] = None,
+            timeout: float = 10, batch_window: float = 0, batch_size: int = 100,
+            endpoints: Optional[Iterable[str]] = None, hedge: bool = True, broadcast: Optional[bool] = None
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            endpoint_uri (str): the primary RPC URL.
+            proxy (Optional[str]): an HTTP or SOCKS5 IPv4 proxy. (None)
+            request_kwargs (Optional[Dict[str, Any]]): additional arguments for requests, e.g. 'headers'. (None)
+            timeout (float): the request timeout. (10 sec)
+            batch_window (float): how long requests are collected before being sent as one batch. (0, disabled)
+            batch_size (int): the maximum number of requests in one batch. (100)
+            endpoints (Optional[Iterable[str]]): all RPC URLs including the primary one. (only the primary one)
+            hedge (bool): whether to duplicate late reads to another endpoint. (True)
+            broadcast (Optional[bool]): whether to send raw transactions to all endpoints at once. (the class value)
+
+        """
+        super().__init__(endpoint_uri=endpoint_uri, request_kwargs=request_kwargs)
+        self.pool = RPCPool.get(urls=endpoints or [endpoint_uri])
+        self.proxy = proxy
+        self.timeout = timeout
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        self.hedge = hedge
+        if broadcast is not None:
+            self.broadcast = broadcast
+
+        self._broadcast_tasks = set()
+        self._sticky: Optional[str] = None
+        self._pending: List[Tuple[int, str, bytes, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks = set()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self.logger.debug(f'Making request HTTP. URI: {self.endpoint_uri}, Method: {method}')
+        request_data = self.encode_rpc_request(method, params)
+        window = _batch_window.get() or self.batch_window
+        if window:
+            response = await self._enqueue(method=method, request_data=request_data, window=window)
+
+        else:
+            response = self.decode_rpc_response(await self._post(request_data, methods=[method]))
+
+        self.logger.debug(f'Getting response HTTP. URI: {self.endpoint_uri}, Method: {method}, Response: {response}')
+        return response
+
+    @asynccontextmanager
+    async def batch(self, window: float = 0.01) -> AsyncIterator['PooledHTTPProvider']:
+        """
+        Combine requests made inside the block into JSON-RPC batches. Requests have to be awaited concurrently,
+            e.g. with 'asyncio.gather', to get into one batch.
+
+        Args:
+            window (float): how long requests are collected before being sent. (0.01 sec)
+
+        """
+        token = _batch_window.set(window)
+        try:
+            yield self
+
+        finally:
+            _batch_window.reset(token)
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Send collected requests immediately.
+        """
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._send_batch(pending))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _enqueue(self, method: str, request_data: bytes, window: float) -> RPCResponse:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((json.loads(request_data)['id'], method, request_data, future))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+        elif not self._flush_handle:
+            self._flush_handle = loop.call_later(window, self.flush)
+
+        return await future
+
+    async def _send_batch(self, pending: List[Tuple[int, str, bytes, asyncio.Future]]) -> None:
+        if len(pending) == 1:
+            await self._send_single(*pending[0])
+            return
+
+        try:
+            responses = self.decode_rpc_response(
+                await self._post(
+                    b'[' + b','.join(request_data for _, _, request_data, _ in pending) + b']',
+                    methods=[method for _, method, _, _ in pending]
+                )
+            )
+
+        except BaseException as e:
+            for _, _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        if not isinstance(responses, list):
+            # The endpoint doesn't support batches
+            await asyncio.gather(*(self._send_single(*request) for request in pending))
+            return
+
+        responses = {response.get('id'): response for response in responses if isinstance(response, dict)}
+        missing = []
+        for request in pending:
+            request_id, _, _, future = request
+            if future.done():
+                continue
+
+            if request_id in responses:
+                future.set_result(responses[request_id])
+
+            else:
+                missing.append(request)
+
+        if missing:
+            await asyncio.gather(*(self._send_single(*request) for request in missing))
+
+    async def _send_single(self, request_id: int, method: str, request_data: bytes, future: asyncio.Future) -> None:
+        try:
+            response = self.decode_rpc_response(await self._post(request_data, methods=[method]))
+            if not future.done():
+                future.set_result(response)
+
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+
+    async def _post(self, data: bytes, methods: Iterable[str] = ()) -> bytes:
+        """
+        Send encoded JSON-RPC data to the best endpoint.
+
+        Args:
+            data (bytes): the encoded request.
+            methods (Iterable[str]): methods of the request, they define whether it can be hedged. (none)
+
+        Returns:
+            bytes: the raw response.
+
+        """
+        methods = list(methods)
+        if self.broadcast and methods and all(method == 'eth_sendRawTransaction' for method in methods):
+            return await self._post_broadcast(data)
+
+        if any(method in STICKY_METHODS for method in methods):
+            return await self._post_sticky(data)
+
+        return await self._post_hedged(data)
+
+    async def _post_sticky(self, data: bytes) -> bytes:
+        endpoints = {endpoint.url: endpoint for endpoint in self.pool.endpoints}
+        if self._sticky not in endpoints or not endpoints[self._sticky].healthy:
+            self._sticky = self.pool.best().url
+
+        try:
+            return await self._post_to(endpoints[self._sticky], data)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if len(endpoints) == 1:
+                raise
+
+            # The request is safe to repeat: a signed transaction has the same hash on any endpoint
+            self._sticky = self.pool.best(exclude=[self._sticky]).url
+            return await self._post_to(endpoints[self._sticky], data)
+
+    async def _post_broadcast(self, data: bytes) -> bytes:
+        endpoints = {asyncio.ensure_future(self._post_to(endpoint, data)): endpoint for endpoint in self.pool.ranked()}
+        if len(endpoints) == 1:
+            return await next(iter(endpoints))
+
+        rejected = None
+        error = None
+        pending = set(endpoints)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception():
+                        error = task.exception()
+                        continue
+
+                    try:
+                        response = json.loads(task.result())
+
+                    except ValueError:
+                        response = None
+
+                    if isinstance(response, dict) and 'result' in response:
+                        logger.info(f'Transaction {response["result"]} was accepted first by {endpoints[task].url}')
+                        return task.result()
+
+                    # E.g. 'already known' from an endpoint that got the transaction from its peers
+                    rejected = rejected or task.result()
+
+            if rejected:
+                return rejected
+
+            raise error
+
+        finally:
+            # Let the other endpoints receive the transaction too
+            for task in pending:
+                self._broadcast_tasks.add(task)
+                task.add_done_callback(self._discard_broadcast_task)
+
+    def _discard_broadcast_task(self, task: asyncio.Future) -> None:
+        self._broadcast_tasks.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    async def _post_hedged(self, data: bytes) -> bytes:
+        ranked = self.pool.ranked()
+        if not self.hedge or len(ranked) == 1:
+            return await self._post_to(ranked[0], data)
+
+        # The token is taken before the hedge timer starts, so time spent queued for the rate limit doesn't make the
+        # request look late and doesn't cause a hedged request to a host that is already throttled
+        await RateLimiter.acquire(ranked[0].url)
+        tasks = [asyncio.ensure_future(self._post_to(ranked[0], data, token_acquired=True))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.pool.hedge_delay(ranked[0]))
+            if not done or tasks[0].exception():
+                tasks.append(asyncio.ensure_future(self._post_to(ranked[1], data)))
+
+            error = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.exception():
+                        return task.result()
+
+                    error = task.exception()
+
+            raise error
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _post_to(self, endpoint: Endpoint, data: bytes, token_acquired: bool = False) -> bytes:
+        """
+        Send encoded JSON-RPC data to the endpoint when the host rate limit allows and record its latency.
+
+        Args:
+            endpoint (Endpoint): the endpoint.
+            data (bytes): the encoded request.
+            token_acquired (bool): whether the rate limit token of the host is already taken. (False)
+
+        Returns:
+            bytes: the raw response.
+
+        """
+        session, proxy = Sessions.get(endpoint_uri=endpoint.url, proxy=self.proxy)
+        request_kwargs = self.get_request_kwargs()
+        request_kwargs.setdefault('timeout', aiohttp.ClientTimeout(total=self.timeout))
+        if not token_acquired:
+            await RateLimiter.acquire(endpoint.url)
+
+        started = time.monotonic()
+        try:
+            async with session.post(endpoint.url, data=data, proxy=proxy, **request_kwargs) as response:
+                response.raise_for_status()
+                content = await response.read()
+
+        except asyncio.CancelledError:
+            # The hedged request won, so this one is at least as slow as the time spent
+            endpoint.record(latency=time.monotonic() - started)
+            raise
+
+        except Exception:
+            endpoint.record(latency=time.monotonic() - started, error=True)
+            raise
+
+        endpoint.record(latency=time.monotonic() - started)
+        return content
@@ -0,0 +1,140 @@
+import asyncio
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Union
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TimeExhausted
+from web3.types import _Hash32
+
+from libs.py_eth_async.data.models import Network
+from libs.py_eth_async.fee_oracle import FeeOracle
+
+
+class ReceiptTracker:
+    """
+    A process-wide tracker of pending transactions of a network. It checks all of them with one batch of
+        'eth_getTransactionReceipt' requests per new block and resolves waiting coroutines with receipts.
+
+    Attributes:
+        network (Network): the network.
+        w3 (Web3): a Web3 instance without a proxy.
+        poll_interval (float): how often the latest block number is checked.
+        cache_size (int): how many recent receipts are kept for repeated waits.
+
+    """
+    network: Network
+    w3: Web3
+    poll_interval: float
+    cache_size: int
+    _trackers: Dict[str, 'ReceiptTracker'] = {}
+
+    def __init__(self, network: Network, poll_interval: float = 1, cache_size: int = 1024) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            network (Network): the network.
+            poll_interval (float): how often the latest block number is checked. (1 sec)
+            cache_size (int): how many recent receipts are kept for repeated waits. (1024)
+
+        """
+        self.network = network
+        self.w3 = FeeOracle.for_network(network=network).w3
+        self.poll_interval = poll_interval
+        self.cache_size = cache_size
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._waiters: Dict[str, int] = {}
+        self._receipts: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def for_network(cls, network: Network) -> 'ReceiptTracker':
+        """
+        Get the tracker of the network, create it if it doesn't exist.
+
+        Args:
+            network (Network): the network.
+
+        Returns:
+            ReceiptTracker: the tracker.
+
+        """
+        if network.name not in cls._trackers:
+            cls._trackers[network.name] = cls(network=network)
+
+        return cls._trackers[network.name]
+
+    async def wait(self, tx_hash: Union[str, _Hash32], timeout: Union[int, float] = 120) -> Dict[str, Any]:
+        """
+        Wait for a transaction receipt.
+
+        Args:
+            tx_hash (Union[str, _Hash32]): the transaction hash.
+            timeout (Union[int, float]): the receipt waiting timeout. (120 sec)
+
+        Returns:
+            Dict[str, Any]: the transaction receipt.
+
+        """
+        tx_hash = HexBytes(tx_hash).hex()
+        if tx_hash in self._receipts:
+            return self._receipts[tx_hash]
+
+        if tx_hash not in self._pending:
+            self._pending[tx_hash] = asyncio.get_running_loop().create_future()
+
+        future = self._pending[tx_hash]
+        if not self._task or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+        self._waiters[tx_hash] = self._waiters.get(tx_hash, 0) + 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+
+        except asyncio.TimeoutError:
+            raise TimeExhausted(f'Transaction {tx_hash} is not in the chain after {timeout} seconds') from None
+
+        finally:
+            self._waiters[tx_hash] -= 1
+            if not self._waiters[tx_hash]:
+                del self._waiters[tx_hash]
+                if not future.done():
+                    # Nobody waits for the transaction anymore
+                    self._pending.pop(tx_hash, None)
+                    future.cancel()
+
+    async def _run(self) -> None:
+        last_block = None
+        while self._pending:
+            try:
+                block_number = await self.w3.eth.block_number
+                if block_number != last_block:
+                    await self._check()
+                    last_block = block_number
+
+            except Exception:
+                pass
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def _check(self) -> None:
+        tx_hashes = list(self._pending)
+        async with self.w3.provider.batch():
+            receipts = await asyncio.gather(
+                *(self.w3.eth.get_transaction_receipt(tx_hash) for tx_hash in tx_hashes), return_exceptions=True
+            )
+
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            if isinstance(receipt, BaseException) or not receipt:
+                # Mostly 'TransactionNotFound', the transaction isn't mined yet
+                continue
+
+            receipt = dict(receipt)
+            self._receipts[tx_hash] = receipt
+            if len(self._receipts) > self.cache_size:
+                self._receipts.popitem(last=False)
+
+            future = self._pending.pop(tx_hash, None)
+            if future and not future.done():
+                future.set_result(receipt)
@@ -0,0 +1,186 @@
+import time
+from collections import deque
+from typing import Optional, List, Dict, Tuple, Iterable, Deque
+
+from libs.pretty_utils.type_functions.classes import AutoRepr
+
+
+class Endpoint(AutoRepr):
+    """
+    An instance of an RPC endpoint with its latency and error statistics.
+
+    Attributes:
+        url (str): the RPC URL.
+        latency (Optional[float]): the exponentially weighted moving average of the response time in seconds.
+        requests (int): the number of finished requests.
+        failures (int): the number of failed requests.
+
+    """
+    url: str
+    latency: Optional[float]
+    requests: int
+    failures: int
+
+    def __init__(self, url: str, alpha: float = 0.2, error_half_life: float = 30) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            url (str): the RPC URL.
+            alpha (float): the weight of a new sample in moving averages. (0.2)
+            error_half_life (float): how fast the error rate decays when the endpoint isn't used. (30 sec)
+
+        """
+        self.url = url
+        self.latency = None
+        self.requests = 0
+        self.failures = 0
+        self._alpha = alpha
+        self._error_half_life = error_half_life
+        self._error_rate = 0.
+        self._updated_at = time.monotonic()
+        self._samples: Deque[float] = deque(maxlen=100)
+
+    @property
+    def error_rate(self) -> float:
+        """
+        The exponentially weighted moving average of failed requests, it decays over time so that a failed endpoint
+            is tried again.
+        """
+        idle = time.monotonic() - self._updated_at
+        return self._error_rate * 0.5 ** (idle / self._error_half_life)
+
+    @property
+    def healthy(self) -> bool:
+        return self.error_rate < 0.5
+
+    @property
+    def score(self) -> float:
+        """
+        The expected response time penalized by the error rate, the lower the better.
+        """
+        return (self.latency or 0.) * (1 + 10 * self.error_rate)
+
+    def p95(self) -> Optional[float]:
+        """
+        Get the 95th percentile of recent response times.
+
+        Returns:
+            Optional[float]: the percentile or None if there are too few samples.
+
+        """
+        if len(self._samples) < 10:
+            return None
+
+        samples = sorted(self._samples)
+        return samples[int(len(samples) * 0.95) - 1]
+
+    def record(self, latency: float, error: bool = False) -> None:
+        """
+        Update statistics with a finished request.
+
+        Args:
+            latency (float): the response time in seconds.
+            error (bool): whether the request failed. (False)
+
+        """
+        self._error_rate = self.error_rate * (1 - self._alpha) + self._alpha * error
+        self._updated_at = time.monotonic()
+        self.requests += 1
+        if error:
+            self.failures += 1
+            return
+
+        self._samples.append(latency)
+        if self.latency is None:
+            self.latency = latency
+
+        else:
+            self.latency = self.latency * (1 - self._alpha) + self._alpha * latency
+
+
+class RPCPool:
+    """
+    A process-wide pool of endpoints of one network that ranks them by latency and error rate.
+
+    Attributes:
+        endpoints (List[Endpoint]): the endpoints in the configured order.
+
+    """
+    endpoints: List[Endpoint]
+    _pools: Dict[Tuple[str, ...], 'RPCPool'] = {}
+
+    def __init__(self, urls: Iterable[str]) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            urls (Iterable[str]): RPC URLs.
+
+        """
+        self.endpoints = [Endpoint(url=url) for url in urls]
+
+    @classmethod
+    def get(cls, urls: Iterable[str]) -> 'RPCPool':
+        """
+        Get a pool shared by all clients with the same endpoints.
+
+        Args:
+            urls (Iterable[str]): RPC URLs.
+
+        Returns:
+            RPCPool: the pool.
+
+        """
+        key = tuple(urls)
+        if key not in cls._pools:
+            cls._pools[key] = cls(urls=key)
+
+        return cls._pools[key]
+
+    def ranked(self) -> List[Endpoint]:
+        """
+        Get endpoints from the best to the worst: healthy ones first, then by score, then in the configured order.
+
+        Returns:
+            List[Endpoint]: the endpoints.
+
+        """
+        return [
+            endpoint for i, endpoint in sorted(
+                enumerate(self.endpoints),
+                key=lambda item: (not item[1].healthy, item[1].score, item[0])
+            )
+        ]
+
+    def best(self, exclude: Iterable[str] = ()) -> Endpoint:
+        """
+        Get the best endpoint.
+
+        Args:
+            exclude (Iterable[str]): URLs that shouldn't be returned if there are other endpoints. (None)
+
+        Returns:
+            Endpoint: the endpoint.
+
+        """
+        ranked = self.ranked()
+        return next((endpoint for endpoint in ranked if endpoint.url not in exclude), ranked[0])
+
+    def hedge_delay(self, endpoint: Endpoint, default: float = 1.) -> float:
+        """
+        Get how long to wait for a read before duplicating it to another endpoint.
+
+        Args:
+            endpoint (Endpoint): the endpoint the read was sent to.
+            default (float): the delay used until there are enough samples. (1 sec)
+
+        Returns:
+            float: the delay in seconds.
+
+        """
+        p95 = endpoint.p95()
+        if p95 is None:
+            return max(default, 2 * (endpoint.latency or 0.))
+
+        return max(p95, 0.05)
@@ -0,0 +1,209 @@
+import asyncio
+import os
+import shutil
+import sqlite3
+import time
+from typing import Optional, Dict, List, Iterable
+
+from web3 import Web3
+
+from libs.py_eth_async.utils import async_get
+
+BUNDLED_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'signatures.db')
+
+
+class SignatureDB:
+    """
+    A process-wide database of function selectors and their text signatures. The local SQLite database is searched
+        first, unknown selectors are looked up in https://www.4byte.directory/ concurrently and results are written
+        back. The bundled database is built by 'build_signatures.py' from 'data/signatures.txt' and contract ABIs.
+
+    Attributes:
+        path (str): the database file, it's copied from the bundled one if it doesn't exist.
+        concurrency (int): the maximum number of simultaneous remote lookups.
+        retries (int): the number of attempts of a remote lookup.
+        miss_ttl (float): how long a selector that is unknown to the remote database isn't looked up again.
+
+    """
+    path: str = BUNDLED_DB
+    concurrency: int = 8
+    retries: int = 3
+    miss_ttl: float = 24 * 60 * 60
+    _connection: Optional[sqlite3.Connection] = None
+    _semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def configure(
+            cls, path: Optional[str] = None, concurrency: Optional[int] = None, retries: Optional[int] = None
+    ) -> None:
+        """
+        Change the database file and lookup limits.
+
+        Args:
+            path (Optional[str]): the database file. (not changed)
+            concurrency (Optional[int]): the maximum number of simultaneous remote lookups. (not changed)
+            retries (Optional[int]): the number of attempts of a remote lookup. (not changed)
+
+        """
+        if path is not None:
+            cls.path = path
+            if cls._connection:
+                cls._connection.close()
+                cls._connection = None
+
+        if concurrency is not None:
+            cls.concurrency = concurrency
+            cls._semaphore = None
+
+        if retries is not None:
+            cls.retries = retries
+
+    @staticmethod
+    def selector(text_signature: str) -> str:
+        """
+        Calculate the selector of a function.
+
+        Args:
+            text_signature (str): a text signature, e.g. approve(address,uint256).
+
+        Returns:
+            str: the selector, e.g. 0x095ea7b3.
+
+        """
+        return Web3.keccak(text=text_signature)[:4].hex()
+
+    @classmethod
+    def find(cls, hex_signature: str) -> Optional[List[str]]:
+        """
+        Find all matching signatures in the local database.
+
+        Args:
+            hex_signature (str): a signature hash.
+
+        Returns:
+            Optional[List[str]]: matches found, an empty list if the selector is known to be missing remotely, None if
+                it wasn't looked up.
+
+        """
+        hex_signature = cls._normalize(hex_signature)
+        connection = cls._connect()
+        rows = connection.execute(
+            'SELECT text_signature FROM signatures WHERE selector = ? ORDER BY rank', (hex_signature,)
+        ).fetchall()
+        if rows:
+            return [row[0] for row in rows]
+
+        row = connection.execute('SELECT checked_at FROM misses WHERE selector = ?', (hex_signature,)).fetchone()
+        if row and time.time() - row[0] < cls.miss_ttl:
+            return []
+
+        return None
+
+    @classmethod
+    def add(cls, text_signatures: Iterable[str], hex_signature: Optional[str] = None) -> None:
+        """
+        Save text signatures to the local database.
+
+        Args:
+            text_signatures (Iterable[str]): text signatures, in the order of preference.
+            hex_signature (Optional[str]): the selector of all signatures, calculated if not specified. (None)
+
+        """
+        connection = cls._connect()
+        with connection:
+            for rank, text_signature in enumerate(text_signatures):
+                selector = cls._normalize(hex_signature) if hex_signature else cls.selector(text_signature)
+                connection.execute(
+                    'INSERT OR IGNORE INTO signatures (selector, text_signature, rank) VALUES (?, ?, ?)',
+                    (selector, text_signature, rank)
+                )
+                connection.execute('DELETE FROM misses WHERE selector = ?', (selector,))
+
+    @classmethod
+    async def lookup(cls, hex_signatures: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+        """
+        Find matching signatures of several selectors, the ones that are missing locally are requested remotely.
+
+        Args:
+            hex_signatures (Iterable[str]): signature hashes.
+
+        Returns:
+            Dict[str, Optional[List[str]]]: matches found for each selector, an empty list if it's unknown, None if the
+                remote lookup failed.
+
+        """
+        results = {}
+        unknown = []
+        for hex_signature in hex_signatures:
+            matches = cls.find(hex_signature)
+            if matches is None:
+                unknown.append(hex_signature)
+
+            else:
+                results[hex_signature] = matches
+
+        if unknown:
+            remote = await asyncio.gather(*(cls._lookup_remote(hex_signature) for hex_signature in unknown))
+            results.update(zip(unknown, remote))
+
+        return results
+
+    @classmethod
+    async def _lookup_remote(cls, hex_signature: str) -> Optional[List[str]]:
+        if not cls._semaphore:
+            cls._semaphore = asyncio.Semaphore(cls.concurrency)
+
+        async with cls._semaphore:
+            for attempt in range(cls.retries):
+                try:
+                    response = await async_get(
+                        'https://www.4byte.directory/api/v1/signatures/',
+                        params={'hex_signature': cls._normalize(hex_signature)}
+                    )
+                    results = sorted(response['results'], key=lambda result: result['created_at'])
+                    break
+
+                except Exception:
+                    await asyncio.sleep(attempt + 1)
+
+            else:
+                # Unlike a confirmed miss, a failure isn't saved, so the selector is looked up again next time
+                return None
+
+        text_signatures = [result['text_signature'] for result in results]
+        if text_signatures:
+            cls.add(text_signatures=text_signatures, hex_signature=hex_signature)
+
+        else:
+            with cls._connect() as connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO misses (selector, checked_at) VALUES (?, ?)',
+                    (cls._normalize(hex_signature), time.time())
+                )
+
+        return text_signatures
+
+    @staticmethod
+    def _normalize(hex_signature: str) -> str:
+        hex_signature = hex_signature.lower()
+        if not hex_signature.startswith('0x'):
+            hex_signature = f'0x{hex_signature}'
+
+        return hex_signature
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        if not cls._connection:
+            if not os.path.isfile(cls.path) and os.path.isfile(BUNDLED_DB):
+                os.makedirs(os.path.dirname(os.path.abspath(cls.path)), exist_ok=True)
+                shutil.copyfile(BUNDLED_DB, cls.path)
+
+            cls._connection = sqlite3.connect(cls.path)
+            cls._connection.executescript(
+                'CREATE TABLE IF NOT EXISTS signatures ('
+                'selector TEXT NOT NULL, text_signature TEXT NOT NULL, rank INTEGER NOT NULL DEFAULT 0, '
+                'PRIMARY KEY (selector, text_signature));'
+                'CREATE TABLE IF NOT EXISTS misses (selector TEXT PRIMARY KEY, checked_at REAL NOT NULL);'
+            )
+
+        return cls._connection
@@ -0,0 +1,157 @@
+import asyncio
+from typing import Optional, Dict, Tuple, Callable, Iterable
+
+from libs.pretty_utils.type_functions.classes import AutoRepr
+
+from libs.py_eth_async.data import types
+from libs.py_eth_async.utils import checksum
+
+
+class TokenMetadata(AutoRepr):
+    """
+    An instance of token metadata.
+
+    Attributes:
+        chain_id (Optional[int]): the chain ID, None if the metadata is valid in any network.
+        address (str): the checksummed token address.
+        decimals (int): the token decimals.
+        symbol (Optional[str]): the token symbol.
+        name (Optional[str]): the token name.
+
+    """
+    chain_id: Optional[int]
+    address: str
+    decimals: int
+    symbol: Optional[str]
+    name: Optional[str]
+
+    def __init__(
+            self, chain_id: Optional[int], address: str, decimals: int, symbol: Optional[str] = None,
+            name: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            chain_id (Optional[int]): the chain ID, None if the metadata is valid in any network.
+            address (str): the token address.
+            decimals (int): the token decimals.
+            symbol (Optional[str]): the token symbol. (None)
+            name (Optional[str]): the token name. (None)
+
+        """
+        self.chain_id = chain_id
+        self.address = checksum(address)
+        self.decimals = decimals
+        self.symbol = symbol
+        self.name = name
+
+
+class TokenMetadataCache:
+    """
+    A process-wide cache of token metadata. Decimals, symbols and names never change, so they're requested once per
+        token and network and optionally persisted with a callback.
+
+    """
+    _tokens: Dict[Tuple[Optional[int], str], TokenMetadata] = {}
+    _on_save: Optional[Callable[[TokenMetadata], None]] = None
+    _pending: Dict[Tuple[int, str], asyncio.Future] = {}
+
+    @classmethod
+    def configure(
+            cls, tokens: Iterable[TokenMetadata] = (), on_save: Optional[Callable[[TokenMetadata], None]] = None
+    ) -> None:
+        """
+        Add known metadata and set the function that persists requested metadata.
+
+        Args:
+            tokens (Iterable[TokenMetadata]): known metadata, e.g. loaded from a database. (empty)
+            on_save (Optional[Callable[[TokenMetadata], None]]): the function called with newly requested metadata.
+                (not persisted)
+
+        """
+        for metadata in tokens:
+            cls._tokens[(metadata.chain_id, metadata.address)] = metadata
+
+        cls._on_save = on_save
+
+    @classmethod
+    def find(cls, chain_id: int, address: str) -> Optional[TokenMetadata]:
+        """
+        Find cached metadata of a token without network requests.
+
+        Args:
+            chain_id (int): the chain ID.
+            address (str): the token address.
+
+        Returns:
+            Optional[TokenMetadata]: the metadata.
+
+        """
+        address = checksum(address)
+        return cls._tokens.get((chain_id, address)) or cls._tokens.get((None, address))
+
+    @classmethod
+    async def get(cls, client, token: types.Contract) -> TokenMetadata:
+        """
+        Get metadata of a token, request it if it isn't cached.
+
+        Args:
+            client (Client): the Client instance.
+            token (Contract): the contract address or instance of token.
+
+        Returns:
+            TokenMetadata: the metadata.
+
+        """
+        contract_address, abi = await client.contracts.get_contract_attributes(token)
+        chain_id = client.network.chain_id
+        metadata = cls.find(chain_id=chain_id, address=contract_address)
+        if metadata:
+            return metadata
+
+        key = (chain_id, contract_address)
+        if key not in cls._pending:
+            cls._pending[key] = asyncio.ensure_future(cls._request(client=client, contract_address=contract_address))
+
+        try:
+            return await asyncio.shield(cls._pending[key])
+
+        finally:
+            if cls._pending.get(key) and cls._pending[key].done():
+                del cls._pending[key]
+
+    @classmethod
+    async def decimals(cls, client, token: types.Contract) -> int:
+        """
+        Get decimals of a token, request them if they aren't cached.
+
+        Args:
+            client (Client): the Client instance.
+            token (Contract): the contract address or instance of token.
+
+        Returns:
+            int: the decimals.
+
+        """
+        return (await cls.get(client=client, token=token)).decimals
+
+    @classmethod
+    async def _request(cls, client, contract_address: str) -> TokenMetadata:
+        contract = await client.contracts.default_token(contract_address)
+        decimals, symbol, name = await client.multicall.aggregate(
+            [contract.functions.decimals(), contract.functions.symbol(), contract.functions.name()],
+            allow_failure=True
+        )
+        if decimals is None:
+            # Raise the actual error of the call
+            decimals = await contract.functions.decimals().call()
+
+        metadata = TokenMetadata(
+            chain_id=client.network.chain_id, address=contract_address, decimals=decimals, symbol=symbol, name=name
+        )
+        cls._tokens[(metadata.chain_id, metadata.address)] = metadata
+        if cls._on_save:
+            cls._on_save(metadata)
+
+        return metadata
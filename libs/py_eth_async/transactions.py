@@ -1,3 +1,5 @@
+import asyncio
+import time
 from typing import Union, Optional, Dict, Any, Tuple, List
 
 from eth_account.datastructures import SignedTransaction, SignedMessage
@@ -13,6 +15,10 @@ from libs.py_eth_async.data.models import (
     TxHistory, RawTxHistory, GWei, Wei, Ether, TokenAmount, CommonValues, CoinTx, TxArgs
 )
 from libs.py_eth_async.data.types import Web3Async
+from libs.py_eth_async.fee_bumper import FeeBumper
+from libs.py_eth_async.nonce_manager import NonceManager
+from libs.py_eth_async.receipt_tracker import ReceiptTracker
+from libs.py_eth_async.token_metadata import TokenMetadataCache
 from libs.py_eth_async.utils import api_key_required, checksum
 
 
@@ -111,20 +117,23 @@ class Tx(AutoRepr):
             self, client, timeout: Union[int, float] = 120, poll_latency: float = 0.1
     ) -> Dict[str, Any]:
         """
-        Wait for the transaction receipt.
+        Wait for the transaction receipt using the receipt tracker of the network.
 
         Args:
             client (Client): the Client instance.
             timeout (Union[int, float]): the receipt waiting timeout. (120 sec)
-            poll_latency (float): the poll latency. (0.1 sec)
+            poll_latency (float): not used, receipts are checked once per block. (0.1 sec)
 
         Returns:
             Dict[str, Any]: the transaction receipt.
 
         """
-        self.receipt = dict(await client.w3.eth.wait_for_transaction_receipt(
-            transaction_hash=self.hash, timeout=timeout, poll_latency=poll_latency
-        ))
+        self.receipt = await ReceiptTracker.for_network(client.network).wait(tx_hash=self.hash, timeout=timeout)
+        if self.params:
+            client.transactions.gas_cache.record(
+                network_name=client.network.name, tx_params=self.params, receipt=self.receipt
+            )
+
         return self.receipt
 
     async def cancel(
@@ -233,6 +242,245 @@ class Tx(AutoRepr):
         return False
 
 
+class PreparedTx(AutoRepr):
+    """
+    An instance of a signed transaction that wasn't sent yet.
+
+    Attributes:
+        params (TxParams): parameters of the transaction.
+        signed_tx (SignedTransaction): the signed transaction.
+        urgency (str): EIP-1559 fee urgency the fees were estimated with.
+        prepared_at (float): the unix time the transaction was signed.
+
+    """
+    params: TxParams
+    signed_tx: SignedTransaction
+    urgency: str
+    prepared_at: float
+
+    def __init__(self, params: TxParams, signed_tx: SignedTransaction, urgency: str = 'normal') -> None:
+        """
+        Initialize the class.
+
+        Args:
+            params (TxParams): parameters of the transaction.
+            signed_tx (SignedTransaction): the signed transaction.
+            urgency (str): EIP-1559 fee urgency the fees were estimated with. ('normal')
+
+        """
+        self.params = params
+        self.signed_tx = signed_tx
+        self.urgency = urgency
+        self.prepared_at = time.time()
+
+
+class FeeEstimate(AutoRepr):
+    """
+    An instance of EIP-1559 fee parameters.
+
+    Attributes:
+        block_number (int): the newest block the estimate is based on.
+        base_fee (Wei): the base fee of the next block.
+        max_priority_fee (Wei): the suggested max priority fee.
+        max_fee (Wei): the suggested max fee.
+
+    """
+    block_number: int
+    base_fee: Wei
+    max_priority_fee: Wei
+    max_fee: Wei
+
+    def __init__(self, block_number: int, base_fee: Wei, max_priority_fee: Wei, max_fee: Wei) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            block_number (int): the newest block the estimate is based on.
+            base_fee (Wei): the base fee of the next block.
+            max_priority_fee (Wei): the suggested max priority fee.
+            max_fee (Wei): the suggested max fee.
+
+        """
+        self.block_number = block_number
+        self.base_fee = base_fee
+        self.max_priority_fee = max_priority_fee
+        self.max_fee = max_fee
+
+
+class FeeEstimator:
+    """
+    EIP-1559 fee estimator based on priority fee percentiles of recent blocks from 'eth_feeHistory'. Estimates are
+        cached per network until a new block appears.
+
+    Attributes:
+        client (Client): the Client instance.
+        blocks (int): the number of recent blocks to take into account.
+        percentiles (Dict[str, int]): the priority fee percentile by urgency.
+        base_fee_multipliers (Dict[str, float]): the base fee headroom in the max fee by urgency.
+
+    """
+    blocks: int = 20
+    percentiles: Dict[str, int] = {'slow': 10, 'normal': 50, 'fast': 90}
+    base_fee_multipliers: Dict[str, float] = {'slow': 1.125, 'normal': 1.25, 'fast': 1.5}
+    _cache: Dict[str, Tuple[int, Dict[str, FeeEstimate]]] = {}
+    _locks: Dict[str, asyncio.Lock] = {}
+
+    def __init__(self, client) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            client (Client): the Client instance.
+
+        """
+        self.client = client
+
+    async def estimate(self, urgency: str = 'normal') -> FeeEstimate:
+        """
+        Get EIP-1559 fee parameters for the next block.
+
+        Args:
+            urgency (str): either 'slow', 'normal' or 'fast'. ('normal')
+
+        Returns:
+            FeeEstimate: the fee parameters.
+
+        """
+        if urgency not in self.percentiles:
+            raise exceptions.TransactionException(f"Unknown urgency '{urgency}', use one of {list(self.percentiles)}!")
+
+        network = self.client.network.name
+        snapshot = await self.client.fees.get()
+        # Estimates are keyed by the block of the snapshot they were calculated for rather than by the block of the
+        # fee history, which may come from a lagging endpoint and would never catch up with the snapshot
+        cached = self._cache.get(network)
+        if not cached or cached[0] < snapshot.block_number:
+            if network not in self._locks:
+                self._locks[network] = asyncio.Lock()
+
+            async with self._locks[network]:
+                cached = self._cache.get(network)
+                if not cached or cached[0] < snapshot.block_number:
+                    cached = (snapshot.block_number, await self._fetch(snapshot=snapshot))
+                    self._cache[network] = cached
+
+        return cached[1][urgency]
+
+    async def _fetch(self, snapshot) -> Dict[str, FeeEstimate]:
+        try:
+            history = await self.client.w3.eth.fee_history(
+                self.blocks, 'latest', list(self.percentiles.values())
+            )
+            block_number = history['oldestBlock'] + len(history['reward']) - 1
+            base_fee = history['baseFeePerGas'][-1]
+            rewards = [reward for reward in history['reward'] if any(reward)]
+
+        except Exception:
+            # The node doesn't support 'eth_feeHistory', fall back to the oracle snapshot
+            block_number = snapshot.block_number
+            base_fee = snapshot.base_fee.Wei if snapshot.base_fee is not None else snapshot.gas_price.Wei
+            rewards = []
+
+        estimates = {}
+        for i, (urgency, percentile) in enumerate(self.percentiles.items()):
+            if rewards:
+                max_priority_fee = sorted(reward[i] for reward in rewards)[len(rewards) // 2]
+
+            elif snapshot.max_priority_fee is not None:
+                max_priority_fee = snapshot.max_priority_fee.Wei
+
+            else:
+                max_priority_fee = 0
+
+            estimates[urgency] = FeeEstimate(
+                block_number=block_number,
+                base_fee=Wei(base_fee),
+                max_priority_fee=Wei(max_priority_fee),
+                max_fee=Wei(int(base_fee * self.base_fee_multipliers[urgency]) + max_priority_fee)
+            )
+
+        return estimates
+
+
+class GasCache:
+    """
+    Process-wide cache of gas limits keyed by network, destination contract and 4-byte selector. It's fed with
+        'gasUsed' of successful receipts, so repeated calls don't need 'eth_estimateGas'.
+
+    Attributes:
+        min_samples (int): how many receipts are required before the cache is used.
+        max_samples (int): how many recent receipts are kept per key.
+        margin (float): the multiplier of the highest observed 'gasUsed'.
+
+    """
+    min_samples: int = 3
+    max_samples: int = 20
+    margin: float = 1.2
+    _samples: Dict[Tuple[str, str, str], List[int]] = {}
+
+    @staticmethod
+    def key(network_name: str, tx_params: TxParams) -> Optional[Tuple[str, str, str]]:
+        """
+        Get the cache key of a transaction.
+
+        Args:
+            network_name (str): the network name.
+            tx_params (TxParams): parameters of the transaction.
+
+        Returns:
+            Optional[Tuple[str, str, str]]: the key or None if the transaction has no recipient.
+
+        """
+        if not tx_params.get('to'):
+            return None
+
+        data = tx_params.get('data') or '0x'
+        if not isinstance(data, str):
+            data = HexBytes(data).hex()
+
+        return network_name, str(tx_params['to']).lower(), data[:10].lower()
+
+    def get(self, network_name: str, tx_params: TxParams) -> Optional[Wei]:
+        """
+        Get a cached gas limit of a transaction.
+
+        Args:
+            network_name (str): the network name.
+            tx_params (TxParams): parameters of the transaction.
+
+        Returns:
+            Optional[Wei]: the gas limit or None if there are too few observations.
+
+        """
+        samples = self._samples.get(self.key(network_name=network_name, tx_params=tx_params))
+        if not samples or len(samples) < self.min_samples:
+            return None
+
+        return Wei(int(max(samples) * self.margin))
+
+    def record(self, network_name: str, tx_params: TxParams, receipt: Dict[str, Any]) -> None:
+        """
+        Feed the cache with a receipt. A reverted transaction drops the observations of its key.
+
+        Args:
+            network_name (str): the network name.
+            tx_params (TxParams): parameters of the transaction.
+            receipt (Dict[str, Any]): the transaction receipt.
+
+        """
+        key = self.key(network_name=network_name, tx_params=tx_params)
+        if not key:
+            return
+
+        if receipt.get('status') != 1:
+            self._samples.pop(key, None)
+            return
+
+        samples = self._samples.setdefault(key, [])
+        samples.append(int(receipt['gasUsed']))
+        del samples[:-self.max_samples]
+
+
 class Transactions:
     """
     Class with functions related to transactions.
@@ -251,6 +499,16 @@ class Transactions:
 
         """
         self.client = client
+        self.fee_estimator = FeeEstimator(client)
+        self.gas_cache = GasCache()
+        self.fee_bumper = FeeBumper(client)
+
+    @property
+    def nonces(self) -> NonceManager:
+        """
+        The nonce manager of the imported account in the client network.
+        """
+        return NonceManager.for_client(self.client)
 
     @staticmethod
     async def current_gas_price(w3: Web3Async) -> Wei:
@@ -300,6 +558,23 @@ class Transactions:
         """
         return Wei(await w3.eth.estimate_gas(transaction=tx_params))
 
+    async def gas_limit(self, tx_params: TxParams) -> Wei:
+        """
+        Get the gas limit for a transaction from the gas cache, estimate it if the cache has no value.
+
+        Args:
+            tx_params (TxParams): parameters of the transaction.
+
+        Returns:
+            Wei: the gas limit.
+
+        """
+        gas_limit = self.gas_cache.get(network_name=self.client.network.name, tx_params=tx_params)
+        if gas_limit:
+            return gas_limit
+
+        return await self.estimate_gas(w3=self.client.w3, tx_params=tx_params)
+
     @staticmethod
     async def decode_input_data(
             client, contract: types.Contract, input_data: Optional[str] = None, tx_hash: Optional[_Hash32] = None
@@ -332,13 +607,14 @@ class Transactions:
         function_instance, input_data = contract.decode_function_input(input_data)
         return function_instance.function_identifier, input_data
 
-    async def auto_add_params(self, tx_params: TxParams) -> TxParams:
+    async def auto_add_params(self, tx_params: TxParams, urgency: str = 'normal') -> TxParams:
         """
         Add 'chainId', 'nonce', 'from', 'gasPrice' or 'maxFeePerGas' + 'maxPriorityFeePerGas' and 'gas' parameters to
             transaction parameters if they are missing.
 
         Args:
             tx_params (TxParams): parameters of the transaction.
+            urgency (str): EIP-1559 fee urgency, either 'slow', 'normal' or 'fast'. ('normal')
 
         Returns:
             TxParams: parameters of the transaction with added values.
@@ -347,29 +623,66 @@ class Transactions:
         if 'chainId' not in tx_params:
             tx_params['chainId'] = self.client.network.chain_id
 
-        if 'nonce' not in tx_params:
-            tx_params['nonce'] = await self.client.wallet.nonce()
-
         if 'from' not in tx_params:
             tx_params['from'] = self.client.account.address
 
-        if 'gasPrice' not in tx_params and 'maxFeePerGas' not in tx_params:
-            gas_price = (await self.gas_price(w3=self.client.w3)).Wei
-            if self.client.network.tx_type == 2:
-                tx_params['maxFeePerGas'] = gas_price
+        no_fee = 'gasPrice' not in tx_params and 'maxFeePerGas' not in tx_params
+        eip1559 = 'maxFeePerGas' in tx_params or (no_fee and self.client.network.tx_type == 2)
+        estimate_eip1559 = no_fee and eip1559
+        need_gas_price = not estimate_eip1559 and (
+                no_fee or ('gasPrice' in tx_params and not int(tx_params['gasPrice']))
+        )
+        need_max_priority_fee = not estimate_eip1559 and eip1559 and 'maxPriorityFeePerGas' not in tx_params
+        requests = {}
+        if 'nonce' not in tx_params:
+            requests['nonce'] = self.nonces.next()
 
-            else:
-                tx_params['gasPrice'] = gas_price
+        if estimate_eip1559:
+            requests['estimate'] = self.fee_estimator.estimate(urgency=urgency)
+
+        elif need_gas_price or need_max_priority_fee:
+            requests['fees'] = self.client.fees.get()
 
-        elif 'gasPrice' in tx_params and not int(tx_params['gasPrice']):
-            tx_params['gasPrice'] = (await self.gas_price(w3=self.client.w3)).Wei
+        async with self.client.batch():
+            results = dict(zip(requests, await asyncio.gather(*requests.values(), return_exceptions=True)))
 
-        if 'maxFeePerGas' in tx_params and 'maxPriorityFeePerGas' not in tx_params:
-            tx_params['maxPriorityFeePerGas'] = (await self.max_priority_fee(w3=self.client.w3)).Wei
-            tx_params['maxFeePerGas'] = tx_params['maxFeePerGas'] + tx_params['maxPriorityFeePerGas']
+        nonce = results.get('nonce')
+        if isinstance(nonce, BaseException):
+            nonce = None
 
-        if 'gas' not in tx_params or not int(tx_params['gas']):
-            tx_params['gas'] = (await self.estimate_gas(w3=self.client.w3, tx_params=tx_params)).Wei
+        try:
+            for result in results.values():
+                if isinstance(result, BaseException):
+                    raise result
+
+            if nonce is not None:
+                tx_params['nonce'] = nonce
+
+            if estimate_eip1559:
+                tx_params['maxPriorityFeePerGas'] = results['estimate'].max_priority_fee.Wei
+                tx_params['maxFeePerGas'] = results['estimate'].max_fee.Wei
+
+            if need_gas_price:
+                if eip1559:
+                    tx_params['maxFeePerGas'] = results['fees'].gas_price.Wei
+
+                else:
+                    tx_params['gasPrice'] = results['fees'].gas_price.Wei
+
+            if need_max_priority_fee:
+                max_priority_fee = results['fees'].max_priority_fee or await self.max_priority_fee(w3=self.client.w3)
+                tx_params['maxPriorityFeePerGas'] = max_priority_fee.Wei
+                tx_params['maxFeePerGas'] = tx_params['maxFeePerGas'] + tx_params['maxPriorityFeePerGas']
+
+            if 'gas' not in tx_params or not int(tx_params['gas']):
+                tx_params['gas'] = (await self.gas_limit(tx_params=tx_params)).Wei
+
+        except BaseException:
+            # Any failure before the transaction is built returns the nonce, otherwise it'd be a gap forever
+            if nonce is not None:
+                self.nonces.release(nonce)
+
+            raise
 
         return tx_params
 
@@ -407,21 +720,107 @@ class Transactions:
             encode_defunct(text=message), private_key=self.client.account.key
         )
 
-    async def sign_and_send(self, tx_params: TxParams) -> Tx:
+    async def sign_and_send(self, tx_params: TxParams, urgency: str = 'normal') -> Tx:
         """
         Sign and send a transaction. Additionally, add 'chainId', 'nonce', 'from', 'gasPrice' or
             'maxFeePerGas' + 'maxPriorityFeePerGas' and 'gas' parameters to transaction parameters if they are missing.
 
         Args:
             tx_params (TxParams): parameters of the transaction.
+            urgency (str): EIP-1559 fee urgency, either 'slow', 'normal' or 'fast'. ('normal')
 
         Returns:
             Tx: the instance of the sent transaction.
 
         """
-        await self.auto_add_params(tx_params=tx_params)
-        signed_tx = await self.sign_transaction(tx_params)
-        tx_hash = await self.client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
+        await self.auto_add_params(tx_params=tx_params, urgency=urgency)
+        try:
+            signed_tx = await self.sign_transaction(tx_params)
+
+        except BaseException:
+            self.nonces.release(tx_params['nonce'])
+            raise
+
+        return await self._send_signed(tx_params=tx_params, signed_tx=signed_tx)
+
+    async def prepare(self, tx_params: TxParams, urgency: str = 'normal') -> PreparedTx:
+        """
+        Fill in missing parameters and sign a transaction without sending it. The nonce stays reserved until
+            the transaction is sent with 'send_prepared' or returned with 'discard_prepared'.
+
+        Args:
+            tx_params (TxParams): parameters of the transaction.
+            urgency (str): EIP-1559 fee urgency, either 'slow', 'normal' or 'fast'. ('normal')
+
+        Returns:
+            PreparedTx: the signed transaction.
+
+        """
+        await self.auto_add_params(tx_params=tx_params, urgency=urgency)
+        try:
+            signed_tx = await self.sign_transaction(tx_params)
+
+        except BaseException:
+            self.nonces.release(tx_params['nonce'])
+            raise
+
+        return PreparedTx(params=tx_params, signed_tx=signed_tx, urgency=urgency)
+
+    async def send_prepared(self, prepared_tx: PreparedTx, max_overpay: float = 1.5) -> Tx:
+        """
+        Send a prepared transaction. It's re-signed with the same nonce and current fees if the signed fee is too
+            low to be included or much higher than needed.
+
+        Args:
+            prepared_tx (PreparedTx): the signed transaction.
+            max_overpay (float): how many times the signed fee can exceed the current one. (1.5)
+
+        Returns:
+            Tx: the instance of the sent transaction.
+
+        """
+        tx_params = prepared_tx.params
+        if 'maxFeePerGas' in tx_params:
+            estimate = await self.fee_estimator.estimate(urgency=prepared_tx.urgency)
+            required = estimate.base_fee.Wei + estimate.max_priority_fee.Wei
+            if not required <= tx_params['maxFeePerGas'] <= estimate.max_fee.Wei * max_overpay:
+                tx_params['maxPriorityFeePerGas'] = estimate.max_priority_fee.Wei
+                tx_params['maxFeePerGas'] = estimate.max_fee.Wei
+                prepared_tx.signed_tx = await self.sign_transaction(tx_params)
+
+        else:
+            gas_price = (await self.client.fees.get()).gas_price.Wei
+            if not gas_price <= tx_params['gasPrice'] <= gas_price * max_overpay:
+                tx_params['gasPrice'] = gas_price
+                prepared_tx.signed_tx = await self.sign_transaction(tx_params)
+
+        return await self._send_signed(tx_params=tx_params, signed_tx=prepared_tx.signed_tx)
+
+    def discard_prepared(self, prepared_tx: PreparedTx) -> None:
+        """
+        Return the nonce of a prepared transaction that won't be sent.
+
+        Args:
+            prepared_tx (PreparedTx): the signed transaction.
+
+        """
+        self.nonces.release(prepared_tx.params['nonce'])
+
+    async def _send_signed(self, tx_params: TxParams, signed_tx: SignedTransaction) -> Tx:
+        try:
+            tx_hash = await self.client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
+
+        except BaseException as e:
+            if any(error in str(e).lower() for error in ('nonce too low', 'replacement transaction underpriced')):
+                # The nonce is taken by a mined or an in-flight transaction
+                self.nonces.reset()
+
+            else:
+                self.nonces.release(tx_params['nonce'])
+
+            raise
+
+        self.nonces.sent(tx_params['nonce'])
         return Tx(tx_hash=tx_hash, params=tx_params)
 
     @api_key_required
@@ -524,29 +923,30 @@ class Transactions:
         if not owner:
             owner = self.client.account.address
 
-        return TokenAmount(
-            amount=await contract.functions.allowance(checksum(owner), checksum(spender)).call(),
-            decimals=await contract.functions.decimals().call(), wei=True
-        )
+        async with self.client.batch():
+            amount, decimals = await asyncio.gather(
+                contract.functions.allowance(checksum(owner), checksum(spender)).call(),
+                TokenMetadataCache.decimals(client=self.client, token=contract_address)
+            )
+
+        return TokenAmount(amount=amount, decimals=decimals, wei=True)
 
     async def wait_for_receipt(
             self, tx_hash: Union[str, _Hash32], timeout: Union[int, float] = 120, poll_latency: float = 0.1
     ) -> Dict[str, Any]:
         """
-        Wait for a transaction receipt.
+        Wait for a transaction receipt using the receipt tracker of the network.
 
         Args:
             tx_hash (Union[str, _Hash32]): the transaction hash.
             timeout (Union[int, float]): the receipt waiting timeout. (120)
-            poll_latency (float): the poll latency. (0.1 sec)
+            poll_latency (float): not used, receipts are checked once per block. (0.1 sec)
 
         Returns:
             Dict[str, Any]: the transaction receipt.
 
         """
-        return dict(await self.client.w3.eth.wait_for_transaction_receipt(
-            transaction_hash=tx_hash, timeout=timeout, poll_latency=poll_latency
-        ))
+        return await ReceiptTracker.for_network(self.client.network).wait(tx_hash=tx_hash, timeout=timeout)
 
     async def send(
             self, token: types.Contract, recipient: types.Address, amount: types.Amount = 999_999_999_999_999,
@@ -562,7 +962,7 @@ class Transactions:
             amount (Amount): an amount to send. (entire balance)
             gas_price (Optional[GasPrice]): the gas price in GWei. (parsed from the network)
             gas_limit (Optional[GasLimit]): the gas limit in Wei. (parsed from the network)
-            nonce (Optional[int]): a nonce of the sender address. (get it using the 'nonce' function)
+            nonce (Optional[int]): a nonce of the sender address. (handed out by the nonce manager)
             check_gas_price (bool): if True and the gas price is higher than that specified in the 'gas_price'
                 argument, the 'GasPriceTooHigh' error will raise. (False)
             dry_run (bool): if True, it creates a parameter dictionary, but doesn't send the transaction. (False)
@@ -580,7 +980,8 @@ class Transactions:
 
         if isinstance(amount, (int, float)):
             if contract:
-                amount = TokenAmount(amount=amount, decimals=await contract.functions.decimals().call())
+                decimals = await TokenMetadataCache.decimals(client=self.client, token=contract_address)
+                amount = TokenAmount(amount=amount, decimals=decimals)
 
             else:
                 amount = Ether(amount=amount)
@@ -598,14 +999,13 @@ class Transactions:
         if check_gas_price and current_gas_price > gas_price:
             raise exceptions.GasPriceTooHigh()
 
-        if not nonce:
-            nonce = await self.client.wallet.nonce()
-
         tx_params = {
             'chainId': self.client.network.chain_id,
-            'nonce': nonce,
             'from': self.client.account.address
         }
+        if nonce:
+            tx_params['nonce'] = nonce
+
         if self.client.network.tx_type == 2:
             tx_params['maxPriorityFeePerGas'] = (await self.client.transactions.max_priority_fee(w3=self.client.w3)).Wei
             tx_params['maxFeePerGas'] = gas_price.Wei + tx_params['maxPriorityFeePerGas']
@@ -669,7 +1069,7 @@ class Transactions:
             amount (Optional[Amount]): an amount to approve. (infinity)
             gas_price (Optional[GasPrice]): the gas price in GWei. (parsed from the network)
             gas_limit (Optional[GasLimit]): the gas limit in Wei. (parsed from the network)
-            nonce (Optional[int]): a nonce of the sender address. (get it using the 'nonce' function)
+            nonce (Optional[int]): a nonce of the sender address. (handed out by the nonce manager)
             check_gas_price (bool): if True and the gas price is higher than that specified in the 'gas_price'
                 argument, the 'GasPriceTooHigh' error will raise. (False)
 
@@ -683,7 +1083,8 @@ class Transactions:
             amount = CommonValues.InfinityInt
 
         elif isinstance(amount, (int, float)):
-            amount = TokenAmount(amount=amount, decimals=await contract.functions.decimals().call()).Wei
+            decimals = await TokenMetadataCache.decimals(client=self.client, token=contract_address)
+            amount = TokenAmount(amount=amount, decimals=decimals).Wei
 
         else:
             amount = amount.Wei
@@ -700,16 +1101,15 @@ class Transactions:
         if check_gas_price and current_gas_price > gas_price:
             raise exceptions.GasPriceTooHigh()
 
-        if not nonce:
-            nonce = await self.client.wallet.nonce()
-
         tx_params = {
             'chainId': self.client.network.chain_id,
-            'nonce': nonce,
             'from': self.client.account.address,
             'to': contract.address,
             'data': contract.encodeABI('approve', args=TxArgs(spender=spender, amount=amount).tuple())
         }
+        if nonce:
+            tx_params['nonce'] = nonce
+
         if self.client.network.tx_type == 2:
             tx_params['maxPriorityFeePerGas'] = (await self.client.transactions.max_priority_fee(w3=self.client.w3)).Wei
             tx_params['maxFeePerGas'] = gas_price.Wei + tx_params['maxPriorityFeePerGas']
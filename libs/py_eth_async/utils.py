@@ -1,10 +1,12 @@
 from typing import Union, Optional, Dict, Any
+from urllib.parse import urlparse
 
-import aiohttp
 from eth_typing import ChecksumAddress
 from eth_utils import to_checksum_address
 
+from libs.pretty_utils.miscellaneous.rate_limiter import RateLimiter
 from libs.py_eth_async import exceptions
+from libs.py_eth_async.sessions import Sessions
 
 
 def api_key_required(func):
@@ -66,7 +68,8 @@ def aiohttp_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Union
 
 async def async_get(url: str, headers: Optional[dict] = None, **kwargs) -> Optional[dict]:
     """
-    Make a GET request and check if it was successful.
+    Make a GET request when the host rate limit allows and check if it was successful. Requests to the same host share
+        a session and its keep-alive connections.
 
     Args:
         url (str): a URL.
@@ -77,14 +80,16 @@ async def async_get(url: str, headers: Optional[dict] = None, **kwargs) -> Optio
         Optional[dict]: received dictionary in response.
 
     """
-    async with aiohttp.ClientSession(headers=headers) as session:
-        async with session.get(url=url, **kwargs) as response:
-            status_code = response.status
-            response = await response.json()
-            if status_code <= 201:
-                return response
-
-            raise exceptions.HTTPException(response=response, status_code=status_code)
+    await RateLimiter.acquire(url)
+    parsed_url = urlparse(url)
+    session, _ = Sessions.get(endpoint_uri=f'{parsed_url.scheme}://{parsed_url.netloc}')
+    async with session.get(url=url, headers=headers, **kwargs) as response:
+        status_code = response.status
+        response = await response.json()
+        if status_code <= 201:
+            return response
+
+        raise exceptions.HTTPException(response=response, status_code=status_code)
 
 
 async def get_coin_symbol(chain_id: Union[int, str]) -> str:
@@ -4,6 +4,7 @@ import asyncio
 
 from libs.py_eth_async.data import types
 from libs.py_eth_async.data.models import Wei, TokenAmount
+from libs.py_eth_async.token_metadata import TokenMetadataCache
 from libs.py_eth_async.utils import checksum
 from data.config import logger
 
@@ -55,10 +56,13 @@ class Wallet:
 
         contract_address, abi = await self.client.contracts.get_contract_attributes(token)
         contract = await self.client.contracts.default_token(contract_address=contract_address)
-        return TokenAmount(
-            amount=await contract.functions.balanceOf(address).call(),
-            decimals=await contract.functions.decimals().call(), wei=True
-        )
+        async with self.client.batch():
+            amount, decimals = await asyncio.gather(
+                contract.functions.balanceOf(address).call(),
+                TokenMetadataCache.decimals(client=self.client, token=contract_address)
+            )
+
+        return TokenAmount(amount=amount, decimals=decimals, wei=True)
 
     async def nonce(self, address: Optional[types.Contract] = None) -> int:
         """
@@ -8,6 +8,7 @@ from urllib.parse import urlencode
 from aiohttp import TCPConnector
 from aiohttp_socks import ProxyConnector
 
+from libs.pretty_utils.miscellaneous.rate_limiter import RateLimiter
 from libs.py_okx_async import exceptions
 from libs.py_okx_async.models import OKXCredentials, Methods
 from libs.py_okx_async.utils import async_get, async_post
@@ -117,6 +118,7 @@ class Base:
             'OK-ACCESS-TIMESTAMP': timestamp,
             'OK-ACCESS-PASSPHRASE': self.__credentials.passphrase
         }
+        await RateLimiter.acquire(url)
         if method == Methods.POST:
             response = await async_post(
                 url=url, headers=header, connector=self.connector,
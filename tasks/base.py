@@ -7,15 +7,16 @@ from loguru import logger
 
 from hexbytes import HexBytes
 from web3 import Web3
-from web3.exceptions import ContractCustomError, ContractLogicError, TransactionNotFound
+from web3.exceptions import ContractCustomError, ContractLogicError, TimeExhausted
 from fake_useragent import UserAgent
 from typing import Optional, Union, Dict, Any
-from web3.middleware import geth_poa_middleware
 
 from libs.py_eth_async.client import Client
 from aiohttp_proxy import ProxyConnector
 from libs.pretty_utils.type_functions.floats import randfloat
-from libs.py_eth_async.data.models import TxArgs, Ether, Wei, Unit, TokenAmount
+from libs.pretty_utils.miscellaneous.rate_limiter import RateLimiter
+from libs.py_eth_async.data.models import TxArgs, Ether, Wei, Unit, TokenAmount, Network
+from libs.py_eth_async.transactions import PreparedTx, Tx
 
 # from data.config import logger
 from data.models import Settings, SwapInfo
@@ -47,6 +48,12 @@ CHAIN_SHORT_NAME = 'scroll'
 class Base:
     def __init__(self, client: Client):
         self.client = client
+        self.prepared_tx: Optional[PreparedTx] = None
+        self.prepared_dest_chain: Optional[Network] = None
+
+    async def prepare(self) -> None:
+        """Do the slow part of the next action in advance, e.g. pick the destination chain and sign the first tx."""
+        pass
 
     async def get_decimals(self, contract_address: str) -> int:
         contract = await self.client.contracts.default_token(contract_address=contract_address)
@@ -70,7 +77,7 @@ class Base:
         return False
 
     async def submit_transaction(self, tx_params, test=False):
-        gas = await self.client.transactions.estimate_gas(w3=self.client.w3, tx_params=tx_params)
+        gas = await self.client.transactions.gas_limit(tx_params=tx_params)
 
         tx_params['gas'] = gas.Wei
 
@@ -79,7 +86,26 @@ class Base:
             return "test", "test"
         else:
             tx = await self.client.transactions.sign_and_send(tx_params=tx_params)
-            return await tx.wait_for_receipt(client=self.client, timeout=300), tx.hash.hex()
+            return await self.client.transactions.fee_bumper.wait(tx=tx, timeout=300), tx.hash.hex()
+
+    async def send(self, tx_params) -> Tx:
+        """Estimate gas and send a transaction without waiting for its receipt."""
+        tx_params['gas'] = (await self.client.transactions.gas_limit(tx_params=tx_params)).Wei
+        return await self.client.transactions.sign_and_send(tx_params=tx_params)
+
+    async def send_prepared(self) -> Tx:
+        """Send the prepared transaction without waiting for its receipt."""
+        prepared_tx, self.prepared_tx = self.prepared_tx, None
+        return await self.client.transactions.send_prepared(prepared_tx=prepared_tx)
+
+    async def confirm(self, tx: Tx, timeout=300) -> bool:
+        """Wait for a sent transaction replacing it while it's pending, the hash of the mined one is set to the tx."""
+        try:
+            receipt = await self.client.transactions.fee_bumper.wait(tx=tx, timeout=timeout)
+        except TimeExhausted:
+            logger.exception(f'{self.client.account.address} получил неудачную транзакцию')
+            return False
+        return receipt.get('status') == 1
 
     async def base_swap_eth_to_token(
             self,
@@ -418,6 +444,7 @@ class Base:
             'limit': limit,
             'page': page
         }
+        await RateLimiter.acquire(url)
         async with aiohttp.ClientSession() as session:
             async with await session.get(
                     url + '/api/v5/explorer/address/transaction-list',
@@ -479,29 +506,6 @@ class Base:
                 txs[tx.get('hash')] = tx
         return txs
 
-    @staticmethod
-    async def get_max_priority_fee_per_gas(w3: Web3, block: dict) -> int:
-        block_number = block['number']
-        latest_block_transaction_count = w3.eth.get_block_transaction_count(block_number)
-        max_priority_fee_per_gas_lst = []
-
-        for i in range(latest_block_transaction_count):
-            try:
-                transaction = w3.eth.get_transaction_by_block(block_number, i)
-                if 'maxPriorityFeePerGas' in transaction:
-                    max_priority_fee_per_gas_lst.append(transaction['maxPriorityFeePerGas'])
-
-            except Exception:
-                continue
-
-        if not max_priority_fee_per_gas_lst:
-            max_priority_fee_per_gas = w3.eth.max_priority_fee
-        else:
-            max_priority_fee_per_gas_lst.sort()
-            max_priority_fee_per_gas = max_priority_fee_per_gas_lst[len(max_priority_fee_per_gas_lst) // 2]
-
-        return max_priority_fee_per_gas
-
     @staticmethod
     async def get_base_fee(w3: Web3, increase_gas: float = 1.):
         last_block = await w3.eth.get_block('latest')
@@ -523,31 +527,29 @@ class Base:
             increase_gas=1.1,
             value=None,
             max_priority_fee_per_gas: Optional[int] = None,
-            max_fee_per_gas: Optional[int] = None
+            max_fee_per_gas: Optional[int] = None,
+            urgency: str = 'normal'
     ):
         if not from_:
             from_ = client.account.address
 
         tx_params = {
             'chainId': await client.w3.eth.chain_id,
-            'nonce': await client.w3.eth.get_transaction_count(client.account.address),
             'from': Web3.to_checksum_address(from_),
             'to': Web3.to_checksum_address(to),
             'data': data,
         }
 
         if client.network.tx_type == 2:
-            w3 = Web3(provider=Web3.HTTPProvider(endpoint_uri=client.network.rpc))
-            w3.middleware_onion.inject(geth_poa_middleware, layer=0)
-
-            last_block = w3.eth.get_block('latest')
-
+            estimate = await client.transactions.fee_estimator.estimate(urgency=urgency)
             if not max_priority_fee_per_gas:
-                max_priority_fee_per_gas = await Base.get_max_priority_fee_per_gas(w3=w3, block=last_block)
+                max_priority_fee_per_gas = estimate.max_priority_fee.Wei
 
             if not max_fee_per_gas:
-                base_fee = int(last_block['baseFeePerGas'] * 1.125)
-                max_fee_per_gas = base_fee + max_priority_fee_per_gas
+                # The max fee of the urgency, raised by the priority fee if it's higher than the estimated one
+                max_fee_per_gas = estimate.max_fee.Wei + max(
+                    max_priority_fee_per_gas - estimate.max_priority_fee.Wei, 0
+                )
             tx_params['maxPriorityFeePerGas'] = max_priority_fee_per_gas
             tx_params['maxFeePerGas'] = max_fee_per_gas
 
@@ -557,15 +559,33 @@ class Base:
         if value:
             tx_params['value'] = value
 
+        # The nonce is taken after the fee requests, so their errors can't leak it
+        nonce = await client.transactions.nonces.next()
+        tx_params['nonce'] = nonce
         try:
             tx_params['gas'] = int(await client.w3.eth.estimate_gas(tx_params) * increase_gas)
         except Exception as err:
+            client.transactions.nonces.release(nonce)
             logger.error(
                 f'{client.account.address} | Transaction failed | {err}')
             return None
 
-        sign = client.w3.eth.account.sign_transaction(tx_params, private_key)
-        return await client.w3.eth.send_raw_transaction(sign.rawTransaction)
+        try:
+            sign = client.w3.eth.account.sign_transaction(tx_params, private_key)
+            tx_hash = await client.w3.eth.send_raw_transaction(sign.rawTransaction)
+
+        except BaseException as e:
+            if any(error in str(e).lower() for error in ('nonce too low', 'replacement transaction underpriced')):
+                # The nonce is taken by a mined or an in-flight transaction, so it mustn't be handed out again
+                client.transactions.nonces.reset()
+
+            else:
+                client.transactions.nonces.release(nonce)
+
+            raise
+
+        client.transactions.nonces.sent(nonce)
+        return tx_hash
 
     def get_session(self):
         if self.client.proxy:
@@ -659,22 +679,12 @@ class Base:
         return tokens, lending, lp,
 
     async def wait_tx_status(self, tx_hash: HexBytes, max_wait_time=100) -> bool:
-        start_time = time.time()
-        while True:
-            try:
-                receipts = await self.client.w3.eth.get_transaction_receipt(tx_hash)
-                status = receipts.get("status")
-                if status == 1:
-                    return True
-                elif status is None:
-                    await asyncio.sleep(0.3)
-                else:
-                    return False
-            except TransactionNotFound:
-                if time.time() - start_time > max_wait_time:
-                    logger.exception(f'{self.client.account.address} получил неудачную транзакцию')
-                    return False
-                await asyncio.sleep(3)
+        try:
+            receipt = await self.client.transactions.wait_for_receipt(tx_hash=tx_hash, timeout=max_wait_time)
+        except TimeExhausted:
+            logger.exception(f'{self.client.account.address} получил неудачную транзакцию')
+            return False
+        return receipt.get('status') == 1
 
     async def get_chain_to_transfer_with_balance(self):
         settings = Settings()
@@ -683,7 +693,7 @@ class Base:
         min_balances = settings.chains_min_balances
 
         for chain in chains:
-            client = Client(private_key=self.client.account.key, network=chain, proxy=self.client.proxy)
+            client = Client.factory.for_account(account=self.client.account, network=chain, proxy=self.client.proxy)
             balance = await client.wallet.balance()
             if balance.Ether > min_balances[chain.name] and self.client.network.name != chain.name:
                 chains_with_suff_balance.append(chain)
@@ -6,6 +6,7 @@ from loguru import logger
 from libs.py_eth_async.data.models import TxArgs
 
 from tasks.base import Base
+from utils.miscellaneous.pipeline import Pipeline, Stages
 from data.models import Tokens, Routers, Network
 
 
@@ -27,34 +28,52 @@ class MerklyHMerk(Base):
         fee = await contract.functions.fee().call()
         return fee
 
-    async def mint(self):
-        failed_text = f'Failed mint hMERK via Merkly'
-        chain_name = self.client.network.name
-
-        logger.info(f'Starting to mint hMERK on {chain_name}')
-
-        contract = await self.client.contracts.get(self.CONTRACT_MAP[chain_name])
+    async def _get_mint_tx_params(self, amount: int):
+        contract = await self.client.contracts.get(self.CONTRACT_MAP[self.client.network.name])
         fee = await self._get_fee_mint(contract=contract)
         logger.info(f'Success get fee for mint')
 
-        amount = random.randint(1, 1)
         params = TxArgs(
             user=self.client.account.address,
             amount=amount,
         )
 
-        tx_params = {
+        return {
             'from': self.client.account.address,
             'to': contract.address,
             'data': contract.encodeABI('mint', args=params.tuple()),
             'value': fee
         }
 
-        receipt, tx_hash = await self.submit_transaction(tx_params)
-        if receipt:
-            check_tx = await self.wait_tx_status(tx_hash=tx_hash)
-            if check_tx:
-                return f'{amount} hMERK was minted via Merkly {tx_hash}'
+    async def prepare(self):
+        dest_chain = await self.get_chain_to_transfer_with_balance()
+        if isinstance(dest_chain, str):
+            return
+
+        self.prepared_dest_chain = dest_chain
+        token_balance = await self.client.wallet.balance((self.CONTRACT_MAP[self.client.network.name]).address)
+        if not token_balance.Ether:
+            tx_params = await self._get_mint_tx_params(amount=random.randint(1, 1))
+            self.prepared_tx = await self.client.transactions.prepare(tx_params=tx_params)
+
+    async def mint(self):
+        failed_text = f'Failed mint hMERK via Merkly'
+        chain_name = self.client.network.name
+
+        logger.info(f'Starting to mint hMERK on {chain_name}')
+
+        amount = random.randint(1, 1)
+        async with Pipeline.stage(Stages.Mint, proxy=self.client.proxy, network=self.client.network):
+            if self.prepared_tx:
+                tx = await self.send_prepared()
+
+            else:
+                tx_params = await self._get_mint_tx_params(amount=amount)
+                tx = await self.send(tx_params)
+
+        # The receipt is awaited outside the stage, so the slot is taken by the next wallet meanwhile
+        if await self.confirm(tx):
+            return f'{amount} hMERK was minted via Merkly {tx.hash.hex()}'
         return f'{failed_text}!'
 
     async def _get_fee_bridge(self, contract, domain: int):
@@ -64,36 +83,38 @@ class MerklyHMerk(Base):
     async def bridge(self, dest_chain: Network):
         failed_text = f'Failed bridge hMERK via Merkly'
         logger.info(f'Starting bridge hMERK from {self.client.network.name} to {dest_chain.name}')
-
-        token = self.CONTRACT_MAP[self.client.network.name]
-
-        contract = await self.client.contracts.get(token)
-        fee = await self._get_fee_bridge(contract=contract, domain=dest_chain.chain_id)
-        logger.info(f'Success get fee for bridge')
-
-        amount = await self.client.wallet.balance(token.address)
-
-        args = TxArgs(
-            _destination=dest_chain.chain_id,
-            _Id=amount.Wei,
-        )
-
-        tx_params = {
-            'from': self.client.account.address,
-            'to': token.address,
-            'data': contract.encodeABI('bridgeHFT', args=args.tuple()),
-            'value': fee
-        }
-
-        receipt, tx_hash = await self.submit_transaction(tx_params)
-        if receipt:
-            check_tx = await self.wait_tx_status(tx_hash=tx_hash)
-            if check_tx:
-                return f'hFT was bridged via Merkly {tx_hash}'
+        async with Pipeline.stage(Stages.Bridge, proxy=self.client.proxy, network=self.client.network):
+            token = self.CONTRACT_MAP[self.client.network.name]
+
+            contract = await self.client.contracts.get(token)
+            async with self.client.batch():
+                fee, amount = await asyncio.gather(
+                    self._get_fee_bridge(contract=contract, domain=dest_chain.chain_id),
+                    self.client.wallet.balance(token.address)
+                )
+            logger.info(f'Success get fee for bridge')
+
+            args = TxArgs(
+                _destination=dest_chain.chain_id,
+                _Id=amount.Wei,
+            )
+
+            tx_params = {
+                'from': self.client.account.address,
+                'to': token.address,
+                'data': contract.encodeABI('bridgeHFT', args=args.tuple()),
+                'value': fee
+            }
+
+            tx = await self.send(tx_params)
+
+        if await self.confirm(tx):
+            return f'hFT was bridged via Merkly {tx.hash.hex()}'
         return f'{failed_text}!'
 
     async def mint_and_bridge_token(self):
-        dest_chain = await self.get_chain_to_transfer_with_balance()
+        dest_chain = self.prepared_dest_chain or await self.get_chain_to_transfer_with_balance()
+        self.prepared_dest_chain = None
 
         if isinstance(dest_chain, str):
             return 'No chains with balance'
@@ -101,9 +122,15 @@ class MerklyHMerk(Base):
 
         failed_text = f'Failed mint and bridge from {self.client.network.name} to {dest_chain.name}'
         try:
-            token_balance = await self.client.wallet.balance((self.CONTRACT_MAP[self.client.network.name]).address)
+            if self.prepared_tx:
+                token_balance = None
+
+            else:
+                token_balance = await self.client.wallet.balance(
+                    (self.CONTRACT_MAP[self.client.network.name]).address
+                )
 
-            if not token_balance.Ether:
+            if not token_balance or not token_balance.Ether:
                 res = await self.mint()
                 if 'Failed' in res:
                     return 'Failed mint, check mint function'
@@ -7,6 +7,7 @@ from libs.py_eth_async.data.models import TxArgs
 from loguru import logger
 
 from tasks.base import Base
+from utils.miscellaneous.pipeline import Pipeline, Stages
 from data.models import Tokens, Routers, Network
 
 
@@ -28,77 +29,90 @@ class MerklyHNFT(Base):
         fee = await contract.functions.fee().call()
         return fee
 
-    async def mint(self):
-        failed_text = f'Failed mint hNFT via Merkly'
-        chain_name = self.client.network.name
-
-        logger.info(f'Starting to mint hNFT on {chain_name}')
-
-        contract = await self.client.contracts.get(self.CONTRACT_MAP[chain_name])
+    async def _get_mint_tx_params(self, amount: int):
+        contract = await self.client.contracts.get(self.CONTRACT_MAP[self.client.network.name])
         fee = await self._get_fee_mint(contract=contract)
         logger.info(f'Success get fee for mint hNFT')
 
-        amount = 1
         params = TxArgs(
             amount=amount,
         )
 
-        tx_params = {
+        return {
             'from': self.client.account.address,
             'to': contract.address,
             'data': contract.encodeABI('mint', args=params.tuple()),
             'value': fee
         }
 
-        receipt, tx_hash = await self.submit_transaction(tx_params)
-        if receipt:
-            check_tx = await self.wait_tx_status(tx_hash=tx_hash)
-            if check_tx:
-                return f'{amount} hNFT was minted via Merkly {tx_hash}'
-        return f'{failed_text}!'
-
-    async def _get_fee_bridge(self, contract, domain: int):
-        fee = await contract.functions.quoteBridge(_destination=domain).call()
-        return fee
+    async def prepare(self):
+        dest_chain = await self.get_chain_to_transfer_with_balance()
+        if isinstance(dest_chain, str):
+            return
 
-    async def bridge(self, dest_chain: Network):
-        failed_text = f'Failed bridge hNFT via Merkly'
-        logger.info(f'Starting bridge hNFT from {self.client.network.name} to {dest_chain.name}')
+        self.prepared_dest_chain = dest_chain
+        self.prepared_tx = await self.client.transactions.prepare(tx_params=await self._get_mint_tx_params(amount=1))
 
-        nft = self.CONTRACT_MAP[self.client.network.name]
-        contract = await self.client.contracts.get(nft)
+    async def mint(self):
+        failed_text = f'Failed mint hNFT via Merkly'
+        chain_name = self.client.network.name
 
-        fee = await self._get_fee_bridge(contract=contract, domain=dest_chain.chain_id)
-        logger.info(f'Success get fee for bridge')
+        logger.info(f'Starting to mint hNFT on {chain_name}')
 
-        balance_nft = await contract.functions.balanceOf(self.client.account.address).call()
-        if not balance_nft:
-            return f'{failed_text} | No NFT after mint via Merkly'
+        amount = 1
+        async with Pipeline.stage(Stages.Mint, proxy=self.client.proxy, network=self.client.network):
+            if self.prepared_tx:
+                tx = await self.send_prepared()
 
-        id_last_nft = await contract.functions.tokenOfOwnerByIndex(owner=self.client.account.address,
-                                                                   index=balance_nft - 1).call()
-        args = TxArgs(
-            _destination=dest_chain.chain_id,
-            _Id=id_last_nft,
-        )
+            else:
+                tx_params = await self._get_mint_tx_params(amount=amount)
+                tx = await self.send(tx_params)
 
-        tx_params = {
-            'from': self.client.account.address,
-            'to': nft.address,
-            'data': contract.encodeABI('bridgeNFT', args=args.tuple()),
-            'value': fee
-        }
+        # The receipt is awaited outside the stage, so the slot is taken by the next wallet meanwhile
+        if await self.confirm(tx):
+            return f'{amount} hNFT was minted via Merkly {tx.hash.hex()}'
+        return f'{failed_text}!'
 
-        receipt, tx_hash = await self.submit_transaction(tx_params)
-        if receipt:
-            check_tx = await self.wait_tx_status(tx_hash=tx_hash)
-            if check_tx:
-                return f'hNFT was bridged via Merkly {tx_hash}'
+    async def bridge(self, dest_chain: Network):
+        failed_text = f'Failed bridge hNFT via Merkly'
+        logger.info(f'Starting bridge hNFT from {self.client.network.name} to {dest_chain.name}')
+        async with Pipeline.stage(Stages.Bridge, proxy=self.client.proxy, network=self.client.network):
+            nft = self.CONTRACT_MAP[self.client.network.name]
+            contract = await self.client.contracts.get(nft)
+
+            fee, balance_nft = await self.client.multicall.aggregate([
+                contract.functions.quoteBridge(_destination=dest_chain.chain_id),
+                contract.functions.balanceOf(self.client.account.address)
+            ])
+            logger.info(f'Success get fee for bridge')
+
+            if not balance_nft:
+                return f'{failed_text} | No NFT after mint via Merkly'
+
+            id_last_nft = await contract.functions.tokenOfOwnerByIndex(owner=self.client.account.address,
+                                                                       index=balance_nft - 1).call()
+            args = TxArgs(
+                _destination=dest_chain.chain_id,
+                _Id=id_last_nft,
+            )
+
+            tx_params = {
+                'from': self.client.account.address,
+                'to': nft.address,
+                'data': contract.encodeABI('bridgeNFT', args=args.tuple()),
+                'value': fee
+            }
+
+            tx = await self.send(tx_params)
+
+        if await self.confirm(tx):
+            return f'hNFT was bridged via Merkly {tx.hash.hex()}'
         return f'{failed_text}!'
 
 
     async def mint_and_bridge_nft(self):
-        dest_chain = await self.get_chain_to_transfer_with_balance()
+        dest_chain = self.prepared_dest_chain or await self.get_chain_to_transfer_with_balance()
+        self.prepared_dest_chain = None
 
         if isinstance(dest_chain, str):
             return 'No chains with balance'
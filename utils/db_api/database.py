@@ -2,8 +2,10 @@ from typing import List, Optional
 
 from libs.pretty_utils.databases import sqlalchemy_, sqlite
 
+from libs.py_eth_async.token_metadata import TokenMetadata
+
 from data.config import WALLETS_DB
-from utils.db_api.models import Wallet, Base
+from utils.db_api.models import Wallet, TokenInfo, Base
 
 
 # --- Functions
@@ -21,6 +23,23 @@ def get_wallets(sqlite_query: bool = False) -> List[Wallet]:
     return db.all(Wallet)
 
 
+def get_tokens() -> List[TokenMetadata]:
+    return [
+        TokenMetadata(
+            chain_id=token.chain_id, address=token.address, decimals=token.decimals, symbol=token.symbol,
+            name=token.name
+        ) for token in db.all(TokenInfo)
+    ]
+
+
+def save_token(metadata: TokenMetadata) -> None:
+    if not db.one(TokenInfo, (TokenInfo.chain_id == metadata.chain_id) & (TokenInfo.address == metadata.address)):
+        db.insert(TokenInfo(
+            chain_id=metadata.chain_id, address=metadata.address, decimals=metadata.decimals, symbol=metadata.symbol,
+            name=metadata.name
+        ))
+
+
 # --- Miscellaneous
 db = sqlalchemy_.DB('sqlite:///files/wallets.db', pool_recycle=3600, connect_args={'check_same_thread': False})
 
@@ -31,3 +31,21 @@ class Wallet(Base, AutoRepr):
         self.h_mekr = h_mekr
         self.h_nft = h_nft
         self.status = WorkStatuses.Initial
+
+
+class TokenInfo(Base, AutoRepr):
+    __tablename__ = 'tokens'
+    id = Column(Integer, primary_key=True)
+    chain_id = Column(Integer)
+    address = Column(Text)
+    decimals = Column(Integer)
+    symbol = Column(Text)
+    name = Column(Text)
+
+    def __init__(self, chain_id: int, address: str, decimals: int, symbol: Optional[str] = None,
+                 name: Optional[str] = None) -> None:
+        self.chain_id = chain_id
+        self.address = address
+        self.decimals = decimals
+        self.symbol = symbol
+        self.name = name
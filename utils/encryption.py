@@ -10,6 +10,7 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from data.models import Settings
 from data.config import CIPHER_SUITE
 from utils.db_api.models import Wallet
+from libs.py_eth_async.client import Client
 
 
 def get_private_key(wallet: str) -> str | int:
@@ -40,3 +41,6 @@ def get_cipher_suite(password, salt) -> Fernet:
     except TypeError:
         print('Error! Check salt file! Salt must be bites string')
         sys.exit(1)
+
+
+Client.factory.key_loader = get_private_key
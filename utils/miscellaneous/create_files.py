@@ -22,6 +22,15 @@ def create_files():
     settings = {
         'use_private_key_encryption': False,
         'maximum_gas_price': 75,
+        'maximum_gas_prices': {
+            'polygon': 300,
+            'celo': 50,
+            'base': 1,
+            'optimism': 1,
+            'avalanche': 50,
+            'bsc': 5,
+            'moonbeam': 300
+        },
         'oklink_api_key': '',
         'okx': {
             'required_minimum_balance': 0.0001,
@@ -90,6 +99,41 @@ def create_files():
             'moonbeam': [2.5, 4]
 
         },
+        'rpc_connections': {
+            'limit': 100,
+            'limit_per_host': 20,
+            'keepalive_timeout': 60
+        },
+        'broadcast_transactions': False,
+        'fee_bumping': {
+            'enabled': True,
+            'interval': 30,
+            'multiplier': 1.15,
+            'max_bumps': 5,
+            'max_fee_multiplier': 3
+        },
+        'rate_limits': {
+            'default_rate': 10,
+            'default_capacity': 20,
+            'hosts': {
+                'rpc.ankr.com': {'rate': 25, 'capacity': 50},
+                'www.oklink.com': {'rate': 3, 'capacity': 5},
+                'www.okx.com': {'rate': 5, 'capacity': 10},
+            }
+        },
+        'workers': 100,
+        'stage_limits': {
+            'mint': 50,
+            'bridge': 50,
+        },
+        'concurrency_limits': {
+            'total': 100,
+            'per_proxy': 5,
+            'per_chain': 30,
+            'chains': {},
+            'per_rpc_host': 40,
+            'rpc_hosts': {},
+        },
     }
     write_json(path=config.SETTINGS_FILE, obj=update_dict(modifiable=current_settings, template=settings), indent=2)
 
@@ -0,0 +1,205 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Tuple, List, Deque, AsyncIterator, Iterable
+from urllib.parse import urlparse
+
+from libs.py_eth_async.data.models import Network
+
+
+class Limiter:
+    """
+    A fair semaphore, free slots are given to waiters in the order they came and a new comer can't take a slot while
+        someone is waiting.
+
+    Attributes:
+        limit (int): the maximum number of holders.
+        active (int): the number of holders now.
+
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            limit (int): the maximum number of holders.
+
+        """
+        self.limit = limit
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot and take it.
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over right before the cancellation
+                self.release()
+
+            elif future in self._waiters:
+                self._waiters.remove(future)
+
+            raise
+
+    def release(self) -> None:
+        """
+        Free a slot, it's handed over to the first waiter if there is one.
+        """
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self.active -= 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *args) -> None:
+        self.release()
+
+
+class Limits:
+    """
+    Process-wide concurrency limits of wallets: per chain, per RPC host, per proxy and global. Limits are always
+        acquired in this order, from the narrowest to the broadest one, so they can't deadlock and a wallet waiting for
+        a busy chain doesn't hold a global slot that wallets of other chains could use. Contexts mustn't be nested,
+        waiters of each limit are served in the order they came.
+
+    Attributes:
+        total (int): the maximum number of wallets working at once, 0 is unlimited.
+        per_proxy (int): the maximum number of wallets working through one proxy, 0 is unlimited.
+        per_chain (int): the maximum number of wallets working in a chain without its own limit, 0 is unlimited.
+        chains (Dict[str, int]): limits of chains by network name.
+        per_rpc_host (int): the maximum number of wallets working with an RPC host without its own limit, 0 is
+            unlimited. The host of the primary RPC of a network is counted.
+        rpc_hosts (Dict[str, int]): limits of RPC hosts by host name.
+
+    """
+    total: int = 100
+    per_proxy: int = 0
+    per_chain: int = 0
+    chains: Dict[str, int] = {}
+    per_rpc_host: int = 0
+    rpc_hosts: Dict[str, int] = {}
+    _limiters: Dict[Tuple[str, Optional[str]], Limiter] = {}
+
+    @classmethod
+    def configure(
+            cls, total: Optional[int] = None, per_proxy: Optional[int] = None, per_chain: Optional[int] = None,
+            chains: Optional[Dict[str, int]] = None, per_rpc_host: Optional[int] = None,
+            rpc_hosts: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Change limits, limiters are recreated.
+
+        Args:
+            total (Optional[int]): the maximum number of wallets working at once. (not changed)
+            per_proxy (Optional[int]): the maximum number of wallets working through one proxy. (not changed)
+            per_chain (Optional[int]): the limit of a chain without its own limit. (not changed)
+            chains (Optional[Dict[str, int]]): limits of chains by network name. (not changed)
+            per_rpc_host (Optional[int]): the limit of an RPC host without its own limit. (not changed)
+            rpc_hosts (Optional[Dict[str, int]]): limits of RPC hosts by host name. (not changed)
+
+        """
+        if total is not None:
+            cls.total = total
+
+        if per_proxy is not None:
+            cls.per_proxy = per_proxy
+
+        if per_chain is not None:
+            cls.per_chain = per_chain
+
+        if chains is not None:
+            cls.chains = chains
+
+        if per_rpc_host is not None:
+            cls.per_rpc_host = per_rpc_host
+
+        if rpc_hosts is not None:
+            cls.rpc_hosts = rpc_hosts
+
+        cls._limiters = {}
+
+    @classmethod
+    def _get(cls, kind: str, key: Optional[str], limit: int) -> Optional[Limiter]:
+        if not limit:
+            return None
+
+        if (kind, key) not in cls._limiters:
+            cls._limiters[(kind, key)] = Limiter(limit=limit)
+
+        return cls._limiters[(kind, key)]
+
+    @classmethod
+    def limiters(
+            cls, proxy: Optional[str] = None, network: Optional[Network] = None, extra: Iterable[Limiter] = ()
+    ) -> List[Limiter]:
+        """
+        Get limiters that apply to a wallet in the acquisition order.
+
+        Args:
+            proxy (Optional[str]): the proxy of the wallet. (not limited)
+            network (Optional[Network]): the network of the wallet. (not limited)
+            extra (Iterable[Limiter]): other limiters taken right before the global one, e.g. of a stage. (none)
+
+        Returns:
+            List[Limiter]: the limiters.
+
+        """
+        limiters = []
+        if network:
+            limiters.append(cls._get(kind='chain', key=network.name, limit=cls.chains.get(network.name, cls.per_chain)))
+            host = urlparse(network.rpc).hostname
+            limiters.append(cls._get(kind='rpc_host', key=host, limit=cls.rpc_hosts.get(host, cls.per_rpc_host)))
+
+        if proxy:
+            limiters.append(cls._get(kind='proxy', key=proxy, limit=cls.per_proxy))
+
+        limiters.extend(extra)
+        limiters.append(cls._get(kind='total', key=None, limit=cls.total))
+        return [limiter for limiter in limiters if limiter]
+
+    @classmethod
+    @asynccontextmanager
+    async def acquire(
+            cls, proxy: Optional[str] = None, network: Optional[Network] = None, extra: Iterable[Limiter] = ()
+    ) -> AsyncIterator[None]:
+        """
+        Take a slot of every limit that applies to a wallet for the duration of the context.
+
+        Args:
+            proxy (Optional[str]): the proxy of the wallet. (not limited)
+            network (Optional[Network]): the network of the wallet. (not limited)
+            extra (Iterable[Limiter]): other limiters taken right before the global one, e.g. of a stage. (none)
+
+        """
+        acquired = []
+        try:
+            for limiter in cls.limiters(proxy=proxy, network=network, extra=extra):
+                await limiter.acquire()
+                acquired.append(limiter)
+
+            yield
+
+        finally:
+            for limiter in reversed(acquired):
+                limiter.release()
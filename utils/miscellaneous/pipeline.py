@@ -0,0 +1,67 @@
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, AsyncIterator
+
+from libs.py_eth_async.data.models import Network
+
+from utils.miscellaneous.limiters import Limiter, Limits
+
+
+class Stages:
+    Mint = 'mint'
+    Bridge = 'bridge'
+
+
+class Pipeline:
+    """
+    Process-wide concurrency limits of action stages. A wallet takes a slot of a stage only while it does the stage
+        work, e.g. requests a fee and sends a transaction, and otherwise waits for its turn in the queue of the stage.
+        Waiting for a receipt and a cooldown between stages take no slot. The stage slot is taken together with the
+        chain, RPC host, proxy and global ones of 'Limits', so the global limit covers the stage work too.
+
+    Attributes:
+        limits (Dict[str, int]): the maximum number of wallets in each stage, stages that aren't listed are unlimited.
+        active (Dict[str, int]): the number of wallets doing each stage now.
+
+    """
+    limits: Dict[str, int] = {}
+    active: Dict[str, int] = {}
+    _limiters: Dict[str, Limiter] = {}
+
+    @classmethod
+    def configure(cls, limits: Optional[Dict[str, int]] = None) -> None:
+        """
+        Change the stage limits.
+
+        Args:
+            limits (Optional[Dict[str, int]]): the maximum number of wallets in each stage. (not changed)
+
+        """
+        if limits is not None:
+            cls.limits = {name: max(int(limit), 1) for name, limit in limits.items()}
+            cls._limiters = {}
+
+    @classmethod
+    @asynccontextmanager
+    async def stage(
+            cls, name: str, proxy: Optional[str] = None, network: Optional[Network] = None
+    ) -> AsyncIterator[None]:
+        """
+        Take a slot of a stage for the duration of the context.
+
+        Args:
+            name (str): the stage name.
+            proxy (Optional[str]): the proxy of the wallet. (not limited)
+            network (Optional[Network]): the network of the wallet. (not limited)
+
+        """
+        limiter = cls._limiters.get(name)
+        if not limiter and name in cls.limits:
+            limiter = cls._limiters[name] = Limiter(limit=cls.limits[name])
+
+        async with Limits.acquire(proxy=proxy, network=network, extra=[limiter] if limiter else []):
+            cls.active[name] = cls.active.get(name, 0) + 1
+            try:
+                yield
+
+            finally:
+                cls.active[name] -= 1
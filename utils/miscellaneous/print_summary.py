@@ -63,12 +63,16 @@ async def print_summary():
                 wallet.next_activity_action_time for wallet in activity_wallets
             )))
         rpcs = settings.rpcs
+        maximum_gas_prices = ', '.join(
+            f'{chain}: {gas_price.GWei}' for chain, gas_price in settings.maximum_gas_prices.items()
+        )
 
         print(f'''
 {config.LIGHTGREEN_EX}---------- Summary statistics ---------- {config.RESET_ALL}
 The RPCs:
 {config.LIGHTGREEN_EX}{print_rpcs(rpcs)}
 The maximum gas price: {config.LIGHTGREEN_EX}{settings.maximum_gas_price.GWei}{config.RESET_ALL}
+The maximum gas prices by chain: {config.LIGHTGREEN_EX}{maximum_gas_prices}{config.RESET_ALL}
 
 Wallets performing the pre-initial actions: {config.LIGHTGREEN_EX}{pre_initial_wallets_number}{config.RESET_ALL}
 Nearest: {config.LIGHTGREEN_EX}{nearest_pre_initial_wallet}{config.RESET_ALL}
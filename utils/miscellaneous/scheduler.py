@@ -0,0 +1,203 @@
+import time
+import heapq
+import asyncio
+from typing import List, Dict, Tuple, Optional
+
+from data.models import WorkStatuses
+from utils.db_api.database import db
+from utils.db_api.models import Wallet
+
+
+class Scheduler:
+    """
+    An in-memory queue of wallets ordered by the next action time. Wallets are loaded from the database once, the
+        next due wallet is found in O(1), a wallet is rescheduled in O(log n) and changed times are committed in
+        batches by 'sync', which the caller runs once per iteration of its loop.
+
+    Attributes:
+        wallets (Dict[int, Wallet]): scheduled wallets by ID.
+
+    """
+
+    def __init__(self) -> None:
+        self.wallets: Dict[int, Wallet] = {}
+        self._heap: List[Tuple[int, int, int]] = []
+        self._entries: Dict[int, int] = {}
+        self._counter = 0
+        self._dirty = False
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @classmethod
+    def load(cls) -> 'Scheduler':
+        """
+        Create a scheduler with all wallets in the 'Initial' status.
+
+        Returns:
+            Scheduler: the scheduler.
+
+        """
+        scheduler = cls()
+        for wallet in db.all(Wallet, Wallet.status.is_(WorkStatuses.Initial)):
+            scheduler.schedule(wallet=wallet, due_time=wallet.next_initial_action_time)
+
+        scheduler._dirty = False
+        return scheduler
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def schedule(self, wallet: Wallet, due_time: int) -> None:
+        """
+        Add a wallet or change its next action time.
+
+        Args:
+            wallet (Wallet): the wallet.
+            due_time (int): the next action time.
+
+        """
+        next_due_time = self.next_due_time()
+        if wallet.next_initial_action_time != due_time:
+            wallet.next_initial_action_time = due_time
+            self._dirty = True
+
+        self.wallets[wallet.id] = wallet
+        self._counter += 1
+        self._entries[wallet.id] = self._counter
+        # Outdated entries stay in the heap and are skipped when they come up
+        heapq.heappush(self._heap, (due_time, self._counter, wallet.id))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [item for item in self._heap if self._entries.get(item[2]) == item[1]]
+            heapq.heapify(self._heap)
+        if self._wakeup and (next_due_time is None or due_time < next_due_time):
+            self._wakeup.set()
+
+    def remove(self, wallet: Wallet) -> None:
+        """
+        Stop scheduling a wallet.
+
+        Args:
+            wallet (Wallet): the wallet.
+
+        """
+        self.wallets.pop(wallet.id, None)
+        self._entries.pop(wallet.id, None)
+
+    def reschedule(self, wallet: Wallet) -> None:
+        """
+        Schedule a wallet after its action according to the time and status set by the action.
+
+        Args:
+            wallet (Wallet): the wallet.
+
+        """
+        if wallet.status == WorkStatuses.Initial:
+            self.schedule(wallet=wallet, due_time=wallet.next_initial_action_time)
+
+        else:
+            self.remove(wallet)
+
+        self._dirty = True
+
+    def next_due_time(self) -> Optional[int]:
+        """
+        Get the closest action time.
+
+        Returns:
+            Optional[int]: the time, None if there are no wallets.
+
+        """
+        while self._heap:
+            due_time, entry, wallet_id = self._heap[0]
+            if self._entries.get(wallet_id) == entry:
+                return due_time
+
+            heapq.heappop(self._heap)
+
+        return None
+
+    def pop_due(self, now: Optional[float] = None) -> List[Wallet]:
+        """
+        Take all wallets whose action time has come, they aren't scheduled until 'reschedule' is called.
+
+        Args:
+            now (Optional[float]): the current time. (now)
+
+        Returns:
+            List[Wallet]: the wallets.
+
+        """
+        now = time.time() if now is None else now
+        wallets = []
+        while True:
+            due_time = self.next_due_time()
+            if due_time is None or due_time > now:
+                return wallets
+
+            _, _, wallet_id = heapq.heappop(self._heap)
+            del self._entries[wallet_id]
+            wallets.append(self.wallets.pop(wallet_id))
+
+    def upcoming(self, until: float) -> List[Wallet]:
+        """
+        Get wallets whose action time comes before the specified time without taking them, it only visits matching
+            heap entries.
+
+        Args:
+            until (float): the time.
+
+        Returns:
+            List[Wallet]: the wallets.
+
+        """
+        wallets = []
+        indexes = [0] if self._heap else []
+        while indexes:
+            index = indexes.pop()
+            due_time, entry, wallet_id = self._heap[index]
+            if due_time > until:
+                continue
+
+            if self._entries.get(wallet_id) == entry:
+                wallets.append(self.wallets[wallet_id])
+
+            indexes.extend(child for child in (2 * index + 1, 2 * index + 2) if child < len(self._heap))
+
+        return wallets
+
+    async def wait_due(self, max_wait: Optional[float] = None) -> List[Wallet]:
+        """
+        Sleep until the closest action time or until an earlier wallet is scheduled and take due wallets.
+
+        Args:
+            max_wait (Optional[float]): the maximum sleep time. (until a wallet is due)
+
+        Returns:
+            List[Wallet]: due wallets, empty if 'max_wait' passed.
+
+        """
+        if not self._wakeup:
+            self._wakeup = asyncio.Event()
+
+        deadline = time.time() + max_wait if max_wait is not None else None
+        while True:
+            now = time.time()
+            wallets = self.pop_due(now=now)
+            if wallets or (deadline is not None and now >= deadline):
+                return wallets
+
+            due_time = self.next_due_time()
+            timeouts = [moment - now for moment in (due_time, deadline) if moment is not None]
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=min(timeouts) if timeouts else None)
+
+            except asyncio.TimeoutError:
+                pass
+
+    def sync(self) -> None:
+        """
+        Commit changed action times to the database.
+        """
+        if self._dirty:
+            db.commit()
+            self._dirty = False
@@ -21,8 +21,8 @@ async def okx_withdraw(wallets: list[Wallet]):
 
     for num, wallet in enumerate(wallets, start=1):
         logger.info(f'{num}/{len(wallets)} wallets')
-        eth_client = Client(private_key=get_private_key(wallet.private_key), network=Networks.Ethereum, proxy=wallet.proxy)
-        evm_client = Client(private_key=get_private_key(wallet.private_key), network=Scroll, proxy=wallet.proxy)
+        eth_client = Client.for_wallet(wallet=wallet, network=Networks.Ethereum)
+        evm_client = Client.for_wallet(wallet=wallet, network=Scroll)
 
         if settings.use_official_bridge:
             balance = await eth_client.wallet.balance()